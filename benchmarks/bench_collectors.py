@@ -0,0 +1,249 @@
+"""수집기 fetch + parse 경로 벤치마크 (네트워크 불필요)
+
+각 수집기의 iter_postings()를 실제와 같은 경로(_request → 파싱 → 공고 dict 생성)로 실행하되
+HTTP 응답은 메모리에 준비한 페이지로 대신한다. 페이지 종류:
+
+- recorded: HTTP_CASSETTE_MODE=record 로 녹화한 카세트 중 소스별 가장 큰 응답을
+  --rows 행 이상이 되도록 목록 행(또는 JSON 항목)을 복제해 키운 페이지
+- synthetic: 카세트가 없는 소스용 합성 페이지 (HTML 게시판 / API JSON)
+
+사용법:
+    python -m benchmarks.bench_collectors [--rows 3000] [--repeat 3] [--engine auto|all|lxml ...]
+        [--cassettes tests/cassettes] [--source tips ...]
+"""
+import argparse
+import copy
+import json
+import logging
+import math
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.bench_html_parsers import synthetic_board_page
+from src.config import Config
+from src.collectors.base import HTML_ENGINES, BaseCollector, resolve_html_engine
+from src.collectors.cassette import build_response, load_response
+from src.collectors.kstartup import KStartupCollector
+from src.collectors.bizinfo import BizinfoCollector
+from src.collectors.smes import SmesCollector
+from src.collectors.nipa import NipaCollector
+from src.collectors.tipa import TipaCollector
+from src.collectors.tips import TipsCollector
+from src.collectors.mss import MssCollector
+from src.collectors.thevc import TheVCCollector
+
+COLLECTORS = [
+    KStartupCollector, BizinfoCollector, SmesCollector, NipaCollector,
+    TipaCollector, TipsCollector, MssCollector, TheVCCollector,
+]
+
+# 합성 HTML 페이지의 상세 링크 형식 (각 수집기의 링크 추출 조건에 맞춤)
+SYNTHETIC_HREFS = {
+    "bizinfo": "/web/lay1/bbs/S1T122C128/AS/74/view.do?pblancId=PBLN_{i}",
+    "mss": "/site/smba/ex/bbs/View.do?cbIdx=310&bcIdx={i}",
+    "nipa": "/home/2-2/{i}",
+    "tipa": "/s0201/view?id={i}",
+    "tips": "/bbs/board.php?bo_table=notice&wr_id={i}",
+    "thevc": "/grants/{i}",
+}
+
+# JSON 항목 복제 시 고유해지도록 값 뒤에 번호를 붙일 키 (ID/제목)
+JSON_UNIQUE_KEYS = ("pbanc_sn", "biz_pbanc_nm", "anncId", "anncNm")
+
+
+def synthetic_kstartup(rows: int) -> bytes:
+    items = [
+        {
+            "pbanc_sn": 170000 + i,
+            "biz_pbanc_nm": f"2026년 예비창업패키지 추가모집 공고 {i}",
+            "pbanc_ntrp_nm": "창업진흥원",
+            "supt_biz_clsfc": "사업화",
+            "pbanc_rcpt_bgng_dt": "20260201",
+            "pbanc_rcpt_end_dt": f"202603{i % 28 + 1:02d}",
+            "aply_trgt": "예비창업자",
+            "detl_pg_url": f"https://www.k-startup.go.kr/web/contents/bizpbanc-ongoing.do?pbancSn={i}",
+            "pbanc_ctnt": "창업 아이템 사업화 자금 및 멘토링 지원 " * 5,
+            "supt_regin": "전국",
+            "rcrt_prgs_yn": "Y",
+        }
+        for i in range(rows)
+    ]
+    return json.dumps({"totalCount": rows, "data": items}, ensure_ascii=False).encode()
+
+
+def synthetic_smes(rows: int) -> bytes:
+    items = [
+        {
+            "anncId": f"SMES{i:06d}",
+            "anncNm": f"2026년 중소기업 수출바우처 참여기업 모집 {i}",
+            "cntcInsttNm": "중소벤처기업진흥공단",
+            "anncClssNm": "수출",
+            "rcptBgngDt": "2026-02-01",
+            "rcptEndDt": f"2026-03-{i % 28 + 1:02d}",
+            "trgtNm": "중소기업",
+            "anncUrl": f"https://www.smes.go.kr/main/sportBiz/view?anncId={i}",
+            "anncSumry": "해외 진출을 위한 바우처 지원 " * 5,
+        }
+        for i in range(rows)
+    ]
+    body = {"response": {"body": {"totalCount": rows, "items": {"item": items}}}}
+    return json.dumps(body, ensure_ascii=False).encode()
+
+
+def synthetic_page(source: str, rows: int) -> Tuple[bytes, str]:
+    """(본문, Content-Type) 반환"""
+    if source == "kstartup":
+        return synthetic_kstartup(rows), "application/json"
+    if source == "smes24":
+        return synthetic_smes(rows), "application/json"
+    html = synthetic_board_page(rows, href=SYNTHETIC_HREFS[source])
+    return html.encode("utf-8"), "text/html; charset=utf-8"
+
+
+def _largest_item_list(data) -> Optional[list]:
+    """JSON 응답에서 가장 긴 dict 리스트 (공고 항목 목록)"""
+    best = None
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            if node and all(isinstance(x, dict) for x in node) and len(node) > len(best or []):
+                best = node
+            stack.extend(node)
+    return best
+
+
+def enlarge_json(body: bytes, rows: int) -> bytes:
+    data = json.loads(body)
+    items = _largest_item_list(data)
+    if not items:
+        return body
+    original = list(items)
+    copy_no = 1
+    while len(items) < rows:
+        for item in original:
+            clone = copy.deepcopy(item)
+            for key in JSON_UNIQUE_KEYS:
+                if clone.get(key):
+                    clone[key] = f"{clone[key]}-{copy_no}"
+            items.append(clone)
+        copy_no += 1
+    return json.dumps(data, ensure_ascii=False).encode()
+
+
+def _tag_anchor_text(fragment: str, copy_no: int) -> str:
+    """복제본의 링크 텍스트에 번호를 붙여 공고 ID가 겹치지 않게 함"""
+    return re.sub(r"(<a\b[^>]*>)(.*?)(</a>)", rf"\1\2 #{copy_no}\3", fragment, flags=re.S | re.I)
+
+
+def enlarge_html(html: str, rows: int) -> str:
+    """목록 테이블 행을 복제해 rows 행 이상으로 키움 (테이블이 없으면 body 전체를 복제)"""
+    tbody = re.search(r"(<tbody\b[^>]*>)(.*?)(</tbody>)", html, flags=re.S | re.I)
+    if tbody:
+        original_rows = re.findall(r"<tr\b.*?</tr>", tbody.group(2), flags=re.S | re.I)
+        if original_rows:
+            copies = math.ceil(rows / len(original_rows))
+            grown = tbody.group(2) + "".join(
+                _tag_anchor_text("".join(original_rows), n) for n in range(1, copies)
+            )
+            return html[:tbody.start(2)] + grown + html[tbody.end(2):]
+
+    body = re.search(r"(<body\b[^>]*>)(.*)(</body>)", html, flags=re.S | re.I)
+    if not body:
+        return html
+    anchors = max(1, len(re.findall(r"<a\b", body.group(2), flags=re.I)))
+    copies = math.ceil(rows / anchors)
+    grown = body.group(2) + "".join(_tag_anchor_text(body.group(2), n) for n in range(1, copies))
+    return html[:body.start(2)] + grown + html[body.end(2):]
+
+
+def recorded_page(source: str, cassette_dir: Path, rows: int) -> Optional[Tuple[bytes, str]]:
+    """소스의 녹화 응답 중 가장 큰 것을 rows 행 이상으로 키워 반환 (없으면 None)"""
+    files = sorted((cassette_dir / source).glob("*.json"), key=lambda p: p.stat().st_size)
+    if not files:
+        return None
+    response = load_response(files[-1])
+    content_type = response.headers.get("Content-Type", "")
+    if "json" in content_type or response.content.lstrip()[:1] in (b"{", b"["):
+        return enlarge_json(response.content, rows), content_type or "application/json"
+    if response.encoding is None or response.encoding.lower() == "iso-8859-1":
+        response.encoding = response.apparent_encoding
+    html = enlarge_html(response.text, rows)
+    return html.encode("utf-8"), "text/html; charset=utf-8"
+
+
+class _StaticSession:
+    """모든 요청에 같은 본문을 돌려주는 세션 (네트워크 없이 수집 경로만 측정)"""
+
+    def __init__(self, body: bytes, content_type: str):
+        self.body = body
+        self.content_type = content_type
+        self.requests = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests += 1
+        return build_response(self.body, headers={"Content-Type": self.content_type}, url=url)
+
+
+def bench_collector(collector_cls, body: bytes, content_type: str, repeat: int) -> Tuple[float, int]:
+    """(최소 소요 초, 공고 수) - 1페이지 수집 (known_ids_lookup 미연결)"""
+    best = float("inf")
+    postings = 0
+    for _ in range(repeat):
+        collector: BaseCollector = collector_cls()
+        collector.session = _StaticSession(body, content_type)
+        started = time.perf_counter()
+        postings = sum(1 for _ in collector.iter_postings())
+        best = min(best, time.perf_counter() - started)
+    return best, postings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=3000, help="페이지당 목표 행 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--engine", nargs="*", default=["auto"],
+                        help="HTML 파서 엔진 (all이면 설치된 엔진 전부)")
+    parser.add_argument("--cassettes", default=Config.HTTP_CASSETTE_DIR, help="카세트 디렉토리")
+    parser.add_argument("--source", nargs="*", help="측정할 SOURCE_NAME (기본: 전체)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    # 녹화된/합성 응답을 재생하는 실행이므로 replay 모드로 수집기를 만든다
+    # (조건부 HTTP 캐시와 속도 제한 없이 같은 페이지를 반복 파싱)
+    Config.HTTP_CASSETTE_MODE = "replay"
+    engines = list(HTML_ENGINES) if "all" in args.engine else args.engine
+    engines = [e for e in engines if resolve_html_engine(e) == e or e == "auto"]
+
+    pages: Dict[str, Tuple[str, bytes, str]] = {}
+    for collector_cls in COLLECTORS:
+        source = collector_cls.SOURCE_NAME
+        if args.source and source not in args.source:
+            continue
+        recorded = recorded_page(source, Path(args.cassettes), args.rows)
+        if recorded:
+            pages[source] = ("recorded", *recorded)
+        else:
+            pages[source] = ("synthetic", *synthetic_page(source, args.rows))
+
+    by_source = {c.SOURCE_NAME: c for c in COLLECTORS}
+    for engine in engines:
+        Config.HTML_PARSER = engine
+        print(f"\nengine: {resolve_html_engine(engine)}")
+        print(f"{'source':<10}{'page':<11}{'KiB':>8}{'postings':>10}{'best ms':>10}{'posts/s':>10}")
+        for source, (kind, body, content_type) in pages.items():
+            seconds, postings = bench_collector(by_source[source], body, content_type, args.repeat)
+            rate = postings / seconds if seconds else 0
+            print(f"{source:<10}{kind:<11}{len(body) / 1024:>8.0f}{postings:>10}"
+                  f"{seconds * 1000:>10.1f}{rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""필터 키워드 매칭 벤치마크
+
+공고 N건의 본문에서 키워드를 찾는 시간을 방식별로 비교한다.
+
+- scan: 예전 방식 ([kw for kw in keywords if kw.lower() in text], 키워드 수만큼 부분 문자열 검색)
+- matcher: KeywordMatcher 자동 선택 (pyahocorasick 설치 시 C 구현, 없으면 키워드 수에 따라 scan/자동자)
+- automaton: 순수 파이썬 Aho-Corasick 자동자
+
+--extra-keywords로 키워드 수를 늘려 키워드 수에 따른 비용 변화를 본다.
+
+사용법:
+    python -m benchmarks.bench_filters [--rows 20000] [--extra-keywords 0 500 2000]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.filters import ALL_KEYWORDS
+from src.keyword_matcher import KeywordMatcher, ahocorasick
+
+_VOCAB = (
+    "2026년 초기창업패키지 예비창업자 모집 중소벤처기업부 해외진출 지원 글로벌 스타트업 "
+    "서울 소재 기업 대상 사업화 자금 수출바우처 일본 도쿄 법인 신청 접수 기간 제출 서류 "
+    "평가 선정 결과 발표 예정 운영 기관 담당자 문의 홈페이지 참조 관련 규정 준수 Startup"
+).split()
+
+
+def make_texts(count: int, seed: int = 1) -> List[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(_VOCAB) for _ in range(rng.randint(20, 200))) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--extra-keywords", type=int, nargs="*", default=[0, 500, 2000])
+    args = parser.parse_args()
+
+    texts = make_texts(args.rows)
+    print(f"pyahocorasick {'설치됨' if ahocorasick is not None else '미설치'}, 공고 {args.rows}건")
+    print(f"{'keywords':>9}  {'method':<16}{'seconds':>10}{'rows/s':>12}")
+    for extra in args.extra_keywords:
+        keywords = ALL_KEYWORDS + [f"지원분야{i}호" for i in range(extra)]
+
+        def scan(text: str) -> List[str]:
+            text = text.lower()
+            return [kw for kw in keywords if kw.lower() in text]
+
+        methods = {
+            "scan": scan,
+            "matcher": KeywordMatcher(keywords).matched,
+            "automaton": KeywordMatcher(keywords, engine="automaton").matched,
+        }
+        for name, fn in methods.items():
+            started = time.perf_counter()
+            for text in texts:
+                fn(text)
+            seconds = time.perf_counter() - started
+            print(f"{len(keywords):>9}  {name:<16}{seconds:>10.2f}{args.rows / seconds:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
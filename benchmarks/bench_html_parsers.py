@@ -0,0 +1,79 @@
+"""HTML 파서 엔진 벤치마크
+
+저장해 둔 목록 페이지(HTML 파일)를 엔진별로 파싱하고 "table tbody tr" 행을 추출하는 시간을 비교한다.
+파일을 지정하지 않으면 게시판 형태의 합성 페이지를 만들어 사용한다.
+
+사용법:
+    python -m benchmarks.bench_html_parsers [saved_page.html ...] [--rows 500] [--repeat 5]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.collectors.base import HTML_ENGINES, parse_html, resolve_html_engine
+
+
+def synthetic_board_page(rows: int, href: str = "/bbs/view.do?id={i}") -> str:
+    """정부 사이트 게시판과 비슷한 구조(큰 메뉴/푸터 + 목록 테이블)의 합성 페이지
+
+    href는 행 번호 {i}를 넣을 상세 링크 형식 (수집기별 링크 패턴에 맞출 때 사용).
+    """
+    nav = "".join(
+        f'<li><a href="/menu/{i}">메뉴 {i}</a><ul><li><a href="/menu/{i}/sub">하위 메뉴</a></li></ul></li>'
+        for i in range(300)
+    )
+    body = "".join(
+        f"<tr><td>{i}</td><td>중소벤처기업부</td>"
+        f'<td class="subject"><a href="{href.format(i=i)}">2026년 창업지원사업 공고 {i}</a></td>'
+        f"<td>2026.02.{i % 28 + 1:02d} ~ 2026.03.{i % 28 + 1:02d}</td><td>{i * 7}</td></tr>"
+        for i in range(rows)
+    )
+    footer = "<p>" + "주소 및 저작권 안내 " * 500 + "</p>"
+    return (
+        '<html><head><meta charset="utf-8"><script>var x = 1;</script></head><body>'
+        f'<div id="gnb"><ul class="menu">{nav}</ul></div>'
+        f"<div id='content'><table><thead><tr><th>번호</th></tr></thead><tbody>{body}</tbody></table></div>"
+        f"<div id='footer'>{footer}</div></body></html>"
+    )
+
+
+def bench(html: str, engine: str, scope, repeat: int) -> tuple:
+    best = float("inf")
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(parse_html(html, scope=scope, engine=engine).select("table tbody tr"))
+        best = min(best, time.perf_counter() - started)
+    return best, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", help="저장된 목록 페이지 HTML 파일")
+    parser.add_argument("--rows", type=int, default=500, help="합성 페이지 행 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = [(p, Path(p).read_text(encoding="utf-8", errors="replace")) for p in args.pages]
+    else:
+        pages = [(f"synthetic({args.rows} rows)", synthetic_board_page(args.rows))]
+
+    for name, html in pages:
+        print(f"\n{name}: {len(html) / 1024:.0f} KiB")
+        print(f"{'engine':<14}{'scope':<10}{'best ms':>10}{'rows':>8}")
+        for engine in HTML_ENGINES:
+            if resolve_html_engine(engine) != engine:
+                print(f"{engine:<14}{'-':<10}{'미설치':>10}")
+                continue
+            for scope in (None, ["table"]):
+                seconds, rows = bench(html, engine, scope, args.repeat)
+                label = "table" if scope else "full"
+                print(f"{engine:<14}{label:<10}{seconds * 1000:>10.1f}{rows:>8}")
+
+
+if __name__ == "__main__":
+    main()
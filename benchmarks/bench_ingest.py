@@ -0,0 +1,103 @@
+"""공고 DB 저장(ingest) 처리량 벤치마크
+
+임시 SQLite 파일에 공고 N건을 저장하는 시간을 방식별로 비교한다.
+
+- per-row: 예전 insert_posting 방식 (SELECT 1 → INSERT → commit 을 행마다)
+- bulk: Database.insert_postings_bulk (INSERT ... ON CONFLICT DO NOTHING RETURNING, 배치당 1 트랜잭션)
+- bulk-legacy: RETURNING 미지원 SQLite용 대체 경로 (IN 절 조회 + INSERT OR IGNORE)
+
+절반은 이미 저장된 공고(재수집)로 구성해 중복 판정 비용도 포함한다.
+
+사용법:
+    python -m benchmarks.bench_ingest [--rows 10000 100000] [--batch 200] [--per-row-max 20000]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.database as database_module
+from src.database import Database
+
+
+def make_postings(count: int, offset: int = 0) -> List[dict]:
+    return [
+        {
+            "id": Database.generate_id(f"2026년 창업지원사업 공고 {i}", f"https://example.com/{i}"),
+            "title": f"2026년 창업지원사업 공고 {i}",
+            "organization": "중소벤처기업부",
+            "category": "사업화",
+            "start_date": "2026-02-01",
+            "end_date": f"2026-03-{i % 28 + 1:02d}",
+            "target": "예비창업자, 3년 이내 창업기업",
+            "url": f"https://example.com/{i}",
+            "summary": "창업 아이템 사업화 자금 및 멘토링 지원 " * 3,
+            "source": "bench",
+        }
+        for i in range(offset, offset + count)
+    ]
+
+
+def per_row_insert(db: Database, posting: dict) -> bool:
+    """예전 insert_posting 구현 (행마다 조회/삽입/커밋)"""
+    cursor = db.conn.execute("SELECT 1 FROM postings WHERE id = ?", (posting["id"],))
+    if cursor.fetchone():
+        return False
+    db.conn.execute(
+        f"INSERT INTO postings ({database_module._POSTING_COLUMNS}) "
+        f"VALUES {database_module._POSTING_PLACEHOLDERS}",
+        Database._posting_row(posting, datetime.now().isoformat()),
+    )
+    db.conn.commit()
+    return True
+
+
+def run(method: str, rows: int, batch: int) -> tuple:
+    """(소요 초, 신규 저장 건수) - 절반을 미리 저장해 둔 DB에 rows건 저장"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=str(Path(tmp) / "bench.db"))
+        db.insert_postings_bulk(make_postings(rows // 2))
+        postings = make_postings(rows)
+
+        database_module.HAS_RETURNING = method == "bulk"
+        started = time.perf_counter()
+        if method == "per-row":
+            inserted = sum(per_row_insert(db, p) for p in postings)
+        else:
+            inserted = 0
+            for i in range(0, len(postings), batch):
+                inserted += len(db.insert_postings_bulk(postings[i:i + batch]))
+        elapsed = time.perf_counter() - started
+        db.close()
+    return elapsed, inserted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="*", default=[10000, 50000, 100000])
+    parser.add_argument("--batch", type=int, default=200, help="insert_postings_bulk 배치 크기")
+    parser.add_argument("--per-row-max", type=int, default=20000,
+                        help="per-row 방식은 이 건수까지만 측정 (행마다 fsync라 느림)")
+    args = parser.parse_args()
+
+    has_returning = database_module.HAS_RETURNING
+    methods = ["per-row", "bulk-legacy"] + (["bulk"] if has_returning else [])
+    print(f"SQLite {database_module.sqlite3.sqlite_version} (RETURNING {'지원' if has_returning else '미지원'})")
+    print(f"{'rows':>8}  {'method':<12}{'seconds':>10}{'rows/s':>12}{'inserted':>10}")
+    for rows in args.rows:
+        for method in methods:
+            if method == "per-row" and rows > args.per_row_max:
+                print(f"{rows:>8}  {method:<12}{'skip':>10}")
+                continue
+            seconds, inserted = run(method, rows, args.batch)
+            print(f"{rows:>8}  {method:<12}{seconds:>10.2f}{rows / seconds:>12.0f}{inserted:>10}")
+    database_module.HAS_RETURNING = has_returning
+
+
+if __name__ == "__main__":
+    main()
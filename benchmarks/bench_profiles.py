@@ -0,0 +1,98 @@
+"""팀별 필터 프로필 분배 벤치마크
+
+공고 N건을 프로필 P개로 분배하는 시간을 방식별로 비교한다.
+
+- per-profile: 프로필마다 따로 키워드 매칭 + 지역 제한 판정 (프로필 수만큼 본문을 다시 훑음)
+- router: ProfileRouter (키워드 합집합 매칭 1회 + 허용 지역 그룹 판정 본문 탐색 1회)
+
+프로필은 기본 키워드에서 일부를 빼고 팀 키워드를 더한 구성이며, 허용 지역은 몇 가지 구성을 돌려 쓴다.
+
+사용법:
+    python -m benchmarks.bench_profiles [--rows 5000] [--profiles 1 10 50 200]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.bench_filters import make_texts
+from src.filters import NATIONWIDE_KEYWORDS, REGIONAL_RESTRICTION_PATTERNS
+from src.profiles import ProfileRouter, default_profile, restricted_areas_for
+from src.region_rules import RegionRuleEngine
+from src.keyword_matcher import KeywordMatcher
+
+_ALLOWED = [("서울", "수도권"), ("부산", "경남"), ("대전", "세종", "충남"), ("경기", "인천")]
+
+
+def make_profiles(count: int, seed: int = 1) -> List[dict]:
+    rng = random.Random(seed)
+    base = list(default_profile()["keywords"])
+    return [
+        {
+            "name": f"team{i}",
+            "channel": f"team{i % 10}",
+            "keywords": tuple(rng.sample(base, len(base) // 2) + [f"팀{i}전용{j}" for j in range(5)]),
+            "allowed_regions": _ALLOWED[i % len(_ALLOWED)],
+        }
+        for i in range(count)
+    ]
+
+
+def make_postings(count: int) -> List[dict]:
+    rng = random.Random(2)
+    regions = ["부산 소재 기업", "경기도 내 기업", "대전 지역 기업", "서울 소재", "전국", ""]
+    return [
+        {"title": text[:40], "target": rng.choice(regions), "summary": text}
+        for text in make_texts(count)
+    ]
+
+
+def per_profile(profiles: List[dict]):
+    compiled = [
+        (
+            p["name"],
+            KeywordMatcher(p["keywords"]),
+            RegionRuleEngine(restricted_areas_for(p["allowed_regions"]), REGIONAL_RESTRICTION_PATTERNS,
+                             p["allowed_regions"], NATIONWIDE_KEYWORDS),
+        )
+        for p in profiles
+    ]
+
+    def route(posting: dict) -> dict:
+        text = " ".join([posting["title"], posting["target"], posting["summary"]])
+        routed = {}
+        for name, matcher, engine in compiled:
+            matched = matcher.matched(text)
+            if matched and not engine.is_restricted(posting):
+                routed[name] = matched
+        return routed
+
+    return route
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--profiles", type=int, nargs="*", default=[1, 10, 50, 200])
+    args = parser.parse_args()
+
+    postings = make_postings(args.rows)
+    print(f"공고 {args.rows}건")
+    print(f"{'profiles':>9}  {'method':<14}{'seconds':>10}{'rows/s':>12}")
+    for count in args.profiles:
+        profiles = make_profiles(count)
+        methods = {"per-profile": per_profile(profiles), "router": ProfileRouter(profiles).route}
+        for name, route in methods.items():
+            started = time.perf_counter()
+            for posting in postings:
+                route(posting)
+            seconds = time.perf_counter() - started
+            print(f"{count:>9}  {name:<14}{seconds:>10.2f}{args.rows / seconds:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
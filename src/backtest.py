@@ -0,0 +1,238 @@
+"""필터 규칙 백테스트 CLI - 저장된 전체 공고로 기존 규칙과 새 규칙의 결과 비교
+
+사용법:
+    python -m src.backtest --config new_rules.json
+    python -m src.backtest --config new_rules.json --baseline old_rules.json --workers 4 --out diff.jsonl
+
+규칙 파일(JSON)은 src.filters.current_rules()의 키 중 바꿀 것만 적는다.
+목록을 주면 통째로 바꾸고, {"add": [...], "remove": [...]}를 주면 현재 목록에 더하거나 뺀다.
+
+    {"keywords": {"add": ["딥테크"], "remove": ["국제"]},
+     "nationwide_keywords": {"add": ["전 지역"]}}
+
+--baseline을 주지 않으면 현재 src/filters.py 규칙이 기준이다.
+공고는 DB에서 ID 순 묶음으로 읽어(Database.iter_postings) 프로세스 풀에 나눠 보내고,
+묶음마다 두 규칙의 단계별 결과를 계산한다. 두 규칙에서 같은 단계(키워드 / 지역)는 한 번만 계산한다.
+만료 단계는 기본적으로 공고를 수집한 날 기준으로 판정한다 (--dates today: 오늘 기준, off: 생략).
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 프로젝트 루트를 sys.path에 추가
+_project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(_project_root))
+
+from src.database import Database
+from src.filters import (
+    REGION_RULE_KEYS, _is_expired_or_outdated, current_rules, edit_rule_list, match_keywords,
+    restricted_area,
+)
+from src.periods import parse_date_day
+
+# 필터가 읽는 컬럼만 조회 (워커로 보내는 데이터 크기를 줄임)
+BACKTEST_COLUMNS = (
+    "title", "organization", "category", "target", "summary", "url", "source",
+    "start_date", "end_date", "start_day", "end_day", "end_kind", "collected_at",
+)
+DATE_MODES = ("collected", "today", "off")
+STAGES = ("date", "keyword", "region", "pass")
+_STAGE_LABELS = {
+    "date": "만료/과거 배제",
+    "keyword": "키워드 미매칭",
+    "region": "지역 제한 배제",
+    "pass": "최종 포함",
+}
+
+Rules = Dict[str, Tuple[str, ...]]
+
+
+def apply_overrides(base: Rules, overrides: dict) -> Rules:
+    """규칙 파일 내용을 base 규칙에 적용 (목록: 교체, {"add", "remove"}: 추가/제거)"""
+    rules = dict(base)
+    for key, value in overrides.items():
+        if key not in rules:
+            raise ValueError(f"알 수 없는 규칙 항목: {key} ({', '.join(rules)})")
+        rules[key] = edit_rule_list(rules[key], value, key)
+    return rules
+
+
+def load_rules(path: Optional[str], base: Optional[Rules] = None) -> Rules:
+    """규칙 파일을 읽어 base(기본: 현재 규칙)에 적용"""
+    base = base or current_rules()
+    if not path:
+        return base
+    with open(path, encoding="utf-8") as f:
+        return apply_overrides(base, json.load(f))
+
+
+def _stage_day(posting: dict, dates: str) -> Optional[int]:
+    """만료 판정 기준일 (collected: 수집일, today: None = 오늘)"""
+    if dates == "collected":
+        return parse_date_day(posting.get("collected_at", ""))
+    return None
+
+
+def evaluate_chunk(rows: List[dict], baseline: Rules, candidate: Rules, dates: str = "collected") -> dict:
+    """공고 묶음을 두 규칙으로 판정
+
+    반환: {"counts": {"baseline": {단계: 건수}, "candidate": {...}},
+           "diffs": [포함 여부가 달라진 공고]}
+    단계는 "date" / "keyword" / "region" / "pass" (해당 단계에서 배제, pass는 최종 포함).
+    """
+    same_keywords = baseline["keywords"] == candidate["keywords"]
+    same_region = all(baseline[key] == candidate[key] for key in REGION_RULE_KEYS)
+    counts = {name: dict.fromkeys(STAGES, 0) for name in ("baseline", "candidate")}
+    diffs = []
+    for row in rows:
+        if dates != "off" and _is_expired_or_outdated(row, _stage_day(row, dates)):
+            counts["baseline"]["date"] += 1
+            counts["candidate"]["date"] += 1
+            continue
+
+        before_keywords = match_keywords(row, baseline["keywords"])
+        after_keywords = (
+            before_keywords if same_keywords else match_keywords(row, candidate["keywords"])
+        )
+        before_area = restricted_area(row, baseline) if before_keywords else None
+        if not after_keywords:
+            after_area = None
+        elif same_region and before_keywords:
+            after_area = before_area
+        else:
+            after_area = restricted_area(row, candidate)
+
+        before = "keyword" if not before_keywords else ("region" if before_area else "pass")
+        after = "keyword" if not after_keywords else ("region" if after_area else "pass")
+        counts["baseline"][before] += 1
+        counts["candidate"][after] += 1
+        if (before == "pass") != (after == "pass"):
+            diffs.append({
+                "id": row["id"],
+                "title": row.get("title", ""),
+                "source": row.get("source", ""),
+                "url": row.get("url", ""),
+                "before": before,
+                "after": after,
+                "before_keywords": before_keywords,
+                "after_keywords": after_keywords,
+                "region": after_area or before_area,
+            })
+    return {"counts": counts, "diffs": diffs}
+
+
+def _merge(total: dict, result: dict):
+    for name, stages in result["counts"].items():
+        for stage, count in stages.items():
+            total["counts"][name][stage] += count
+    total["diffs"].extend(result["diffs"])
+
+
+def run_backtest(chunks: Iterable[List[dict]], baseline: Rules, candidate: Rules,
+                 dates: str = "collected", workers: int = 1) -> dict:
+    """묶음 단위로 두 규칙을 판정해 합산 (workers > 1이면 프로세스 풀)
+
+    반환은 evaluate_chunk와 같은 형식 (diffs는 ID 순).
+    풀에 동시에 보내는 묶음은 워커 수의 2배까지로 제한해 DB 전체가 메모리에 쌓이지 않게 한다.
+    """
+    if dates not in DATE_MODES:
+        raise ValueError(f"알 수 없는 날짜 기준: {dates} ({', '.join(DATE_MODES)})")
+    total = {"counts": {name: dict.fromkeys(STAGES, 0) for name in ("baseline", "candidate")},
+             "diffs": []}
+    if workers <= 1:
+        for rows in chunks:
+            _merge(total, evaluate_chunk(rows, baseline, candidate, dates))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for rows in chunks:
+                pending.add(executor.submit(evaluate_chunk, rows, baseline, candidate, dates))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _merge(total, future.result())
+            for future in pending:
+                _merge(total, future.result())
+    total["diffs"].sort(key=lambda item: item["id"])
+    return total
+
+
+def _print_report(result: dict, show: int):
+    base, cand = result["counts"]["baseline"], result["counts"]["candidate"]
+    print(f"{'단계':<16}{'기존':>10}{'새 규칙':>10}{'차이':>10}")
+    print(f"{'전체':<16}{sum(base.values()):>10}{sum(cand.values()):>10}{'':>10}")
+    for stage in STAGES:
+        delta = cand[stage] - base[stage]
+        print(f"{_STAGE_LABELS[stage]:<16}{base[stage]:>10}{cand[stage]:>10}{delta:>+10}")
+
+    included = [d for d in result["diffs"] if d["after"] == "pass"]
+    excluded = [d for d in result["diffs"] if d["before"] == "pass"]
+    for label, items in (("새로 포함", included), ("새로 배제", excluded)):
+        print(f"\n[{label}] {len(items)}건")
+        for item in items[:show]:
+            stage = item["before"] if item["after"] == "pass" else item["after"]
+            reason = _STAGE_LABELS[stage] + (f" [{item['region']}]" if stage == "region" else "")
+            keywords = ", ".join(item["after_keywords"] or item["before_keywords"])
+            print(f"  {item['title']} ({item['source']}) - {reason}"
+                  + (f" / 키워드: {keywords}" if keywords else ""))
+        if len(items) > show:
+            print(f"  ... 외 {len(items) - show}건")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="필터 규칙 백테스트 (저장된 공고로 기존/새 규칙 비교)")
+    parser.add_argument("--config", required=True, help="새 규칙 JSON 파일")
+    parser.add_argument("--baseline", help="기준 규칙 JSON 파일 (기본: 현재 규칙)")
+    parser.add_argument("--dates", choices=DATE_MODES, default="collected",
+                        help="만료 판정 기준일 (collected: 수집일, today: 오늘, off: 만료 단계 생략)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="프로세스 수")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="묶음당 공고 수")
+    parser.add_argument("--show", type=int, default=20, help="변경된 공고를 종류별 최대 N건 출력")
+    parser.add_argument("--out", help="포함 여부가 바뀐 공고를 JSONL로 저장")
+    parser.add_argument("--db", help="DB 파일 경로 (기본: Config.DB_PATH)")
+    args = parser.parse_args(argv)
+
+    try:
+        baseline = load_rules(args.baseline)
+        candidate = load_rules(args.config)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    # 저장된 공고를 읽기만 하므로 읽기 전용으로 열어 close()가 메모리/델타 모드에서도 저장하지 않게 함
+    try:
+        db = Database(db_path=args.db, read_only=True)
+    except sqlite3.OperationalError as e:
+        parser.error(f"DB를 열 수 없습니다 ({args.db or 'Config.DB_PATH'}): {e} "
+                     "- 저장소의 수집 이력은 data/delta에 있으므로 DB_STORAGE=delta로 실행하세요")
+    try:
+        started = time.perf_counter()
+        # 읽기 전용 연결은 컬럼 추가(마이그레이션)를 하지 않으므로 예전 스키마 DB에는
+        # start_day/end_day/end_kind가 없을 수 있다. 있는 컬럼만 읽고, 빠진 날짜 컬럼은
+        # _is_expired_or_outdated가 start_date/end_date로 정규화한다.
+        existing = set(db._posting_column_names())
+        columns = [c for c in BACKTEST_COLUMNS if c in existing]
+        result = run_backtest(
+            db.iter_postings(columns, chunk_size=args.chunk_size),
+            baseline, candidate, dates=args.dates, workers=args.workers,
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+
+    _print_report(result, args.show)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            for item in result["diffs"]:
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    total = sum(result["counts"]["baseline"].values())
+    print(f"\n공고 {total}건, 포함 여부 변경 {len(result['diffs'])}건 ({elapsed:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,151 @@
 """수집기 기본 클래스"""
+import math
 import time
+import asyncio
+import hashlib
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import (
+    AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple,
+)
 
 import requests
+from bs4 import BeautifulSoup, SoupStrainer
 
 from src.config import Config
+from src.deadline import DeadlineExceeded, get_deadline
+from src.ratelimit import HostRateLimiter, get_rate_limiter
+from src.collectors.http import ASYNC_REQUEST_ERRORS, AsyncHttpClient, get_session
+from src.collectors.cassette import CassetteSession
+from src.collectors.http_cache import HttpCache, get_http_cache
+
+try:
+    import lxml  # noqa: F401  (BeautifulSoup "lxml" 빌더 사용 가능 여부)
+    HAS_LXML = True
+except ImportError:  # 선택 의존성
+    HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:  # selectolax 1.0 미만 (Modest 백엔드)
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:  # 선택 의존성
+        SelectolaxParser = None
 
 logger = logging.getLogger(__name__)
 
+HTML_ENGINES = ("html.parser", "lxml", "selectolax")
+
+
+@lru_cache(maxsize=None)
+def resolve_html_engine(engine: Optional[str] = None) -> str:
+    """설정된 HTML 파서 엔진 이름을 실제 사용 가능한 엔진으로 변환
+
+    auto: lxml이 설치되어 있으면 lxml, 아니면 html.parser.
+    설치되지 않은 엔진을 지정하면 경고 후 html.parser로 대체한다.
+    """
+    engine = (engine or Config.HTML_PARSER).lower()
+    if engine == "auto":
+        return "lxml" if HAS_LXML else "html.parser"
+    if engine not in HTML_ENGINES:
+        logger.warning(f"알 수 없는 HTML 파서 {engine} - html.parser 사용")
+        return "html.parser"
+    if (engine == "lxml" and not HAS_LXML) or (engine == "selectolax" and SelectolaxParser is None):
+        logger.warning(f"HTML 파서 {engine} 미설치 - html.parser 사용")
+        return "html.parser"
+    return engine
+
+
+def parse_html(html: str, scope: Optional[Sequence[str]] = None,
+               engine: Optional[str] = None) -> BeautifulSoup:
+    """목록 페이지 HTML을 BeautifulSoup 트리로 파싱
+
+    scope에 태그명 목록(예: ["table"])을 주면 해당 태그와 그 하위 요소만 트리로 만든다.
+    - html.parser / lxml: SoupStrainer로 나머지 요소는 트리를 만들지 않음
+    - selectolax: C 파서로 scope 영역만 잘라낸 뒤 그 조각만 BeautifulSoup으로 파싱
+    어느 엔진이든 BeautifulSoup 객체를 반환하므로 수집기의 select/find 코드는 그대로 쓴다.
+    """
+    engine = resolve_html_engine(engine)
+    if engine == "selectolax":
+        if scope:
+            names = {name.lower() for name in scope}
+            tree = SelectolaxParser(html)
+            fragments = []
+            for node in tree.css(", ".join(scope)):
+                # 다른 scope 요소 안에 포함된 요소는 바깥 요소에 이미 들어 있으므로 제외
+                parent = node.parent
+                while parent is not None and parent.tag not in names:
+                    parent = parent.parent
+                if parent is None:
+                    fragments.append(node.html)
+            html = "".join(fragments)
+        return BeautifulSoup(html, "html.parser")
+
+    strainer = SoupStrainer(list(scope)) if scope else None
+    return BeautifulSoup(html, engine, parse_only=strainer)
+
 
 class BaseCollector(ABC):
     """모든 수집기의 기본 클래스"""
 
     SOURCE_NAME: str = "unknown"
+    # 목록에 지원대상/요약이 없어 상세 페이지로 보강하는 소스인지 여부
+    ENRICH_DETAILS: bool = False
+    # 상세 페이지 본문 영역 후보 (앞에서부터 처음 찾은 요소 사용)
+    DETAIL_CONTENT_SELECTORS = [
+        "div.view_cont", "div.view-cont", "div.view_content", "div.view-content",
+        "div.board-view", "div.bbs_view", "div.board_view", "td.content",
+        "article", "div#content",
+    ]
+    # 지원대상 항목을 나타내는 라벨
+    DETAIL_TARGET_LABELS = ["지원대상", "신청대상", "참여대상", "모집대상", "신청자격", "지원자격"]
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "StartupAlertBot/1.0 (startup-support-monitor; educational)",
-            "Accept": "application/json, application/xml, text/html",
-        })
-        self.delay = Config.REQUEST_DELAY
+        self.session = get_session()
+        # 비동기 엔진에서 실행될 때 연결되는 공유 클라이언트
+        self.http_client: Optional[AsyncHttpClient] = None
+        self.rate_limiter = get_rate_limiter()
+        if Config.HTTP_CASSETTE_MODE in ("record", "replay"):
+            self.session = CassetteSession(
+                self.session, Config.HTTP_CASSETTE_MODE, Config.HTTP_CASSETTE_DIR, self.SOURCE_NAME
+            )
+            if Config.HTTP_CASSETTE_MODE == "replay":
+                # 재생은 네트워크를 쓰지 않으므로 속도 제한 불필요
+                self.rate_limiter = HostRateLimiter(0)
+        # 녹화/재생 중에는 조건부 캐시를 끈다: 녹화 시 304 응답은 카세트에 남지 않고,
+        # 재생 시 본문 해시 적중이면 페이지를 건너뛰어 공고가 하나도 나오지 않음
+        cassette = Config.HTTP_CASSETTE_MODE in ("record", "replay")
+        self.http_cache: Optional[HttpCache] = (
+            get_http_cache() if Config.HTTP_CACHE_ENABLED and not cassette else None
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # 응답은 받았지만 아직 행 처리가 끝나지 않은 페이지의 캐시 항목 (_commit_page_cache 참고)
+        self._pending_cache: Dict[str, dict] = {}
+        # 이미 DB에 있는 ID 조회 함수 (IdIndex.known 또는 Database.find_existing_ids).
+        # 연결되지 않으면 1페이지만 수집.
+        self.known_ids_lookup: Optional[Callable[[Iterable[str]], Set[str]]] = None
+        # False이면 기존 공고도 레코드를 만들어 내보냄 (변경 추적용, 페이지 조기 중단은 그대로)
+        self.skip_known_rows = True
+        # _is_known()으로 걸러 낸 기존 행 수 (_paginate가 페이지별 조기 중단 판정에 사용)
+        self.known_skipped = 0
+        # 서킷 브레이커 half-open 상태의 탐침 실행 (재시도 없이 짧은 타임아웃, 1페이지만)
+        self.probe = False
+        # 소스 상태 판정용 요청 결과 집계
+        self.request_ok = 0
+        self.request_failed = 0
+        self.last_error = ""
 
     @abstractmethod
-    def collect(self) -> List[dict]:
+    def iter_postings(self) -> Iterator[dict]:
         """
-        공고 데이터를 수집하여 표준 형식의 dict 리스트로 반환.
+        공고를 파싱되는 대로 표준 형식의 dict로 하나씩 yield (스트리밍 수집).
+
+        중복 제거와 DB 저장은 공통 단계(src.pipeline)에서 처리하므로
+        수집기는 목록 행을 읽는 즉시 내보내기만 하면 된다.
 
         각 dict 필수 키:
         - id: 고유 식별자
@@ -43,24 +161,398 @@ class BaseCollector(ABC):
         """
         pass
 
+    def collect(self) -> List[dict]:
+        """iter_postings() 결과를 ID 중복 제거 후 리스트로 반환"""
+        seen = set()
+        postings = []
+        for posting in self.iter_postings():
+            if posting["id"] not in seen:
+                seen.add(posting["id"])
+                postings.append(posting)
+        return postings
+
+    async def iter_postings_async(self) -> AsyncIterator[dict]:
+        """iter_postings()의 비동기 버전 (COLLECT_ENGINE=async)
+
+        기본 구현은 동기 iter_postings()를 작업 스레드에서 돌리며 공고가 나오는 대로 이벤트 루프로
+        넘기는 어댑터이므로 기존 수집기는 수정 없이 비동기 엔진에서 동작한다.
+        API 수집기처럼 요청을 이벤트 루프에서 동시에 보낼 수 있는 수집기는 이 메서드를 재정의하고
+        _request_async() / _fan_out_async()를 사용한다.
+        """
+        loop = asyncio.get_running_loop()
+        items: asyncio.Queue = asyncio.Queue()
+
+        def send(kind: str, value=None):
+            try:
+                loop.call_soon_threadsafe(items.put_nowait, (kind, value))
+            except RuntimeError:  # 소비 측 이벤트 루프가 이미 종료됨
+                pass
+
+        def produce():
+            try:
+                for posting in self.iter_postings():
+                    send("item", posting)
+            except BaseException as e:
+                send("error", e)
+            else:
+                send("done")
+
+        worker = loop.run_in_executor(None, produce)
+        while True:
+            kind, value = await items.get()
+            if kind == "item":
+                yield value
+            elif kind == "error":
+                raise value
+            else:
+                break
+        await worker
+
+    def is_healthy(self) -> bool:
+        """이번 실행에서 소스가 정상 응답했는지 (요청이 하나라도 성공했거나 실패가 없음)"""
+        return self.request_ok > 0 or (self.request_failed == 0 and not self.last_error)
+
+    def _parse_html(self, html: str, scope: Optional[Sequence[str]] = None) -> BeautifulSoup:
+        """설정된 엔진(Config.HTML_PARSER)으로 HTML 파싱 (parse_html 참고)"""
+        return parse_html(html, scope=scope)
+
+    def fetch_detail(self, url: str) -> Dict[str, str]:
+        """상세 페이지를 받아 지원대상(target)/요약(summary) 추출"""
+        response = self._request(url, max_retries=2)
+        if response.encoding and response.encoding.lower() == "iso-8859-1":
+            response.encoding = response.apparent_encoding
+        return self._parse_detail(self._parse_html(response.text))
+
+    def _parse_detail(self, soup: BeautifulSoup) -> Dict[str, str]:
+        """상세 페이지 공통 파싱 (사이트별 구조가 다르면 수집기에서 재정의)
+
+        - target: th/dt 라벨이 지원대상류인 항목의 다음 칸(td/dd) 텍스트
+        - summary: 본문 영역 텍스트 앞부분 (없으면 meta description)
+        """
+        target = ""
+        for label in soup.find_all(["th", "dt", "strong"]):
+            label_text = label.get_text(strip=True).replace(" ", "")
+            if any(name in label_text for name in self.DETAIL_TARGET_LABELS):
+                value = label.find_next_sibling(["td", "dd"])
+                if value is None:
+                    value = label.find_next(["td", "dd", "p"])
+                if value is not None:
+                    target = " ".join(value.get_text(" ", strip=True).split())[:200]
+                    if target:
+                        break
+
+        summary = ""
+        for selector in self.DETAIL_CONTENT_SELECTORS:
+            content = soup.select_one(selector)
+            if content is not None:
+                summary = " ".join(content.get_text(" ", strip=True).split())[:300]
+                if summary:
+                    break
+        if not summary:
+            meta = soup.find("meta", attrs={"name": "description"})
+            if meta and meta.get("content"):
+                summary = meta["content"].strip()[:300]
+
+        return {"target": target, "summary": summary}
+
+    def _is_known(self, posting_id: str) -> bool:
+        """이미 저장된 공고인지 (수집기는 True이면 나머지 필드 파싱을 건너뛴다)"""
+        known = (
+            self.skip_known_rows
+            and self.known_ids_lookup is not None
+            and bool(self.known_ids_lookup((posting_id,)))
+        )
+        if known:
+            self.known_skipped += 1
+        return known
+
+    def _paginate(self, fetch_page: Callable[[int], Optional[List[dict]]],
+                  max_pages: Optional[int] = None) -> Iterator[dict]:
+        """1페이지부터 차례로 수집하다가 이미 DB에 있는 공고만 있는 페이지를 만나면 중단
+
+        fetch_page(page)는 해당 페이지의 공고 리스트를 반환하고,
+        행이 없거나(마지막 페이지 이후) 목록이 변경되지 않았으면 None을 반환한다.
+        _is_known()으로 기존 행을 걸러 빈 리스트를 반환해도 기존 공고만 있는 페이지로 보고 중단한다
+        (fetch_page 동안 늘어난 known_skipped로 걸러 낸 행이 있었는지 판단).
+        페이지 중간에 실패해도 그 전까지 yield한 공고는 그대로 유지된다.
+        """
+        if self.known_ids_lookup is None or self.probe:
+            max_pages = 1
+        max_pages = max_pages or Config.MAX_PAGES
+
+        seen = set()
+        for page in range(1, max_pages + 1):
+            if page > 1 and get_deadline().collect_expired():
+                logger.warning(f"[{self.SOURCE_NAME}] 실행 마감 임박 - {page}페이지부터 미수집")
+                return
+            skipped_before = self.known_skipped
+            try:
+                items = fetch_page(page)
+            except Exception as e:
+                logger.error(f"[{self.SOURCE_NAME}] {page}페이지 수집 실패: {e}")
+                self._pending_cache.clear()
+                return
+            if items is None:
+                return
+
+            # 앞 페이지에서 밀려 내려온 항목은 이번 실행에서 이미 본 것으로 취급
+            page_items = []
+            for item in items:
+                if item["id"] not in seen:
+                    seen.add(item["id"])
+                    page_items.append(item)
+
+            # 기존 ID 조회는 yield 전에 해야 함 (yield한 공고는 곧바로 DB에 저장될 수 있음)
+            # 수집기가 기존 행을 걸러 냈다면 반환된 행이 없어도 기존 공고만 있는 페이지
+            skipped = self.known_skipped - skipped_before
+            all_known = False
+            if (items or skipped) and self.known_ids_lookup is not None:
+                page_ids = {item["id"] for item in page_items}
+                all_known = self.known_ids_lookup(page_ids) >= page_ids
+
+            yield from page_items
+            # 페이지 행이 모두 소비된 뒤에 캐시 기록 (소비 중 실패하면 여기까지 오지 않음)
+            self._commit_page_cache()
+
+            if all_known:
+                logger.info(f"[{self.SOURCE_NAME}] {page}페이지 모두 기존 공고 - 페이지 탐색 중단")
+                return
+
+        if max_pages > 1:
+            logger.warning(f"[{self.SOURCE_NAME}] 최대 페이지({max_pages}) 도달 - 이후 페이지 미수집")
+
+    def _fan_out(self, fetch_page: Callable[[int], Tuple[List[dict], int]],
+                 per_page: int, max_pages: Optional[int] = None) -> Iterator[dict]:
+        """전체 건수(totalCount)를 주는 API용 페이지 수집
+
+        fetch_page(page)는 (해당 페이지 공고 리스트, 전체 건수)를 반환한다.
+        1페이지 응답의 전체 건수로 페이지 수를 계산하고, 나머지 페이지는 스레드 풀로 동시에
+        요청한다 (호스트별 속도 제한은 _request()에서 그대로 적용).
+        서버 측 필터로 전체 건수가 작게 유지되는 API를 전제로 하므로 기존 공고 조기 중단은 하지 않는다.
+        """
+        if self.known_ids_lookup is None or self.probe:
+            max_pages = 1
+        max_pages = max_pages or Config.API_MAX_PAGES
+
+        items, total = fetch_page(1)
+        seen = set()
+
+        def fresh(page_items: List[dict]) -> Iterator[dict]:
+            for item in page_items:
+                if item["id"] not in seen:
+                    seen.add(item["id"])
+                    yield item
+
+        yield from fresh(items)
+
+        pages = self._fan_out_pages(total, per_page, max_pages)
+        if pages <= 1:
+            return
+
+        workers = max(1, min(Config.API_PAGE_WORKERS, pages - 1))
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix=f"{self.SOURCE_NAME}-page") as pool:
+            futures = {pool.submit(fetch_page, page): page for page in range(2, pages + 1)}
+            for future in as_completed(futures):
+                page = futures[future]
+                try:
+                    items, _ = future.result()
+                except DeadlineExceeded:
+                    logger.warning(f"[{self.SOURCE_NAME}] 실행 마감으로 {page}페이지 미수집")
+                    continue
+                except Exception as e:
+                    logger.error(f"[{self.SOURCE_NAME}] {page}페이지 수집 실패: {e}")
+                    continue
+                yield from fresh(items)
+
+    def _fan_out_pages(self, total: int, per_page: int, max_pages: int) -> int:
+        """1페이지 응답의 전체 건수로 수집할 페이지 수 계산 (1 이하이면 추가 요청 없음)"""
+        pages = min(max_pages, math.ceil(total / per_page)) if per_page > 0 else 1
+        if pages <= 1:
+            return pages
+        if get_deadline().collect_expired():
+            logger.warning(f"[{self.SOURCE_NAME}] 실행 마감 임박 - 2~{pages}페이지 미수집")
+            return 1
+        if math.ceil(total / per_page) > max_pages:
+            logger.warning(
+                f"[{self.SOURCE_NAME}] 전체 {total}건 중 최대 {max_pages}페이지까지만 수집"
+            )
+        return pages
+
+    async def _fan_out_async(self, fetch_page: Callable[[int], Awaitable[Tuple[List[dict], int]]],
+                             per_page: int, max_pages: Optional[int] = None) -> AsyncIterator[dict]:
+        """_fan_out()의 비동기 버전
+
+        fetch_page(page)는 코루틴이며, 2페이지부터는 API_PAGE_WORKERS개까지 이벤트 루프에서
+        동시에 요청하고 응답이 오는 순서대로 공고를 내보낸다.
+        """
+        if self.known_ids_lookup is None or self.probe:
+            max_pages = 1
+        max_pages = max_pages or Config.API_MAX_PAGES
+
+        items, total = await fetch_page(1)
+        seen = set()
+        for item in items:
+            if item["id"] not in seen:
+                seen.add(item["id"])
+                yield item
+
+        pages = self._fan_out_pages(total, per_page, max_pages)
+        if pages <= 1:
+            return
+
+        semaphore = asyncio.Semaphore(max(1, min(Config.API_PAGE_WORKERS, pages - 1)))
+
+        async def fetch(page: int):
+            async with semaphore:
+                try:
+                    page_items, _ = await fetch_page(page)
+                    return page, page_items, None
+                except Exception as e:
+                    return page, [], e
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(2, pages + 1)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                page, page_items, error = await next_done
+                if isinstance(error, DeadlineExceeded):
+                    logger.warning(f"[{self.SOURCE_NAME}] 실행 마감으로 {page}페이지 미수집")
+                elif error is not None:
+                    logger.error(f"[{self.SOURCE_NAME}] {page}페이지 수집 실패: {error}")
+                for item in page_items:
+                    if item["id"] not in seen:
+                        seen.add(item["id"])
+                        yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def _request(self, url: str, params: Optional[dict] = None,
-                 max_retries: int = 3) -> requests.Response:
-        """재시도 로직 포함 HTTP GET 요청"""
+                 max_retries: int = 3,
+                 headers: Optional[dict] = None) -> requests.Response:
+        """재시도 로직 포함 HTTP GET 요청 (호스트별 속도 제한 적용)
+
+        타임아웃과 재시도 여부는 실행 마감까지 남은 수집 예산에 맞춰 줄어들며,
+        예산이 없으면 요청하지 않고 DeadlineExceeded를 발생시킨다.
+        """
+        deadline = get_deadline()
+        timeout = 30
+        if self.probe:
+            max_retries, timeout = 1, Config.CIRCUIT_PROBE_TIMEOUT
         for attempt in range(max_retries):
+            request_timeout = deadline.request_timeout(timeout)
             try:
-                if attempt > 0 or self.delay > 0:
-                    time.sleep(self.delay)
-                response = self.session.get(url, params=params, timeout=30)
+                self.rate_limiter.acquire(url)
+                response = self.session.get(
+                    url, params=params, headers=headers, timeout=request_timeout
+                )
                 response.raise_for_status()
+                self.request_ok += 1
                 return response
             except requests.RequestException as e:
                 logger.warning(
                     f"[{self.SOURCE_NAME}] 요청 실패 (시도 {attempt + 1}/{max_retries}): {e}"
                 )
-                if attempt == max_retries - 1:
+                if attempt == max_retries - 1 or not deadline.can_retry(2 ** attempt):
+                    self.request_failed += 1
+                    self.last_error = str(e)
                     raise
                 time.sleep(2 ** attempt)
 
+    async def _request_async(self, url: str, params: Optional[dict] = None,
+                             max_retries: int = 3,
+                             headers: Optional[dict] = None) -> requests.Response:
+        """_request()의 비동기 버전 (공유 AsyncHttpClient + 호스트별 속도 제한)
+
+        녹화/재생 모드에서는 동기 경로와 같은 카세트를 쓴다
+        (replay: 네트워크 없이 카세트에서 응답, record: 받은 응답을 카세트에 저장).
+        """
+        cassette = self.session if isinstance(self.session, CassetteSession) else None
+        if cassette is not None and cassette.mode == "replay":
+            response = cassette.replay(url, params)
+            response.raise_for_status()
+            self.request_ok += 1
+            return response
+        if self.http_client is None:
+            async with AsyncHttpClient() as client:
+                self.http_client = client
+                try:
+                    return await self._request_async(url, params, max_retries, headers)
+                finally:
+                    self.http_client = None
+        client = self.http_client
+        deadline = get_deadline()
+        timeout = 30
+        if self.probe:
+            max_retries, timeout = 1, Config.CIRCUIT_PROBE_TIMEOUT
+        for attempt in range(max_retries):
+            request_timeout = deadline.request_timeout(timeout)
+            try:
+                await self.rate_limiter.acquire_async(url)
+                response = await client.get(
+                    url, params=params, headers=headers, timeout=request_timeout
+                )
+                response.raise_for_status()
+                if cassette is not None:
+                    cassette.record(url, params, response)
+                self.request_ok += 1
+                return response
+            except ASYNC_REQUEST_ERRORS as e:
+                logger.warning(
+                    f"[{self.SOURCE_NAME}] 요청 실패 (시도 {attempt + 1}/{max_retries}): {e}"
+                )
+                if attempt == max_retries - 1 or not deadline.can_retry(2 ** attempt):
+                    self.request_failed += 1
+                    self.last_error = str(e) or e.__class__.__name__
+                    raise
+                await asyncio.sleep(2 ** attempt)
+
+    def _fetch_page(self, url: str, params: Optional[dict] = None) -> Optional[requests.Response]:
+        """조건부 GET 요청. 지난 수집 이후 페이지가 바뀌지 않았으면 None 반환
+
+        304 응답 또는 (검증자를 주지 않는 서버의 경우) 본문 해시 일치 시 캐시 적중으로 보고
+        호출 측은 파싱과 DB 작업을 건너뛴다.
+        새 응답의 캐시 항목은 보류해 두었다가 호출 측이 페이지 행을 모두 처리한 뒤
+        _commit_page_cache()로 기록한다 (_paginate는 페이지마다 자동으로 호출).
+        """
+        if self.http_cache is None:
+            return self._request(url, params=params)
+
+        key = self.http_cache.key(url, params)
+        cached = self.http_cache.get(key) or {}
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self._request(url, params=params, headers=headers)
+        if response.status_code == 304:
+            self.cache_hits += 1
+            return None
+
+        body_hash = hashlib.sha256(response.content).hexdigest()
+        if cached.get("body_hash") == body_hash:
+            self.cache_hits += 1
+            return None
+
+        self.cache_misses += 1
+        # 페이지 행을 모두 처리한 뒤 _commit_page_cache()에서 기록
+        # (파싱/저장 중 실패한 페이지가 다음 실행에서 "변경 없음"으로 영영 건너뛰어지지 않도록)
+        self._pending_cache[key] = {
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+            "body_hash": body_hash,
+        }
+        return response
+
+    def _commit_page_cache(self):
+        """_fetch_page()로 받은 페이지의 검증자/본문 해시를 캐시에 기록 (행 처리가 끝난 뒤 호출)"""
+        if self.http_cache is not None:
+            for key, entry in self._pending_cache.items():
+                self.http_cache.set(key, entry)
+        self._pending_cache.clear()
+
     @staticmethod
     def _normalize_date(date_str: str) -> str:
         """날짜 형식 정규화 -> YYYY-MM-DD"""
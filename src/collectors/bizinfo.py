@@ -7,9 +7,7 @@
 """
 import logging
 import re
-from typing import List
-
-from bs4 import BeautifulSoup
+from typing import Iterator, List, Optional
 
 from src.config import Config
 from src.collectors.base import BaseCollector
@@ -19,48 +17,61 @@ logger = logging.getLogger(__name__)
 
 BIZINFO_LIST_URL = "https://www.bizinfo.go.kr/web/lay1/bbs/S1T122C128/AS/74/list.do"
 BIZINFO_BASE_URL = "https://www.bizinfo.go.kr"
+# 목록 테이블 + 대체 추출용 a 태그만 파싱
+BIZINFO_LIST_SCOPE = ["table", "a"]
 
 
 class BizinfoCollector(BaseCollector):
     """기업마당 지원사업 공고 크롤링 수집기"""
 
     SOURCE_NAME = "bizinfo"
+    ENRICH_DETAILS = True
 
-    def collect(self) -> List[dict]:
+    def iter_postings(self) -> Iterator[dict]:
         logger.info("기업마당 크롤링 수집 시작")
-        postings = []
-
-        try:
-            params = {
-                "rows": min(Config.COLLECT_COUNT, 30),
-                "cpage": 1,
-            }
-            response = self._request(BIZINFO_LIST_URL, params=params)
-
-            if response.encoding and response.encoding.lower() == "iso-8859-1":
-                response.encoding = response.apparent_encoding
-
-            soup = BeautifulSoup(response.text, "html.parser")
+        count = 0
+        for posting in self._paginate(self._collect_page):
+            count += 1
+            yield posting
+        logger.info(f"기업마당 수집 완료: {count}건")
+
+    def _collect_page(self, page: int) -> Optional[List[dict]]:
+        """목록 page 페이지 수집. 항목이 없거나 변경이 없으면 None."""
+        params = {
+            "rows": min(Config.COLLECT_COUNT, 30),
+            "cpage": page,
+        }
+        response = self._fetch_page(BIZINFO_LIST_URL, params=params)
+        if response is None:
+            logger.info(f"기업마당 {page}페이지 변경 없음 - 파싱 건너뜀")
+            return None
 
-            # 공고 목록 테이블에서 행 추출
-            rows = soup.select("table tbody tr")
-            if not rows:
-                # 대체: a 태그에서 공고 링크 직접 추출
-                rows = soup.find_all("a", href=re.compile(r"selectSIIA200Detail"))
+        if response.encoding and response.encoding.lower() == "iso-8859-1":
+            response.encoding = response.apparent_encoding
 
-            logger.info(f"기업마당 페이지에서 {len(rows)}개 항목 발견")
+        soup = self._parse_html(response.text, scope=BIZINFO_LIST_SCOPE)
 
-            for row in rows:
-                posting = self._parse_row(row)
-                if posting:
-                    postings.append(posting)
+        # 공고 목록 테이블에서 행 추출
+        rows = soup.select("table tbody tr")
+        if not rows:
+            # 대체: a 태그에서 공고 링크 직접 추출
+            rows = soup.find_all("a", href=re.compile(r"selectSIIA200Detail"))
 
-        except Exception as e:
-            logger.error(f"기업마당 크롤링 실패: {e}")
+        logger.info(f"기업마당 {page}페이지에서 {len(rows)}개 항목 발견")
+        if not rows:
+            return None
 
-        logger.info(f"기업마당 수집 완료: {len(postings)}건")
+        postings = []
+        for row in rows:
+            posting = self._parse_row(row)
+            if posting:
+                postings.append(posting)
         return postings
 
+    @staticmethod
+    def _absolute_url(href: str) -> str:
+        return href if href.startswith("http") else BIZINFO_BASE_URL + href
+
     def _parse_row(self, element) -> dict:
         """테이블 행 또는 a 태그에서 공고 정보 파싱"""
         try:
@@ -78,6 +89,11 @@ class BizinfoCollector(BaseCollector):
                 href = link.get("href", "")
                 if not title:
                     return None
+                url = self._absolute_url(href)
+                posting_id = Database.generate_id(title, url)
+                # 기존 공고는 나머지 칸 파싱 생략
+                if self._is_known(posting_id):
+                    return None
 
                 # 기관명, 시작일, 종료일 추출 (테이블 구조에 따라)
                 org = tds[1].text.strip() if len(tds) > 1 else ""
@@ -97,20 +113,20 @@ class BizinfoCollector(BaseCollector):
             # <a> 태그인 경우
             elif element.name == "a":
                 title = element.text.strip()
-                href = element.get("href", "")
+                if not title:
+                    return None
+                url = self._absolute_url(element.get("href", ""))
+                posting_id = Database.generate_id(title, url)
+                if self._is_known(posting_id):
+                    return None
                 org = ""
                 start_date = ""
                 end_date = ""
             else:
                 return None
 
-            if not title:
-                return None
-
-            url = href if href.startswith("http") else BIZINFO_BASE_URL + href
-
             return {
-                "id": Database.generate_id(title, url),
+                "id": posting_id,
                 "title": title,
                 "organization": org,
                 "category": "",
@@ -0,0 +1,111 @@
+"""HTTP 응답 녹화/재생(cassette) 모드
+
+HTTP_CASSETTE_MODE=record 로 실행하면 수집기가 받은 실제 응답을 디스크에 저장하고,
+HTTP_CASSETTE_MODE=replay 로 실행하면 네트워크 없이 저장된 응답만으로 수집 경로 전체
+(요청 → 파싱 → 공고 생성)를 재현한다. 정부 사이트 없이 회귀 테스트와 벤치마크를 돌리기 위함.
+
+카세트 파일은 {HTTP_CASSETTE_DIR}/{source}/{요청 해시}.json 이며,
+serviceKey 같은 인증 파라미터는 요청 해시와 파일 내용에서 제외한다.
+"""
+import base64
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# 카세트 키/파일에 남기지 않는 파라미터
+SECRET_PARAMS = {"serviceKey", "servicekey", "api_key", "apiKey"}
+
+
+def _public_params(params: Optional[dict]) -> dict:
+    return {k: v for k, v in (params or {}).items() if k not in SECRET_PARAMS}
+
+
+def cassette_key(url: str, params: Optional[dict] = None) -> str:
+    """URL + 공개 파라미터 기준 요청 해시"""
+    public = json.dumps(sorted((k, str(v)) for k, v in _public_params(params).items()))
+    return hashlib.sha1(f"{url}?{public}".encode()).hexdigest()
+
+
+class CassetteSession:
+    """requests.Session.get()을 감싸 응답을 녹화하거나 재생하는 세션
+
+    mode:
+    - record: 실제 요청 후 응답 저장
+    - replay: 저장된 응답 반환, 없으면 ConnectionError (네트워크 접근 없음)
+    """
+
+    def __init__(self, session: requests.Session, mode: str, directory: str, source: str):
+        self.session = session
+        self.mode = mode
+        self.directory = Path(directory) / source
+
+    def _path(self, url: str, params: Optional[dict]) -> Path:
+        return self.directory / f"{cassette_key(url, params)}.json"
+
+    def get(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+            timeout: Optional[float] = None) -> requests.Response:
+        if self.mode == "replay":
+            return self.replay(url, params)
+
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        self.record(url, params, response)
+        return response
+
+    def replay(self, url: str, params: Optional[dict] = None) -> requests.Response:
+        """저장된 응답 반환, 없으면 ConnectionError"""
+        path = self._path(url, params)
+        if not path.exists():
+            raise requests.ConnectionError(f"카세트 없음 (replay): {url} {_public_params(params)}")
+        return load_response(path)
+
+    def record(self, url: str, params: Optional[dict], response: requests.Response):
+        """record 모드이면 200 응답을 저장 (비동기 클라이언트가 받은 응답도 같은 경로로 저장)"""
+        if self.mode == "record" and response.status_code == 200:
+            save_response(self._path(url, params), url, params, response)
+
+
+def save_response(path: Path, url: str, params: Optional[dict], response: requests.Response):
+    """응답을 카세트 파일로 저장 (본문은 원본 바이트를 base64로 보존)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "url": url,
+        "params": {k: str(v) for k, v in _public_params(params).items()},
+        "status": response.status_code,
+        "headers": {
+            k: v for k, v in response.headers.items()
+            if k.lower() in ("content-type", "etag", "last-modified")
+        },
+        "body": base64.b64encode(response.content).decode("ascii"),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+    logger.debug(f"카세트 녹화: {path}")
+
+
+def load_response(path: Path) -> requests.Response:
+    """카세트 파일을 requests.Response로 복원"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return build_response(
+        base64.b64decode(data["body"]), status=data["status"],
+        headers=data.get("headers"), url=data["url"],
+    )
+
+
+def build_response(body: bytes, status: int = 200, headers: Optional[dict] = None,
+                   url: str = "") -> requests.Response:
+    """본문 바이트로 requests.Response 생성 (재생/벤치마크용)"""
+    response = requests.Response()
+    response.status_code = status
+    response.url = url
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content = body
+    return response
@@ -0,0 +1,106 @@
+"""공유 HTTP 클라이언트 (연결 풀 / keep-alive)
+
+수집기마다 requests.Session을 새로 만들면 실행할 때마다 호스트별 TCP/TLS 핸드셰이크를
+반복하게 되므로, 프로세스 전역 세션 하나를 연결 풀과 함께 공유한다.
+
+비동기 수집 엔진(COLLECT_ENGINE=async)에서는 AsyncHttpClient를 이벤트 루프 하나에
+공유한다. aiohttp가 설치되어 있으면 aiohttp 연결 풀을 사용하고, 없으면 공유 세션을
+스레드에서 호출하는 방식으로 동작한다. 어느 쪽이든 requests.Response를 반환하므로
+수집기의 파싱 코드는 그대로 재사용할 수 있다.
+"""
+import asyncio
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from src.config import Config
+
+try:
+    import aiohttp
+except ImportError:  # 선택 의존성
+    aiohttp = None
+
+DEFAULT_HEADERS = {
+    "User-Agent": "StartupAlertBot/1.0 (startup-support-monitor; educational)",
+    "Accept": "application/json, application/xml, text/html",
+}
+
+# 비동기 요청에서 재시도 대상으로 보는 예외
+ASYNC_REQUEST_ERRORS = (requests.RequestException, asyncio.TimeoutError) + (
+    (aiohttp.ClientError,) if aiohttp is not None else ()
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """프로세스 전역 공유 세션 반환 (호스트별 keep-alive 연결 재사용)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=Config.HTTP_POOL_SIZE,
+                pool_maxsize=Config.HTTP_POOL_SIZE,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+class AsyncHttpClient:
+    """이벤트 루프 하나에서 공유하는 비동기 HTTP 클라이언트
+
+    async with AsyncHttpClient() as client:
+        response = await client.get(url, params=...)
+    """
+
+    def __init__(self, pool_size: Optional[int] = None):
+        self.pool_size = pool_size or Config.HTTP_POOL_SIZE
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        if aiohttp is not None:
+            self._session = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                connector=aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_size),
+            )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get(self, url: str, params: Optional[dict] = None,
+                  headers: Optional[dict] = None, timeout: float = 30) -> requests.Response:
+        """GET 요청 후 requests.Response 형태로 반환 (상태 코드 검사는 호출 측에서)"""
+        if self._session is None:
+            return await asyncio.to_thread(
+                get_session().get, url, params=params, headers=headers, timeout=timeout
+            )
+
+        async with self._session.get(
+            url, params=params, headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as resp:
+            body = await resp.read()
+
+        response = requests.Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.url = str(resp.url)
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        return response
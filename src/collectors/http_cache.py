@@ -0,0 +1,82 @@
+"""HTTP 조건부 요청 캐시 (ETag / Last-Modified / 본문 해시)
+
+목록 페이지별로 마지막 응답의 검증자(ETag, Last-Modified)와 본문 해시를
+data/ 아래 JSON 파일에 저장해 두고, 다음 실행에서 If-None-Match /
+If-Modified-Since 헤더로 재요청한다. 304 응답이거나 검증자를 주지 않는
+서버라도 본문 해시가 같으면 "변경 없음"으로 판단하여 파싱/DB 작업을 건너뛴다.
+
+캐시 파일은 수집 결과가 DB에 반영된 뒤에만 저장(save)하므로,
+중간에 실패한 실행이 "변경 없음" 상태만 남기는 일은 없다.
+"""
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """URL별 검증자/본문 해시 저장소 (스레드 안전)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or Config.HTTP_CACHE_PATH)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"HTTP 캐시 로드 실패 - 빈 캐시로 시작: {e}")
+            return {}
+
+    @staticmethod
+    def key(url: str, params: Optional[dict] = None) -> str:
+        """요청 URL + 정렬된 쿼리 파라미터로 캐시 키 생성"""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: str, entry: dict):
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def save(self):
+        """변경된 경우에만 임시 파일에 쓴 뒤 교체하여 저장"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False, indent=1, sort_keys=True)
+            tmp.replace(self.path)
+            self._dirty = False
+
+
+_cache: Optional[HttpCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """프로세스 전역 공유 HTTP 캐시 반환"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache()
+        return _cache
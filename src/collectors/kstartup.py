@@ -14,7 +14,9 @@
   pbanc_sn        : 공고 일련번호
 """
 import logging
-from typing import List
+from typing import AsyncIterator, Iterator, List, Tuple
+
+import requests
 
 from src.config import Config
 from src.collectors.base import BaseCollector
@@ -31,60 +33,84 @@ class KStartupCollector(BaseCollector):
 
     SOURCE_NAME = "kstartup"
 
-    def collect(self) -> List[dict]:
+    def iter_postings(self) -> Iterator[dict]:
         logger.info("K-Startup API 수집 시작")
-        postings = []
+        count = 0
+        for posting in self._fan_out(self._collect_page, per_page=Config.COLLECT_COUNT):
+            count += 1
+            yield posting
+        logger.info(f"K-Startup 수집 완료: {count}건")
+
+    async def iter_postings_async(self) -> AsyncIterator[dict]:
+        logger.info("K-Startup API 수집 시작 (async)")
+        count = 0
+        async for posting in self._fan_out_async(self._collect_page_async,
+                                                 per_page=Config.COLLECT_COUNT):
+            count += 1
+            yield posting
+        logger.info(f"K-Startup 수집 완료: {count}건")
+
+    def _collect_page(self, page: int) -> Tuple[List[dict], int]:
+        """API page 페이지 수집. (공고 리스트, 전체 건수) 반환."""
+        response = self._request(KSTARTUP_API_URL, params=self._page_params(page))
+        return self._parse_page(response, page)
+
+    async def _collect_page_async(self, page: int) -> Tuple[List[dict], int]:
+        """_collect_page()의 비동기 버전"""
+        response = await self._request_async(KSTARTUP_API_URL, params=self._page_params(page))
+        return self._parse_page(response, page)
+
+    def _page_params(self, page: int) -> dict:
+        # 모집 진행 중인 공고만 서버에서 조회 (odcloud 조건 검색 파라미터)
+        return {
+            "serviceKey": Config.KSTARTUP_API_KEY,
+            "page": page,
+            "perPage": Config.COLLECT_COUNT,
+            "returnType": "JSON",
+            "cond[rcrt_prgs_yn::EQ]": "Y",
+        }
+
+    def _parse_page(self, response: requests.Response, page: int) -> Tuple[List[dict], int]:
+        data = response.json()
+
+        total = data.get("totalCount", 0)
+        items = data.get("data", [])
+        if not isinstance(items, list):
+            items = []
+
+        logger.info(f"K-Startup API 응답: 전체 {total}건, {page}페이지 {len(items)}건")
 
-        try:
-            # 진행중인 공고만 수집 (최신순)
-            params = {
-                "serviceKey": Config.KSTARTUP_API_KEY,
-                "page": 1,
-                "perPage": Config.COLLECT_COUNT,
-                "returnType": "JSON",
-            }
-            response = self._request(KSTARTUP_API_URL, params=params)
-            data = response.json()
-
-            total = data.get("totalCount", 0)
-            items = data.get("data", [])
-            if not isinstance(items, list):
-                items = []
-
-            logger.info(f"K-Startup API 응답: 전체 {total}건, 현재 페이지 {len(items)}건")
-
-            for item in items:
-                title = (item.get("biz_pbanc_nm") or "").strip()
-                url = (item.get("detl_pg_url") or "").strip()
-                if not title:
-                    continue
-
-                # 모집 진행 중인 공고만 필터
-                if item.get("rcrt_prgs_yn") != "Y":
-                    continue
-
-                pbanc_sn = item.get("pbanc_sn", "")
-                posting_id = f"kstartup_{pbanc_sn}" if pbanc_sn else f"kstartup_{hash(title + url)}"
-
-                postings.append({
-                    "id": posting_id,
-                    "title": title,
-                    "organization": (item.get("pbanc_ntrp_nm") or "").strip(),
-                    "category": (item.get("supt_biz_clsfc") or "").strip(),
-                    "start_date": self._normalize_date(
-                        item.get("pbanc_rcpt_bgng_dt") or ""
-                    ),
-                    "end_date": self._normalize_date(
-                        item.get("pbanc_rcpt_end_dt") or ""
-                    ),
-                    "target": (item.get("aply_trgt") or "").strip(),
-                    "url": url,
-                    "summary": (item.get("pbanc_ctnt") or "").strip()[:300],
-                    "source": self.SOURCE_NAME,
-                })
-
-        except Exception as e:
-            logger.error(f"K-Startup API 수집 실패: {e}")
-
-        logger.info(f"K-Startup 수집 완료: {len(postings)}건")
-        return postings
+        postings = []
+        for item in items:
+            title = (item.get("biz_pbanc_nm") or "").strip()
+            url = (item.get("detl_pg_url") or "").strip()
+            if not title:
+                continue
+
+            # 서버 조건 검색이 무시된 경우를 대비한 확인 (정상이면 모두 Y)
+            if item.get("rcrt_prgs_yn") != "Y":
+                continue
+
+            pbanc_sn = item.get("pbanc_sn", "")
+            posting_id = f"kstartup_{pbanc_sn}" if pbanc_sn else f"kstartup_{hash(title + url)}"
+            if self._is_known(posting_id):
+                continue
+
+            postings.append({
+                "id": posting_id,
+                "title": title,
+                "organization": (item.get("pbanc_ntrp_nm") or "").strip(),
+                "category": (item.get("supt_biz_clsfc") or "").strip(),
+                "start_date": self._normalize_date(
+                    item.get("pbanc_rcpt_bgng_dt") or ""
+                ),
+                "end_date": self._normalize_date(
+                    item.get("pbanc_rcpt_end_dt") or ""
+                ),
+                "target": (item.get("aply_trgt") or "").strip(),
+                "url": url,
+                "summary": (item.get("pbanc_ctnt") or "").strip()[:300],
+                "source": self.SOURCE_NAME,
+            })
+
+        return postings, total
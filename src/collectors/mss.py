@@ -6,9 +6,7 @@
 """
 import re
 import logging
-from typing import List
-
-from bs4 import BeautifulSoup
+from typing import Iterator, List, Optional
 
 from src.collectors.base import BaseCollector
 from src.database import Database
@@ -17,70 +15,75 @@ logger = logging.getLogger(__name__)
 
 MSS_LIST_URL = "https://www.mss.go.kr/site/smba/ex/bbs/List.do"
 MSS_BASE_URL = "https://www.mss.go.kr"
+# 목록 테이블 + 대체 리스트(ul.board-list)만 파싱
+MSS_LIST_SCOPE = ["table", "ul"]
 
 
 class MssCollector(BaseCollector):
     """중소벤처기업부 사업공고 크롤링 수집기"""
 
     SOURCE_NAME = "mss"
+    ENRICH_DETAILS = True
 
-    def collect(self) -> List[dict]:
+    def iter_postings(self) -> Iterator[dict]:
         logger.info("중소벤처기업부 크롤링 수집 시작")
-        postings = []
+        count = 0
+        for posting in self._paginate(self._collect_page):
+            count += 1
+            yield posting
+        logger.info(f"중소벤처기업부 수집 완료: {count}건")
+
+    def _collect_page(self, page: int) -> Optional[List[dict]]:
+        """목록 page 페이지 수집. 항목이 없거나 변경이 없으면 None."""
+        params = {"cbIdx": 310, "pageIndex": page}
+        response = self._fetch_page(MSS_LIST_URL, params=params)
+        if response is None:
+            logger.info(f"중소벤처기업부 {page}페이지 변경 없음 - 파싱 건너뜀")
+            return None
+        if response.encoding and response.encoding.lower() == "iso-8859-1":
+            response.encoding = response.apparent_encoding
+
+        soup = self._parse_html(response.text, scope=MSS_LIST_SCOPE)
+
+        rows = soup.select("table tbody tr")
+        if not rows:
+            rows = soup.select("ul.board-list li")
+        if not rows:
+            return None
 
-        try:
-            params = {"cbIdx": 310, "pageIndex": 1}
-            response = self._request(MSS_LIST_URL, params=params)
-            if response.encoding and response.encoding.lower() == "iso-8859-1":
-                response.encoding = response.apparent_encoding
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            rows = soup.select("table tbody tr")
-            if not rows:
-                rows = soup.select("ul.board-list li")
-
-            for row in rows:
-                link = row.find("a", href=True)
-                if not link:
-                    continue
-
-                title = link.text.strip()
-                href = link.get("href", "")
-
-                if not title or len(title) < 5:
-                    continue
-
-                url = href if href.startswith("http") else MSS_BASE_URL + href
-
-                # 날짜 추출
-                dates = re.findall(r"(\d{4}[.\-]\d{2}[.\-]\d{2})", row.text)
-                start_date = self._normalize_date(dates[0]) if len(dates) >= 1 else ""
-                end_date = self._normalize_date(dates[1]) if len(dates) >= 2 else ""
-
-                postings.append({
-                    "id": Database.generate_id(title, url),
-                    "title": title,
-                    "organization": "중소벤처기업부",
-                    "category": "",
-                    "start_date": start_date,
-                    "end_date": end_date,
-                    "target": "",
-                    "url": url,
-                    "summary": "",
-                    "source": self.SOURCE_NAME,
-                })
-
-        except Exception as e:
-            logger.error(f"중소벤처기업부 크롤링 실패: {e}")
-
-        # 중복 제거
-        seen = set()
-        unique = []
-        for p in postings:
-            if p["id"] not in seen:
-                seen.add(p["id"])
-                unique.append(p)
-
-        logger.info(f"중소벤처기업부 수집 완료: {len(unique)}건")
-        return unique
+        postings = []
+        for row in rows:
+            link = row.find("a", href=True)
+            if not link:
+                continue
+
+            title = link.text.strip()
+            href = link.get("href", "")
+
+            if not title or len(title) < 5:
+                continue
+
+            url = href if href.startswith("http") else MSS_BASE_URL + href
+            posting_id = Database.generate_id(title, url)
+            if self._is_known(posting_id):
+                continue
+
+            # 날짜 추출
+            dates = re.findall(r"(\d{4}[.\-]\d{2}[.\-]\d{2})", row.text)
+            start_date = self._normalize_date(dates[0]) if len(dates) >= 1 else ""
+            end_date = self._normalize_date(dates[1]) if len(dates) >= 2 else ""
+
+            postings.append({
+                "id": posting_id,
+                "title": title,
+                "organization": "중소벤처기업부",
+                "category": "",
+                "start_date": start_date,
+                "end_date": end_date,
+                "target": "",
+                "url": url,
+                "summary": "",
+                "source": self.SOURCE_NAME,
+            })
+
+        return postings
@@ -6,9 +6,7 @@ NIPA: ICT/SW 분야 스타트업 지원 전문기관
 """
 import re
 import logging
-from typing import List
-
-from bs4 import BeautifulSoup
+from typing import Iterator
 
 from src.collectors.base import BaseCollector
 from src.database import Database
@@ -17,23 +15,29 @@ logger = logging.getLogger(__name__)
 
 NIPA_LIST_URL = "https://www.nipa.kr/home/2-2"
 NIPA_BASE_URL = "https://www.nipa.kr"
+# 목록 테이블 + 대체 리스트(ul.board-list, div.list-item)만 파싱
+NIPA_LIST_SCOPE = ["table", "ul", "div"]
 
 
 class NipaCollector(BaseCollector):
     """NIPA 사업공고 크롤링 수집기"""
 
     SOURCE_NAME = "nipa"
+    ENRICH_DETAILS = True
 
-    def collect(self) -> List[dict]:
+    def iter_postings(self) -> Iterator[dict]:
         logger.info("NIPA 크롤링 수집 시작")
-        postings = []
+        count = 0
 
         try:
-            response = self._request(NIPA_LIST_URL)
+            response = self._fetch_page(NIPA_LIST_URL)
+            if response is None:
+                logger.info("NIPA 목록 변경 없음 - 파싱 건너뜀")
+                return
             if response.encoding and response.encoding.lower() == "iso-8859-1":
                 response.encoding = response.apparent_encoding
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = self._parse_html(response.text, scope=NIPA_LIST_SCOPE)
 
             # 게시판 목록에서 공고 링크 추출
             rows = soup.select("table tbody tr")
@@ -53,12 +57,16 @@ class NipaCollector(BaseCollector):
                     continue
 
                 url = href if href.startswith("http") else NIPA_BASE_URL + href
+                posting_id = Database.generate_id(title, url)
+                if self._is_known(posting_id):
+                    continue
 
                 # 날짜 추출
                 date_match = re.search(r"(\d{4}[.\-]\d{2}[.\-]\d{2})", row.text)
 
-                postings.append({
-                    "id": Database.generate_id(title, url),
+                count += 1
+                yield {
+                    "id": posting_id,
                     "title": title,
                     "organization": "정보통신산업진흥원(NIPA)",
                     "category": "ICT/SW",
@@ -68,18 +76,12 @@ class NipaCollector(BaseCollector):
                     "url": url,
                     "summary": "",
                     "source": self.SOURCE_NAME,
-                })
+                }
+
+            # 목록 행을 모두 내보낸 뒤에 조건부 요청 캐시 기록
+            self._commit_page_cache()
 
         except Exception as e:
             logger.error(f"NIPA 크롤링 실패: {e}")
 
-        # 중복 제거
-        seen = set()
-        unique = []
-        for p in postings:
-            if p["id"] not in seen:
-                seen.add(p["id"])
-                unique.append(p)
-
-        logger.info(f"NIPA 수집 완료: {len(unique)}건")
-        return unique
+        logger.info(f"NIPA 수집 완료: {count}건")
@@ -6,7 +6,9 @@
 """
 import logging
 import urllib.parse
-from typing import List
+from typing import AsyncIterator, Iterator, List, Tuple
+
+import requests
 
 from src.config import Config
 from src.collectors.base import BaseCollector
@@ -22,56 +24,79 @@ class SmesCollector(BaseCollector):
 
     SOURCE_NAME = "smes24"
 
-    def collect(self) -> List[dict]:
+    def iter_postings(self) -> Iterator[dict]:
         logger.info("중소벤처24 API 수집 시작")
-        postings = []
+        count = 0
+        for posting in self._fan_out(self._collect_page, per_page=Config.COLLECT_COUNT):
+            count += 1
+            yield posting
+        logger.info(f"중소벤처24 수집 완료: {count}건")
+
+    async def iter_postings_async(self) -> AsyncIterator[dict]:
+        logger.info("중소벤처24 API 수집 시작 (async)")
+        count = 0
+        async for posting in self._fan_out_async(self._collect_page_async,
+                                                 per_page=Config.COLLECT_COUNT):
+            count += 1
+            yield posting
+        logger.info(f"중소벤처24 수집 완료: {count}건")
+
+    def _collect_page(self, page: int) -> Tuple[List[dict], int]:
+        """API page 페이지 수집. (공고 리스트, 전체 건수) 반환."""
+        response = self._request(SMES_API_URL, params=self._page_params(page))
+        return self._parse_page(response)
+
+    async def _collect_page_async(self, page: int) -> Tuple[List[dict], int]:
+        """_collect_page()의 비동기 버전"""
+        response = await self._request_async(SMES_API_URL, params=self._page_params(page))
+        return self._parse_page(response)
+
+    def _page_params(self, page: int) -> dict:
+        # data.go.kr Encoding 키는 이미 URL 인코딩되어 있으므로
+        # 디코딩 후 params에 전달 (requests가 다시 인코딩함)
+        decoded_key = urllib.parse.unquote(Config.SMES_API_KEY)
+        return {
+            "serviceKey": decoded_key,
+            "pageNo": page,
+            "numOfRows": Config.COLLECT_COUNT,
+            "type": "json",
+        }
+
+    def _parse_page(self, response: requests.Response) -> Tuple[List[dict], int]:
+        data = response.json()
+
+        body = data.get("response", {}).get("body", {})
+        total = int(body.get("totalCount") or 0)
+        items = body.get("items", {})
+
+        if isinstance(items, dict):
+            items = items.get("item", [])
+        if isinstance(items, dict):
+            items = [items]
+        if not isinstance(items, list):
+            items = []
 
-        try:
-            # data.go.kr Encoding 키는 이미 URL 인코딩되어 있으므로
-            # 디코딩 후 params에 전달 (requests가 다시 인코딩함)
-            decoded_key = urllib.parse.unquote(Config.SMES_API_KEY)
-
-            params = {
-                "serviceKey": decoded_key,
-                "pageNo": 1,
-                "numOfRows": Config.COLLECT_COUNT,
-                "type": "json",
-            }
-
-            response = self._request(SMES_API_URL, params=params)
-            data = response.json()
-
-            body = data.get("response", {}).get("body", {})
-            items = body.get("items", {})
-
-            if isinstance(items, dict):
-                items = items.get("item", [])
-            if isinstance(items, dict):
-                items = [items]
-            if not isinstance(items, list):
-                items = []
-
-            for item in items:
-                title = item.get("anncNm", "").strip()
-                url = item.get("anncUrl", "").strip()
-                if not title:
-                    continue
-
-                postings.append({
-                    "id": item.get("anncId") or Database.generate_id(title, url),
-                    "title": title,
-                    "organization": item.get("cntcInsttNm", "").strip(),
-                    "category": item.get("anncClssNm", "").strip(),
-                    "start_date": self._normalize_date(item.get("rcptBgngDt", "")),
-                    "end_date": self._normalize_date(item.get("rcptEndDt", "")),
-                    "target": item.get("trgtNm", "").strip(),
-                    "url": url,
-                    "summary": item.get("anncSumry", "").strip(),
-                    "source": self.SOURCE_NAME,
-                })
-
-        except Exception as e:
-            logger.error(f"중소벤처24 API 수집 실패: {e}")
-
-        logger.info(f"중소벤처24 수집 완료: {len(postings)}건")
-        return postings
+        postings = []
+        for item in items:
+            title = item.get("anncNm", "").strip()
+            url = item.get("anncUrl", "").strip()
+            if not title:
+                continue
+            posting_id = item.get("anncId") or Database.generate_id(title, url)
+            if self._is_known(posting_id):
+                continue
+
+            postings.append({
+                "id": posting_id,
+                "title": title,
+                "organization": item.get("cntcInsttNm", "").strip(),
+                "category": item.get("anncClssNm", "").strip(),
+                "start_date": self._normalize_date(item.get("rcptBgngDt", "")),
+                "end_date": self._normalize_date(item.get("rcptEndDt", "")),
+                "target": item.get("trgtNm", "").strip(),
+                "url": url,
+                "summary": item.get("anncSumry", "").strip(),
+                "source": self.SOURCE_NAME,
+            })
+
+        return postings, total
@@ -6,9 +6,7 @@ THE VC: 한국 스타트업 투자 데이터베이스
 """
 import re
 import logging
-from typing import List
-
-from bs4 import BeautifulSoup
+from typing import Iterator
 
 from src.collectors.base import BaseCollector
 from src.database import Database
@@ -23,14 +21,19 @@ class TheVCCollector(BaseCollector):
     """THE VC 지원사업 크롤링 수집기"""
 
     SOURCE_NAME = "thevc"
+    ENRICH_DETAILS = True
 
-    def collect(self) -> List[dict]:
+    def iter_postings(self) -> Iterator[dict]:
         logger.info("THE VC 크롤링 수집 시작")
-        postings = []
+        count = 0
 
         try:
-            response = self._request(THEVC_GRANTS_URL)
-            soup = BeautifulSoup(response.text, "html.parser")
+            response = self._fetch_page(THEVC_GRANTS_URL)
+            if response is None:
+                logger.info("THE VC 목록 변경 없음 - 파싱 건너뜀")
+                return
+            # 카드의 부모 요소 텍스트(D-day, 기관명)를 쓰므로 전체 트리를 파싱
+            soup = self._parse_html(response.text)
 
             # 공고 카드/리스트 항목 추출
             items = soup.select("a[href*='/grants/']")
@@ -45,6 +48,9 @@ class TheVCCollector(BaseCollector):
                     continue
 
                 url = href if href.startswith("http") else THEVC_BASE_URL + href
+                posting_id = Database.generate_id(title, url)
+                if self._is_known(posting_id):
+                    continue
 
                 # 부모 요소에서 추가 정보 추출
                 parent = item.parent
@@ -60,8 +66,9 @@ class TheVCCollector(BaseCollector):
                 if d_match:
                     d_day = f"D-{d_match.group(1)}"
 
-                postings.append({
-                    "id": Database.generate_id(title, url),
+                count += 1
+                yield {
+                    "id": posting_id,
                     "title": title,
                     "organization": org,
                     "category": "",
@@ -71,18 +78,12 @@ class TheVCCollector(BaseCollector):
                     "url": url,
                     "summary": "",
                     "source": self.SOURCE_NAME,
-                })
+                }
+
+            # 목록 행을 모두 내보낸 뒤에 조건부 요청 캐시 기록
+            self._commit_page_cache()
 
         except Exception as e:
             logger.error(f"THE VC 크롤링 실패: {e}")
 
-        # 중복 제거
-        seen = set()
-        unique = []
-        for p in postings:
-            if p["id"] not in seen:
-                seen.add(p["id"])
-                unique.append(p)
-
-        logger.info(f"THE VC 수집 완료: {len(unique)}건")
-        return unique
+        logger.info(f"THE VC 수집 완료: {count}건")
@@ -6,9 +6,7 @@ TIPS: 민간투자 주도형 기술창업 지원 프로그램
 """
 import re
 import logging
-from typing import List
-
-from bs4 import BeautifulSoup
+from typing import Iterator, List, Optional
 
 from src.collectors.base import BaseCollector
 from src.database import Database
@@ -17,58 +15,67 @@ logger = logging.getLogger(__name__)
 
 TIPS_LIST_URL = "https://www.jointips.or.kr/bbs/board.php"
 TIPS_BASE_URL = "https://www.jointips.or.kr"
+# 게시글 링크(a 태그)만 파싱
+TIPS_LIST_SCOPE = ["a"]
 
 
 class TipsCollector(BaseCollector):
     """TIPS 공고 크롤링 수집기"""
 
     SOURCE_NAME = "tips"
+    ENRICH_DETAILS = True
 
-    def collect(self) -> List[dict]:
+    def iter_postings(self) -> Iterator[dict]:
         logger.info("TIPS 크롤링 수집 시작")
-        postings = []
+        count = 0
 
         for bo_table in ["notice", "news"]:
-            try:
-                params = {"bo_table": bo_table, "page": 1}
-                response = self._request(TIPS_LIST_URL, params=params)
-                if response.encoding and response.encoding.lower() == "iso-8859-1":
-                    response.encoding = response.apparent_encoding
-
-                soup = BeautifulSoup(response.text, "html.parser")
-                links = soup.find_all("a", href=re.compile(r"wr_id=\d+"))
-
-                for link in links:
-                    title = link.text.strip()
-                    href = link.get("href", "")
-                    if not title or len(title) < 5:
-                        continue
-
-                    url = href if href.startswith("http") else TIPS_BASE_URL + href
-
-                    postings.append({
-                        "id": Database.generate_id(title, url),
-                        "title": title,
-                        "organization": "TIPS (창업진흥원)",
-                        "category": "TIPS",
-                        "start_date": "",
-                        "end_date": "",
-                        "target": "",
-                        "url": url,
-                        "summary": "",
-                        "source": self.SOURCE_NAME,
-                    })
-
-            except Exception as e:
-                logger.error(f"TIPS {bo_table} 크롤링 실패: {e}")
-
-        # 중복 제거
-        seen = set()
-        unique = []
-        for p in postings:
-            if p["id"] not in seen:
-                seen.add(p["id"])
-                unique.append(p)
-
-        logger.info(f"TIPS 수집 완료: {len(unique)}건")
-        return unique
+            for posting in self._paginate(
+                lambda page, bo_table=bo_table: self._collect_page(bo_table, page)
+            ):
+                count += 1
+                yield posting
+
+        logger.info(f"TIPS 수집 완료: {count}건")
+
+    def _collect_page(self, bo_table: str, page: int) -> Optional[List[dict]]:
+        """게시판 bo_table의 page 페이지 수집. 항목이 없거나 변경이 없으면 None."""
+        params = {"bo_table": bo_table, "page": page}
+        response = self._fetch_page(TIPS_LIST_URL, params=params)
+        if response is None:
+            logger.info(f"TIPS {bo_table} {page}페이지 변경 없음 - 파싱 건너뜀")
+            return None
+        if response.encoding and response.encoding.lower() == "iso-8859-1":
+            response.encoding = response.apparent_encoding
+
+        soup = self._parse_html(response.text, scope=TIPS_LIST_SCOPE)
+        links = soup.find_all("a", href=re.compile(r"wr_id=\d+"))
+        if not links:
+            return None
+
+        postings = []
+        for link in links:
+            title = link.text.strip()
+            href = link.get("href", "")
+            if not title or len(title) < 5:
+                continue
+
+            url = href if href.startswith("http") else TIPS_BASE_URL + href
+            posting_id = Database.generate_id(title, url)
+            if self._is_known(posting_id):
+                continue
+
+            postings.append({
+                "id": posting_id,
+                "title": title,
+                "organization": "TIPS (창업진흥원)",
+                "category": "TIPS",
+                "start_date": "",
+                "end_date": "",
+                "target": "",
+                "url": url,
+                "summary": "",
+                "source": self.SOURCE_NAME,
+            })
+
+        return postings
@@ -9,10 +9,12 @@ load_dotenv(_project_root / ".env")
 
 
 class Config:
+    # .env.example을 그대로 복사하면 값이 빈 항목(KEY=)도 빈 문자열로 설정되므로
+    # 기본값은 os.getenv(KEY, 기본값)이 아니라 `os.getenv(KEY) or 기본값`으로 적용
     # Slack
     SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL", "")
     SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN", "")
-    SLACK_CHANNEL = os.getenv("SLACK_CHANNEL", "series_a")
+    SLACK_CHANNEL = os.getenv("SLACK_CHANNEL") or "series_a"
 
     # API Keys (공공데이터포털 data.go.kr)
     BIZINFO_API_KEY = os.getenv("BIZINFO_API_KEY", "")
@@ -20,11 +22,78 @@ class Config:
     KSTARTUP_API_KEY = os.getenv("KSTARTUP_API_KEY", "")
 
     # Database
-    DB_PATH = os.getenv("DB_PATH", str(_project_root / "data" / "postings.db"))
+    DB_PATH = os.getenv("DB_PATH") or str(_project_root / "data" / "postings.db")
+    # SQLite 저장소 설정
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE") or "WAL"
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS") or "NORMAL"
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE") or 256 * 1024 * 1024)
+    SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB") or "65536")
+    # 실행 내내 메모리 DB에서 작업하고 종료 시 원자적으로 파일에 기록
+    DB_IN_MEMORY = (os.getenv("DB_IN_MEMORY") or "false").lower() == "true"
+    # 저장 방식: sqlite (DB 파일) / delta (압축 델타 로그 + 주기적 스냅샷)
+    # 저장소에 커밋되는 수집 이력은 data/delta뿐이다 (.env.example / GitHub Actions는 delta).
+    # 코드 기본값 sqlite는 DB 파일을 직접 지정하는 테스트/벤치마크용
+    DB_STORAGE = (os.getenv("DB_STORAGE") or "sqlite").lower()
+    DELTA_DIR = os.getenv("DELTA_DIR") or str(_project_root / "data" / "delta")
+    DELTA_SNAPSHOT_EVERY = int(os.getenv("DELTA_SNAPSHOT_EVERY") or "30")
+    # 목록 페이지 조건부 요청 캐시 (ETag / Last-Modified / 본문 해시)
+    HTTP_CACHE_ENABLED = (os.getenv("HTTP_CACHE_ENABLED") or "true").lower() == "true"
+    HTTP_CACHE_PATH = (
+        os.getenv("HTTP_CACHE_PATH") or str(_project_root / "data" / "http_cache.json")
+    )
 
     # Collection
-    COLLECT_COUNT = int(os.getenv("COLLECT_COUNT", "50"))
-    REQUEST_DELAY = float(os.getenv("REQUEST_DELAY", "1.0"))
+    COLLECT_COUNT = int(os.getenv("COLLECT_COUNT") or "50")
+    # 페이지네이션 최대 깊이 (이미 수집한 공고만 있는 페이지를 만나면 그 전에 중단)
+    MAX_PAGES = int(os.getenv("MAX_PAGES") or "5")
+    # API 수집기(totalCount 제공): 첫 페이지의 전체 건수로 나머지 페이지를 동시 요청
+    API_MAX_PAGES = int(os.getenv("API_MAX_PAGES") or "20")
+    API_PAGE_WORKERS = int(os.getenv("API_PAGE_WORKERS") or "4")
+    REQUEST_DELAY = float(os.getenv("REQUEST_DELAY") or "1.0")
+    # 호스트별 요청 속도 제한 (초당 요청 수, 미설정 시 REQUEST_DELAY 기준)
+    RATE_LIMIT_RPS = float(os.getenv("RATE_LIMIT_RPS") or "0") or (
+        1.0 / REQUEST_DELAY if REQUEST_DELAY > 0 else 0.0
+    )
+    RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST") or "2")
+    # 호스트별 개별 설정 (예: "apis.data.go.kr=2:4,www.mss.go.kr=0.5")
+    RATE_LIMIT_HOSTS = os.getenv("RATE_LIMIT_HOSTS", "")
+    # 동시에 실행할 수집기 수 (1이면 순차 실행)
+    COLLECT_WORKERS = int(os.getenv("COLLECT_WORKERS") or "4")
+    # 수집 스트림을 DB에 저장하는 배치 크기
+    INSERT_BATCH_SIZE = int(os.getenv("INSERT_BATCH_SIZE") or "200")
+    # 기존 공고 변경 추적: 목록에 다시 나온 기존 공고도 레코드를 만들어 내용 해시가 바뀐 행만 갱신.
+    # 켜면 수집기의 기존 행 파싱 생략(skip_known_rows)이 꺼진다. 페이지 조기 중단은 그대로라
+    # 요청 수는 같고 읽은 페이지의 기존 행 파싱 비용만 늘어나므로, 마감 연장 반영을 위해 기본값은 켬
+    TRACK_UPDATES = (os.getenv("TRACK_UPDATES") or "true").lower() == "true"
+    # 수집 엔진: thread (스레드 풀) / async (asyncio 이벤트 루프, aiohttp 설치 시 사용)
+    COLLECT_ENGINE = (os.getenv("COLLECT_ENGINE") or "thread").lower()
+    # 소스별 서킷 브레이커: 연속 실패 N회 이상이면 쿨다운 동안 건너뛰고, 이후 탐침 1회로 복구 확인
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD") or "3")
+    CIRCUIT_COOLDOWN_HOURS = float(os.getenv("CIRCUIT_COOLDOWN_HOURS") or "72")
+    CIRCUIT_PROBE_TIMEOUT = float(os.getenv("CIRCUIT_PROBE_TIMEOUT") or "10")
+    # 신규 공고 상세 페이지 보강 (지원대상/요약이 빈 크롤링 소스)
+    ENRICH_ENABLED = (os.getenv("ENRICH_ENABLED") or "true").lower() == "true"
+    ENRICH_WORKERS = int(os.getenv("ENRICH_WORKERS") or "4")
+    ENRICH_MAX = int(os.getenv("ENRICH_MAX") or "100")
+    # HTTP 응답 녹화/재생: off / record / replay (오프라인 회귀 테스트, 벤치마크용)
+    HTTP_CASSETTE_MODE = (os.getenv("HTTP_CASSETTE_MODE") or "off").lower()
+    HTTP_CASSETTE_DIR = (
+        os.getenv("HTTP_CASSETTE_DIR") or str(_project_root / "tests" / "cassettes")
+    )
+    # 목록 페이지 HTML 파서: auto (lxml 설치 시 lxml) / html.parser / lxml / selectolax
+    HTML_PARSER = os.getenv("HTML_PARSER") or "auto"
+    # 공유 HTTP 연결 풀 크기 (호스트당)
+    HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE") or "10")
+
+    # Run deadline (GitHub Actions timeout-minutes: 10 → 체크아웃/설치/DB 커밋 시간 제외)
+    RUN_DEADLINE_SECONDS = float(os.getenv("RUN_DEADLINE_SECONDS") or "480")
+    # 수집이 늦어져도 알림 전송에 남겨 둘 시간
+    DELIVERY_RESERVE_SECONDS = float(os.getenv("DELIVERY_RESERVE_SECONDS") or "60")
+
+    # 소스 간 중복 공고 묶기 (제목 MinHash 유사도 기준, 최근 N일 공고와 비교)
+    DEDUP_ENABLED = (os.getenv("DEDUP_ENABLED") or "true").lower() == "true"
+    DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD") or "0.6")
+    DEDUP_WINDOW_DAYS = int(os.getenv("DEDUP_WINDOW_DAYS") or "90")
 
     # Filters
     FILTER_CATEGORIES = [
@@ -33,3 +102,5 @@ class Config:
     FILTER_KEYWORDS = [
         k.strip() for k in os.getenv("FILTER_KEYWORDS", "").split(",") if k.strip()
     ]
+    # 팀별 필터 프로필 파일 (키워드 / 허용 지역 / 채널, 미설정 시 기본 규칙 + SLACK_CHANNEL)
+    FILTER_PROFILES_PATH = os.getenv("FILTER_PROFILES_PATH", "")
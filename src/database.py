@@ -1,20 +1,123 @@
 """SQLite 데이터베이스 관리 모듈"""
+import os
+import json
 import sqlite3
 import hashlib
-from datetime import datetime
+import tempfile
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 from src.config import Config
+from src.periods import KIND_DDAY, normalize_posting_dates, today_epoch_day
+from src.delta_store import DeltaStore
+from src.id_index import IdIndex
+
+# INSERT ... RETURNING 지원 여부 (SQLite 3.35+)
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+# 다중 행 INSERT 1회당 행 수 (15컬럼 x 500행 = 바인딩 변수 7500개, 기본 한도 32766 이하)
+BULK_INSERT_CHUNK = 500
+_POSTING_COLUMNS = (
+    "id, title, organization, category, start_date, end_date, "
+    "target, url, summary, source, collected_at, start_day, end_day, end_kind, content_hash"
+)
+_POSTING_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+# 변경 감지 대상 필드 (id = 제목+URL 해시이고 출처는 고정이므로 나머지 내용 필드)
+CONTENT_FIELDS = ("organization", "category", "start_date", "end_date", "target", "summary")
+# 전문 검색 토크나이저 우선순위 (trigram은 SQLite 3.34+)
+FTS_TOKENIZERS = ("trigram", "unicode61")
+# trigram 인덱스로 찾을 수 있는 최소 검색어 길이 (더 짧으면 LIKE로 조건 추가)
+FTS_MIN_TERM_LENGTH = 3
+
+
+def content_hash(posting: dict) -> str:
+    """내용 필드 해시 (normalize_posting_dates를 거친 dict 기준)
+
+    D-N 마감일은 표기가 매일 바뀌므로(D-10 → D-9) 환산한 마감일(end_day)로 해시한다.
+    """
+    values = []
+    for field in CONTENT_FIELDS:
+        if field == "end_date" and posting.get("end_kind") == KIND_DDAY:
+            values.append(f"D@{posting['end_day']}")
+        else:
+            values.append(posting.get(field) or "")
+    return hashlib.blake2b("\x1f".join(values).encode(), digest_size=8).hexdigest()
 
 
 class Database:
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, in_memory: Optional[bool] = None,
+                 storage: Optional[str] = None, delta_dir: Optional[str] = None,
+                 read_only: bool = False):
+        """
+        in_memory가 True이면 DB 파일을 메모리로 복사해 실행 내내 메모리에서 작업하고,
+        close() 시점에 backup API로 임시 파일에 쓴 뒤 원자적으로 교체한다.
+        실행이 중간에 강제 종료되면 디스크의 DB 파일은 실행 전 상태 그대로 남는다.
+
+        read_only이면 조회 전용 (검색/백테스트 CLI): DB 파일을 읽기 전용(mode=ro)으로 열어
+        저널 모드 변경, 스키마 생성, 파생 컬럼/FTS 백필을 하지 않고, close()도 저장하지 않는다.
+        메모리/델타 모드에서는 평소처럼 메모리로 적재하되 close()에서 저장하지 않는다.
+        """
+        self.read_only = read_only
         self.db_path = db_path or Config.DB_PATH
+        self.in_memory = Config.DB_IN_MEMORY if in_memory is None else in_memory
+        # storage=delta: DB 파일 대신 압축 델타 로그(src.delta_store)에서 적재/저장
+        self.delta_store: Optional[DeltaStore] = (
+            DeltaStore(delta_dir) if (storage or Config.DB_STORAGE) == "delta" else None
+        )
+        if self.delta_store is not None:
+            self.in_memory = True
+        if read_only and not self.in_memory:
+            self.conn = sqlite3.connect(
+                f"{Path(self.db_path).resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+            self.conn.row_factory = sqlite3.Row
+            self._lock = threading.RLock()
+            self.id_index: Optional[IdIndex] = None
+            self._apply_pragmas()
+            self.has_fts = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'postings_fts'"
+            ).fetchone() is not None
+            return
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(self.db_path)
+        # 수집기 스레드의 기존 ID 조회(find_existing_ids)와 메인 스레드의 배치 저장이
+        # 동시에 일어나므로 연결은 공유하되 Lock으로 직렬화
+        if self.in_memory:
+            self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+            # 델타 로그가 아직 없으면 기존 DB 파일에서 시작 (첫 저장 시 스냅샷 생성)
+            bootstrap = self.delta_store is None or not self.delta_store.exists()
+            if bootstrap and Path(self.db_path).exists():
+                disk = sqlite3.connect(self.db_path)
+                disk.backup(self.conn)
+                disk.close()
+        else:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        # load_id_index()로 적재한 기존 ID 인덱스 (insert_postings_bulk가 신규 ID를 추가)
+        self.id_index: Optional[IdIndex] = None
+        self._apply_pragmas()
         self._create_tables()
+        if self.delta_store is not None and self.delta_store.exists():
+            self.delta_store.load(self.conn)
+            # 마감일/해시 컬럼 추가 전에 기록된 델타 행
+            self._backfill_derived_columns()
+            self.delta_store.mark_baseline(self.conn)
+
+    def _apply_pragmas(self):
+        """저장소 성능 설정 (WAL, 동기화 수준, mmap, 페이지 캐시)"""
+        if self.read_only and not self.in_memory:
+            # journal_mode 변경은 DB 파일에 기록되므로 읽기 전용 연결에서는 생략
+            self.conn.execute(f"PRAGMA mmap_size={Config.SQLITE_MMAP_SIZE}")
+        elif not self.in_memory:
+            self.conn.execute(f"PRAGMA journal_mode={Config.SQLITE_JOURNAL_MODE}")
+            self.conn.execute(f"PRAGMA synchronous={Config.SQLITE_SYNCHRONOUS}")
+            self.conn.execute(f"PRAGMA mmap_size={Config.SQLITE_MMAP_SIZE}")
+        # 음수는 KiB 단위
+        self.conn.execute(f"PRAGMA cache_size=-{Config.SQLITE_CACHE_SIZE_KB}")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        # INSERT OR REPLACE(델타 적재)로 지워지는 행에도 DELETE 트리거(FTS 동기화)가 실행되도록
+        self.conn.execute("PRAGMA recursive_triggers=ON")
 
     def _create_tables(self):
         self.conn.executescript("""
@@ -45,7 +148,138 @@ class Database:
                 sent_count INTEGER NOT NULL,
                 sent_at TEXT NOT NULL
             );
+
+            CREATE TABLE IF NOT EXISTS source_health (
+                source TEXT PRIMARY KEY,
+                consecutive_failures INTEGER NOT NULL DEFAULT 0,
+                last_success_at TEXT,
+                last_failure_at TEXT,
+                last_error TEXT
+            );
+
+            CREATE TABLE IF NOT EXISTS detail_pages (
+                url TEXT PRIMARY KEY,
+                target TEXT,
+                summary TEXT,
+                fetched_at TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS posting_signatures (
+                id TEXT PRIMARY KEY,
+                signature BLOB NOT NULL
+            );
+        """)
+        # 기존 DB 파일에 나중에 추가된 컬럼
+        self._ensure_columns("postings", {
+            "cluster_id": "TEXT",
+            # 신청 기간을 epoch-day 정수로 정규화한 값 (src.periods)
+            "start_day": "INTEGER",
+            "end_day": "INTEGER",
+            "end_kind": "TEXT",
+            # 내용 필드 해시 (upsert_postings_bulk가 바뀐 행만 다시 쓰는 기준)
+            "content_hash": "TEXT",
+            "updated_at": "TEXT",
+        })
+        self.conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_postings_cluster ON postings(cluster_id);
+            CREATE INDEX IF NOT EXISTS idx_postings_end_day ON postings(end_day);
+            CREATE INDEX IF NOT EXISTS idx_postings_updated ON postings(updated_at);
+
+            CREATE TABLE IF NOT EXISTS posting_changes (
+                id INTEGER PRIMARY KEY,
+                posting_id TEXT NOT NULL,
+                changed_at TEXT NOT NULL,
+                previous TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_posting_changes_posting
+                ON posting_changes(posting_id);
+
+            CREATE TABLE IF NOT EXISTS filter_verdicts (
+                posting_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                keyword_version TEXT NOT NULL,
+                region_version TEXT,
+                matched_keywords TEXT NOT NULL,
+                excluded_stage TEXT,
+                excluded_reason TEXT,
+                evaluated_at TEXT NOT NULL
+            );
         """)
+        self._backfill_derived_columns()
+        self.has_fts = self._create_fts()
+        self.conn.commit()
+
+    def _create_fts(self) -> bool:
+        """제목/기관/지원대상/요약 전문 검색 인덱스 (FTS5 external content + 동기화 트리거)
+
+        한국어는 공백 단위 토큰화가 맞지 않으므로 trigram 토크나이저(SQLite 3.34+)를 쓰고,
+        없으면 unicode61로 대체한다. FTS5가 없는 SQLite에서는 False (검색은 LIKE로 동작).
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'postings_fts'"
+        ).fetchone()
+        if not exists:
+            for tokenizer in FTS_TOKENIZERS:
+                try:
+                    self.conn.execute(f"""
+                        CREATE VIRTUAL TABLE postings_fts USING fts5(
+                            title, organization, target, summary,
+                            content='postings', content_rowid='rowid', tokenize='{tokenizer}'
+                        )
+                    """)
+                    break
+                except sqlite3.OperationalError:
+                    continue
+            else:
+                return False
+            # 기존 행 색인
+            self.conn.execute("INSERT INTO postings_fts(postings_fts) VALUES ('rebuild')")
+
+        self.conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS postings_fts_ai AFTER INSERT ON postings BEGIN
+                INSERT INTO postings_fts(rowid, title, organization, target, summary)
+                VALUES (new.rowid, new.title, new.organization, new.target, new.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS postings_fts_ad AFTER DELETE ON postings BEGIN
+                INSERT INTO postings_fts(postings_fts, rowid, title, organization, target, summary)
+                VALUES ('delete', old.rowid, old.title, old.organization, old.target, old.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS postings_fts_au
+            AFTER UPDATE OF title, organization, target, summary ON postings BEGIN
+                INSERT INTO postings_fts(postings_fts, rowid, title, organization, target, summary)
+                VALUES ('delete', old.rowid, old.title, old.organization, old.target, old.summary);
+                INSERT INTO postings_fts(rowid, title, organization, target, summary)
+                VALUES (new.rowid, new.title, new.organization, new.target, new.summary);
+            END;
+        """)
+        return True
+
+    def _ensure_columns(self, table: str, columns: Dict[str, str]):
+        """테이블에 없는 컬럼을 ALTER TABLE로 추가 (저장소에 커밋된 예전 DB 호환)"""
+        existing = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+        for name, decl in columns.items():
+            if name not in existing:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+
+    def _backfill_derived_columns(self):
+        """정규화/해시 컬럼이 비어 있는 (컬럼 추가 이전에 저장된) 행 채우기"""
+        rows = self.conn.execute(f"""
+            SELECT id, {', '.join(CONTENT_FIELDS)}, collected_at FROM postings
+            WHERE end_kind IS NULL OR content_hash IS NULL
+        """).fetchall()
+        if not rows:
+            return
+        updates = []
+        for row in rows:
+            posting = normalize_posting_dates(dict(row), row["collected_at"])
+            updates.append((
+                posting["start_day"], posting["end_day"], posting["end_kind"],
+                content_hash(posting), row["id"],
+            ))
+        self.conn.executemany("""
+            UPDATE postings SET start_day = ?, end_day = ?, end_kind = ?, content_hash = ?
+            WHERE id = ?
+        """, updates)
         self.conn.commit()
 
     @staticmethod
@@ -55,16 +289,12 @@ class Database:
 
     def insert_posting(self, posting: dict) -> bool:
         """공고 삽입. 신규이면 True, 중복이면 False 반환."""
-        cursor = self.conn.execute("SELECT 1 FROM postings WHERE id = ?", (posting["id"],))
-        if cursor.fetchone():
-            return False
-
-        self.conn.execute("""
-            INSERT INTO postings
-            (id, title, organization, category, start_date, end_date,
-             target, url, summary, source, collected_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return bool(self.insert_postings_bulk([posting]))
+
+    @staticmethod
+    def _posting_row(posting: dict, collected_at: str) -> tuple:
+        normalize_posting_dates(posting, collected_at)
+        return (
             posting["id"],
             posting["title"],
             posting.get("organization", ""),
@@ -75,10 +305,370 @@ class Database:
             posting.get("url", ""),
             posting.get("summary", ""),
             posting.get("source", ""),
-            datetime.now().isoformat(),
-        ))
+            collected_at,
+            posting["start_day"],
+            posting["end_day"],
+            posting["end_kind"],
+            content_hash(posting),
+        )
+
+    def insert_postings_bulk(self, postings: List[dict]) -> List[str]:
+        """공고 여러 건을 한 트랜잭션으로 삽입하고 새로 저장된 ID 목록 반환 (입력 순서)
+
+        SQLite 3.35 이상은 INSERT ... ON CONFLICT DO NOTHING RETURNING 으로
+        실제 삽입된 행만 돌려받으므로 사전 조회가 필요 없다.
+        그보다 오래된 SQLite는 기존 ID를 IN 절로 조회한 뒤 INSERT OR IGNORE 한다.
+        """
+        if not postings:
+            return []
+        now = datetime.now().isoformat()
+        with self._lock:
+            if HAS_RETURNING:
+                inserted = set()
+                for i in range(0, len(postings), BULK_INSERT_CHUNK):
+                    chunk = postings[i:i + BULK_INSERT_CHUNK]
+                    values = ",".join([_POSTING_PLACEHOLDERS] * len(chunk))
+                    params = [v for p in chunk for v in self._posting_row(p, now)]
+                    cursor = self.conn.execute(f"""
+                        INSERT INTO postings ({_POSTING_COLUMNS})
+                        VALUES {values}
+                        ON CONFLICT(id) DO NOTHING
+                        RETURNING id
+                    """, params)
+                    inserted.update(row[0] for row in cursor.fetchall())
+            else:
+                existing = self.find_existing_ids(p["id"] for p in postings)
+                inserted = {p["id"] for p in postings} - existing
+                self.conn.executemany(f"""
+                    INSERT OR IGNORE INTO postings ({_POSTING_COLUMNS})
+                    VALUES {_POSTING_PLACEHOLDERS}
+                """, (self._posting_row(p, now) for p in postings if p["id"] in inserted))
+            self.conn.commit()
+
+        new_ids = []
+        for posting in postings:
+            if posting["id"] in inserted:
+                inserted.discard(posting["id"])
+                new_ids.append(posting["id"])
+        if self.id_index is not None:
+            self.id_index.update(new_ids)
+        return new_ids
+
+    def upsert_postings_bulk(self, postings: List[dict]) -> Tuple[List[str], List[str]]:
+        """신규 공고는 삽입하고, 기존 공고는 내용 해시가 바뀐 행만 갱신 → (신규 ID, 갱신 ID)
+
+        목록 페이지의 빈 필드(상세 페이지에서 보강한 지원대상/요약 등)는 기존 값을 지우지 않는다.
+        갱신된 행은 updated_at을 남기고, 바뀐 필드의 이전 값을 posting_changes에 기록한다.
+        """
+        new_ids = self.insert_postings_bulk(postings)
+        inserted = set(new_ids)
+        existing = {}
+        for posting in postings:
+            if posting["id"] not in inserted:
+                existing.setdefault(posting["id"], posting)
+        if not existing:
+            return new_ids, []
+
+        now = datetime.now().isoformat()
+        columns = ", ".join(CONTENT_FIELDS)
+        updates, changes = [], []
+        with self._lock:
+            ids = list(existing)
+            for i in range(0, len(ids), BULK_INSERT_CHUNK):
+                chunk = ids[i:i + BULK_INSERT_CHUNK]
+                cursor = self.conn.execute(f"""
+                    SELECT id, {columns}, start_day, end_day, end_kind, content_hash
+                    FROM postings WHERE id IN ({','.join('?' * len(chunk))})
+                """, chunk)
+                for row in cursor.fetchall():
+                    stored = dict(row)
+                    merged = self._merge_posting(stored, existing[row["id"]])
+                    digest = content_hash(merged)
+                    if digest == stored["content_hash"]:
+                        continue
+                    previous = {f: stored[f] for f in CONTENT_FIELDS if merged[f] != stored[f]}
+                    updates.append(tuple(merged[f] for f in CONTENT_FIELDS) + (
+                        merged["start_day"], merged["end_day"], merged["end_kind"],
+                        digest, now, row["id"],
+                    ))
+                    if previous:
+                        changes.append((row["id"], now, json.dumps(previous, ensure_ascii=False)))
+            if updates:
+                assignments = ", ".join(f"{f} = ?" for f in CONTENT_FIELDS)
+                self.conn.executemany(f"""
+                    UPDATE postings SET {assignments}, start_day = ?, end_day = ?, end_kind = ?,
+                        content_hash = ?, updated_at = ?
+                    WHERE id = ?
+                """, updates)
+                self.conn.executemany(
+                    "INSERT INTO posting_changes (posting_id, changed_at, previous) VALUES (?, ?, ?)",
+                    changes,
+                )
+                self.conn.commit()
+        return new_ids, [u[-1] for u in updates]
+
+    @staticmethod
+    def _merge_posting(stored: dict, incoming: dict) -> dict:
+        """저장된 행에 수집한 공고의 비어 있지 않은 필드를 덮어쓴 결과"""
+        merged = dict(stored)
+        for field in CONTENT_FIELDS:
+            if incoming.get(field):
+                merged[field] = incoming[field]
+        if incoming.get("start_date"):
+            merged["start_day"] = incoming["start_day"]
+        if incoming.get("end_date"):
+            same_dday = (
+                incoming["end_kind"] == stored["end_kind"] == KIND_DDAY
+                and incoming["end_day"] == stored["end_day"]
+            )
+            if same_dday:
+                # 환산 마감일이 같으면 D-N 표기만 바뀐 것 → 기존 표기 유지
+                merged["end_date"] = stored["end_date"]
+            merged["end_day"], merged["end_kind"] = incoming["end_day"], incoming["end_kind"]
+        return merged
+
+    def get_updated_since(self, since: str, sources: Optional[List[str]] = None,
+                          limit: int = -1) -> List[dict]:
+        """since(ISO 시각 또는 YYYY-MM-DD) 이후 내용이 갱신된 공고 (최근 갱신 순)"""
+        sql = "SELECT * FROM postings WHERE updated_at >= ?"
+        params: list = [since]
+        if sources:
+            sql += f" AND source IN ({','.join('?' * len(sources))})"
+            params.extend(sources)
+        sql += " ORDER BY updated_at DESC LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def get_posting_changes(self, posting_id: str) -> List[dict]:
+        """공고의 변경 이력 (오래된 순). previous는 바뀐 필드의 이전 값."""
+        cursor = self.conn.execute("""
+            SELECT changed_at, previous FROM posting_changes
+            WHERE posting_id = ? ORDER BY id
+        """, (posting_id,))
+        return [
+            {"changed_at": row["changed_at"], "previous": json.loads(row["previous"])}
+            for row in cursor
+        ]
+
+    def load_id_index(self) -> IdIndex:
+        """postings 테이블의 전체 ID로 메모리 인덱스를 만들어 반환 (이후 삽입분도 반영됨)"""
+        with self._lock:
+            cursor = self.conn.execute("SELECT id FROM postings")
+            self.id_index = IdIndex(row[0] for row in cursor)
+        return self.id_index
+
+    def find_existing_ids(self, ids: Iterable[str]) -> Set[str]:
+        """주어진 ID 중 이미 DB에 존재하는 ID 집합 반환 (IN 절 배치 조회)"""
+        ids = list(ids)
+        found = set()
+        with self._lock:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self.conn.execute(
+                    f"SELECT id FROM postings WHERE id IN ({placeholders})", chunk
+                )
+                found.update(row[0] for row in cursor)
+        return found
+
+    def get_detail_cache(self, urls: Iterable[str]) -> Dict[str, dict]:
+        """상세 페이지 캐시 조회 (URL -> {target, summary})"""
+        urls = list(urls)
+        cached = {}
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self.conn.execute(
+                f"SELECT url, target, summary FROM detail_pages WHERE url IN ({placeholders})",
+                chunk,
+            )
+            for row in cursor:
+                cached[row["url"]] = {"target": row["target"], "summary": row["summary"]}
+        return cached
+
+    def save_detail_cache(self, details: Dict[str, dict]):
+        """상세 페이지 파싱 결과 저장 (빈 결과도 저장하여 재요청 방지)"""
+        now = datetime.now().isoformat()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO detail_pages (url, target, summary, fetched_at) VALUES (?, ?, ?, ?)",
+            [(url, d.get("target", ""), d.get("summary", ""), now) for url, d in details.items()],
+        )
         self.conn.commit()
-        return True
+
+    def update_posting_details(self, postings: List[dict]):
+        """상세 페이지에서 보강한 지원대상/요약을 공고에 반영 (내용 해시도 다시 계산)"""
+        rows = []
+        for p in postings:
+            normalize_posting_dates(p, p.get("collected_at"))
+            rows.append((p.get("target", ""), p.get("summary", ""), content_hash(p), p["id"]))
+        self.conn.executemany(
+            "UPDATE postings SET target = ?, summary = ?, content_hash = ? WHERE id = ?", rows
+        )
+        self.conn.commit()
+
+    def save_signatures(self, signatures: Dict[str, bytes]):
+        """중복 판정용 제목 MinHash 서명 저장 (공고 ID -> 서명 바이트)"""
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO posting_signatures (id, signature) VALUES (?, ?)",
+                list(signatures.items()),
+            )
+            self.conn.commit()
+
+    def get_recent_signatures(self, days: int, exclude: Iterable[str] = ()) -> List[dict]:
+        """최근 days일 안에 수집된 공고의 서명과 비교용 필드 조회"""
+        exclude = set(exclude)
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        cursor = self.conn.execute("""
+            SELECT p.id, p.source, p.organization, p.end_date, p.cluster_id, s.signature
+            FROM postings p JOIN posting_signatures s ON s.id = p.id
+            WHERE p.collected_at >= ?
+        """, (cutoff,))
+        return [dict(row) for row in cursor if row["id"] not in exclude]
+
+    def get_delivered_ids(self, posting_ids: Iterable[str]) -> Set[str]:
+        """주어진 ID 중 실제로 알림이 나간 공고 ID 집합
+
+        알림 처리(is_notified)는 필터에서 탈락한 신규 공고에도 표시되므로,
+        저장된 필터 판정이 통과(excluded_stage IS NULL)인 공고만 발송된 것으로 본다.
+        """
+        ids = list(posting_ids)
+        delivered = set()
+        with self._lock:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self.conn.execute(f"""
+                    SELECT p.id FROM postings p JOIN filter_verdicts v ON v.posting_id = p.id
+                    WHERE p.id IN ({placeholders}) AND p.is_notified = 1 AND v.excluded_stage IS NULL
+                """, chunk)
+                delivered.update(row[0] for row in cursor)
+        return delivered
+
+    def set_cluster_ids(self, cluster_ids: Dict[str, str]):
+        """중복 묶음 연결 (공고 ID -> 대표 공고 ID)"""
+        with self._lock:
+            self.conn.executemany(
+                "UPDATE postings SET cluster_id = ? WHERE id = ?",
+                [(cluster_id, pid) for pid, cluster_id in cluster_ids.items()],
+            )
+            self.conn.commit()
+
+    def get_filter_verdicts(self, posting_ids: Iterable[str]) -> Dict[str, dict]:
+        """저장된 필터 판정 조회 (공고 ID -> 판정 dict, matched_keywords는 리스트)"""
+        ids = list(posting_ids)
+        verdicts = {}
+        with self._lock:
+            for i in range(0, len(ids), BULK_INSERT_CHUNK):
+                chunk = ids[i:i + BULK_INSERT_CHUNK]
+                cursor = self.conn.execute(f"""
+                    SELECT * FROM filter_verdicts WHERE posting_id IN ({','.join('?' * len(chunk))})
+                """, chunk)
+                for row in cursor:
+                    verdict = dict(row)
+                    verdict["matched_keywords"] = json.loads(verdict["matched_keywords"])
+                    verdicts[verdict["posting_id"]] = verdict
+        return verdicts
+
+    def save_filter_verdicts(self, verdicts: List[dict]):
+        """필터 판정 저장 (filters.evaluate_posting 결과)"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO filter_verdicts
+                (posting_id, content_hash, keyword_version, region_version,
+                 matched_keywords, excluded_stage, excluded_reason, evaluated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (v["posting_id"], v["content_hash"], v["keyword_version"], v["region_version"],
+                 json.dumps(v["matched_keywords"], ensure_ascii=False),
+                 v["excluded_stage"], v["excluded_reason"], now)
+                for v in verdicts
+            ])
+            self.conn.commit()
+
+    def iter_stale_verdict_postings(self, keyword_version: str, region_version: str,
+                                    chunk_size: int = 1000) -> Iterator[List[dict]]:
+        """판정이 없거나 내용/해당 단계 규칙 버전이 달라진 공고를 ID 순 묶음으로 반환
+
+        각 dict의 "_previous_stage"는 이전 판정 ("pass" / "keyword" / "region", 없으면 None).
+        ID 기준 keyset 페이지로 읽으므로 묶음마다 판정을 저장해도 다음 묶음 조회에 영향이 없다.
+        """
+        last_id = ""
+        while True:
+            rows = self.conn.execute("""
+                SELECT p.*, CASE
+                    WHEN v.posting_id IS NULL THEN NULL
+                    ELSE COALESCE(v.excluded_stage, 'pass')
+                END AS _previous_stage
+                FROM postings p LEFT JOIN filter_verdicts v ON v.posting_id = p.id
+                WHERE p.id > ? AND (
+                    v.posting_id IS NULL
+                    OR v.content_hash IS NOT p.content_hash
+                    OR v.keyword_version != ?
+                    OR (v.excluded_stage IS NOT 'keyword' AND v.region_version IS NOT ?)
+                )
+                ORDER BY p.id LIMIT ?
+            """, (last_id, keyword_version, region_version, chunk_size)).fetchall()
+            if not rows:
+                return
+            yield [dict(row) for row in rows]
+            last_id = rows[-1]["id"]
+
+    def iter_postings(self, columns: Optional[Sequence[str]] = None,
+                      chunk_size: int = 1000) -> Iterator[List[dict]]:
+        """전체 공고를 ID 순 묶음으로 반환 (columns를 주면 해당 컬럼만, id는 항상 포함)
+
+        전체를 한 번에 리스트로 올리지 않고 ID 기준 keyset 페이지로 읽는다.
+        """
+        if columns:
+            unknown = set(columns) - set(self._posting_column_names())
+            if unknown:
+                raise ValueError(f"알 수 없는 컬럼: {', '.join(sorted(unknown))}")
+            selected = ", ".join(dict.fromkeys(["id", *columns]))
+        else:
+            selected = "*"
+        last_id = ""
+        while True:
+            rows = self.conn.execute(
+                f"SELECT {selected} FROM postings WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, chunk_size),
+            ).fetchall()
+            if not rows:
+                return
+            yield [dict(row) for row in rows]
+            last_id = rows[-1]["id"]
+
+    def _posting_column_names(self) -> List[str]:
+        return [row["name"] for row in self.conn.execute("PRAGMA table_info(postings)")]
+
+    def get_source_health(self, source: str) -> Optional[dict]:
+        """소스 상태(연속 실패 횟수, 마지막 성공/실패 시각) 조회"""
+        cursor = self.conn.execute("SELECT * FROM source_health WHERE source = ?", (source,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def record_source_result(self, source: str, ok: bool, error: str = ""):
+        """소스 실행 결과 기록. 성공하면 연속 실패 횟수 초기화."""
+        now = datetime.now().isoformat()
+        with self._lock:
+            if ok:
+                self.conn.execute("""
+                    INSERT INTO source_health (source, consecutive_failures, last_success_at)
+                    VALUES (?, 0, ?)
+                    ON CONFLICT(source) DO UPDATE SET
+                        consecutive_failures = 0, last_success_at = excluded.last_success_at
+                """, (source, now))
+            else:
+                self.conn.execute("""
+                    INSERT INTO source_health (source, consecutive_failures, last_failure_at, last_error)
+                    VALUES (?, 1, ?, ?)
+                    ON CONFLICT(source) DO UPDATE SET
+                        consecutive_failures = consecutive_failures + 1,
+                        last_failure_at = excluded.last_failure_at,
+                        last_error = excluded.last_error
+                """, (source, now, error[:500]))
+            self.conn.commit()
 
     def has_sent_today(self, today: str) -> bool:
         """오늘 이미 알림을 발송했는지 확인"""
@@ -104,6 +694,70 @@ class Database:
         """)
         return [dict(row) for row in cursor.fetchall()]
 
+    def search_postings(self, query: str = "", sources: Optional[List[str]] = None,
+                        since: Optional[str] = None, until: Optional[str] = None,
+                        limit: int = 20, offset: int = 0) -> List[dict]:
+        """공고 전문 검색 (관련도 순, 검색어가 없으면 최신 수집 순)
+
+        - 검색어는 공백으로 나눈 모든 단어를 포함하는 공고를 찾는다 (AND).
+          3글자 이상 단어는 FTS 인덱스로, 더 짧은 단어는 LIKE로 조건을 건다.
+        - sources: 출처(source) 목록, since/until: 수집일(YYYY-MM-DD) 범위
+        - 결과 dict에는 공고 컬럼과 함께 rank(낮을수록 관련도 높음)가 들어간다.
+        """
+        terms = query.split()
+        fts_terms = [t for t in terms if len(t) >= FTS_MIN_TERM_LENGTH] if self.has_fts else []
+        like_terms = [t for t in terms if t not in fts_terms]
+
+        where, params = [], []
+        if fts_terms:
+            sql = """
+                SELECT p.*, bm25(postings_fts, 10.0, 3.0, 2.0, 1.0) AS rank
+                FROM postings_fts JOIN postings p ON p.rowid = postings_fts.rowid
+            """
+            where.append("postings_fts MATCH ?")
+            params.append(" AND ".join('"' + t.replace('"', '""') + '"' for t in fts_terms))
+            order = "rank, p.collected_at DESC"
+        else:
+            sql = "SELECT p.*, 0.0 AS rank FROM postings p"
+            order = "p.collected_at DESC"
+        for term in like_terms:
+            where.append(
+                "(p.title LIKE ? OR p.organization LIKE ? OR p.target LIKE ? OR p.summary LIKE ?)"
+            )
+            params.extend([f"%{term}%"] * 4)
+        if sources:
+            where.append(f"p.source IN ({','.join('?' * len(sources))})")
+            params.extend(sources)
+        if since:
+            where.append("p.collected_at >= ?")
+            params.append(since)
+        if until:
+            # 날짜만 주면 그날 전체 포함
+            where.append("p.collected_at < ?")
+            params.append(until + "T99" if len(until) == 10 else until)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order} LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def get_closing_soon(self, within_days: int, today: Optional[int] = None,
+                         sources: Optional[List[str]] = None,
+                         limit: int = -1, offset: int = 0) -> List[dict]:
+        """오늘부터 within_days일 안에 마감되는 공고 (마감 임박 순, end_day 인덱스 범위 조회)
+
+        today는 epoch-day (기본: 오늘). D-N 공고는 수집 시각 기준으로 환산된 마감일을 쓴다.
+        """
+        today = today_epoch_day() if today is None else today
+        sql = "SELECT * FROM postings WHERE end_day BETWEEN ? AND ?"
+        params: list = [today, today + within_days]
+        if sources:
+            sql += f" AND source IN ({','.join('?' * len(sources))})"
+            params.extend(sources)
+        sql += " ORDER BY end_day, collected_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
     def mark_as_notified(self, posting_ids: List[str]):
         """공고들을 알림 완료로 표시"""
         now = datetime.now().isoformat()
@@ -127,5 +781,48 @@ class Database:
             "by_source": {row["source"]: row["cnt"] for row in sources},
         }
 
+    def persist(self):
+        """메모리 DB를 디스크 파일로 원자적으로 기록 (in_memory 모드 전용)
+
+        델타 모드이면 DB 파일 대신 변경된 행만 델타 로그로 남긴다 (DeltaStore.save).
+
+        같은 디렉토리의 임시 파일에 backup API로 복사한 뒤 os.replace로 교체하므로
+        반쯤 쓰인 DB 파일이 남지 않는다. -wal 파일 없이 단독으로 쓰이도록 롤백 저널(DELETE)로 남긴다.
+        """
+        if not self.in_memory:
+            return
+        if self.delta_store is not None:
+            with self._lock:
+                self.conn.commit()
+                self.delta_store.save(self.conn)
+            return
+        target = Path(self.db_path)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+        os.close(fd)
+        try:
+            with self._lock:
+                self.conn.commit()
+                disk = sqlite3.connect(tmp_path)
+                try:
+                    self.conn.backup(disk)
+                    disk.execute("PRAGMA journal_mode=DELETE")
+                finally:
+                    disk.close()
+            os.replace(tmp_path, target)
+            # 교체 전 파일의 WAL/SHM이 남아 있으면 새 파일과 섞이지 않도록 제거
+            for suffix in ("-wal", "-shm"):
+                Path(f"{target}{suffix}").unlink(missing_ok=True)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
     def close(self):
+        if self.read_only:
+            self.conn.close()
+            return
+        if self.in_memory:
+            self.persist()
+        elif Config.SQLITE_JOURNAL_MODE.upper() == "WAL":
+            # WAL 내용을 본 파일에 반영해 두어야 DB 파일 하나만 복사/보관해도 최신 상태
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
         self.conn.close()
@@ -0,0 +1,79 @@
+"""실행 전체 마감 시간(deadline) 관리
+
+GitHub Actions 작업은 10분(timeout-minutes)에 강제 종료되므로, 실행 시작 시
+RUN_DEADLINE_SECONDS 예산을 잡아 두고 수집기/상세 보강/알림 전송이 모두 이를 참고한다.
+
+- 수집 단계(수집기, 상세 보강)는 전체 예산에서 DELIVERY_RESERVE_SECONDS를 뺀 만큼만 쓴다.
+  요청 타임아웃은 남은 수집 예산으로 줄이고, 백오프 후 재시도할 시간이 없으면 재시도하지 않는다.
+- 알림 전송은 예약해 둔 시간까지 포함한 전체 예산을 쓰므로, 수집이 늦어져도
+  이미 수집한 공고를 보내고 발송 기록(record_daily_send)을 남길 시간이 보장된다.
+
+start_run_deadline()을 호출하지 않으면 제한 없음으로 동작한다.
+"""
+import math
+import threading
+import time
+from typing import Optional
+
+from src.config import Config
+
+# 이보다 짧은 타임아웃으로는 요청을 보내지 않음 (초)
+MIN_REQUEST_TIMEOUT = 2.0
+
+
+class DeadlineExceeded(Exception):
+    """수집 단계 예산을 모두 사용함"""
+
+
+class RunDeadline:
+    """실행 마감 시각과 알림 전송용 예약 시간"""
+
+    def __init__(self, seconds: Optional[float] = None, reserve: float = 0.0):
+        self.started = time.monotonic()
+        self.expires_at = self.started + seconds if seconds else None
+        self.reserve = reserve
+
+    def remaining(self) -> float:
+        """전체 남은 시간 (알림 전송 단계용)"""
+        if self.expires_at is None:
+            return math.inf
+        return self.expires_at - time.monotonic()
+
+    def collect_remaining(self) -> float:
+        """수집 단계에서 쓸 수 있는 남은 시간 (알림 전송 예약분 제외)"""
+        return self.remaining() - self.reserve
+
+    def collect_expired(self) -> bool:
+        return self.collect_remaining() <= 0
+
+    def request_timeout(self, default: float) -> float:
+        """남은 수집 예산에 맞춘 요청 타임아웃. 예산이 부족하면 DeadlineExceeded."""
+        budget = self.collect_remaining()
+        if budget < MIN_REQUEST_TIMEOUT:
+            raise DeadlineExceeded(f"수집 예산 소진 (남은 시간 {max(budget, 0):.0f}초)")
+        return min(default, budget)
+
+    def can_retry(self, backoff: float) -> bool:
+        """백오프 대기 후에도 최소 타임아웃만큼 요청할 시간이 남는지"""
+        return self.collect_remaining() > backoff + MIN_REQUEST_TIMEOUT
+
+
+_deadline = RunDeadline()
+_deadline_lock = threading.Lock()
+
+
+def start_run_deadline(seconds: Optional[float] = None,
+                       reserve: Optional[float] = None) -> RunDeadline:
+    """실행 시작 시 호출. 프로세스 전역 마감 시간을 설정하고 반환."""
+    global _deadline
+    with _deadline_lock:
+        _deadline = RunDeadline(
+            Config.RUN_DEADLINE_SECONDS if seconds is None else seconds,
+            Config.DELIVERY_RESERVE_SECONDS if reserve is None else reserve,
+        )
+        return _deadline
+
+
+def get_deadline() -> RunDeadline:
+    """현재 실행의 마감 시간 반환 (설정 전에는 제한 없음)"""
+    return _deadline
@@ -0,0 +1,292 @@
+"""소스 간 중복 공고 묶기 (MinHash + LSH)
+
+같은 사업이 기업마당, K-Startup, 중소벤처24, THE VC 등에 제목/URL이 조금씩 다르게 올라오면
+generate_id(title, url)는 서로 다른 공고로 보므로 Slack 스레드에 같은 공고가 여러 번 올라간다.
+
+- 제목을 정규화(괄호 태그, 공백, 기호 제거)한 뒤 3글자 shingle의 MinHash 서명을 만든다.
+- 서명을 밴드로 나눈 LSH 버킷에 넣어 같은 버킷에 걸린 후보끼리만 비교하므로
+  전체 쌍 비교 없이 공고 수에 거의 비례하는 시간에 묶을 수 있다.
+- 후보는 추정 유사도 + 출처가 다름 + 마감일 충돌 없음(기관명이 같으면 기준 완화)으로 확정한다.
+- 서명은 posting_signatures 테이블에 저장해 이후 실행에서 최근 공고와도 비교하고,
+  묶인 공고는 postings.cluster_id(대표 공고 ID)로 연결한다. 알림은 대표 공고만 보낸다.
+"""
+import hashlib
+import logging
+import re
+from array import array
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from src.config import Config
+from src.database import Database
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _make_permutations(count: int) -> List[Tuple[int, int]]:
+    """실행마다 같은 값이 나오도록 고정 시드로 만든 (a, b) 해시 계수"""
+    perms = []
+    for i in range(count):
+        digest = hashlib.blake2b(f"minhash-perm-{i}".encode(), digest_size=16).digest()
+        a = int.from_bytes(digest[:8], "big") % (_MERSENNE_PRIME - 1) + 1
+        b = int.from_bytes(digest[8:], "big") % _MERSENNE_PRIME
+        perms.append((a, b))
+    return perms
+
+
+_PERMUTATIONS = _make_permutations(NUM_PERM)
+
+# 비교 전에 제목에서 지우는 표현 (출처마다 붙이는 방식이 다름)
+_BRACKETS = re.compile(r"\[[^\]]*\]|【[^】]*】|<[^>]*>")
+_GENERIC_WORDS = re.compile(r"(재공고|공고|모집|안내|알림)")
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]")
+
+# 대표 공고 선택 시 출처 우선순위 (구조화된 필드가 많은 API 우선)
+SOURCE_PRIORITY = ("kstartup", "smes24", "bizinfo", "mss", "nipa", "tipa", "tips", "thevc")
+
+
+def normalize_title(title: str) -> str:
+    text = _BRACKETS.sub(" ", title.lower())
+    text = _GENERIC_WORDS.sub("", text)
+    return _NON_WORD.sub("", text)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """글자 size개 단위 shingle의 32비트 해시 집합"""
+    if len(text) <= size:
+        grams = {text} if text else set()
+    else:
+        grams = {text[i:i + size] for i in range(len(text) - size + 1)}
+    return {
+        int.from_bytes(hashlib.blake2b(g.encode(), digest_size=4).digest(), "big")
+        for g in grams
+    }
+
+
+def minhash(shingle_hashes: Set[int]) -> Tuple[int, ...]:
+    """NUM_PERM개 해시 함수의 최솟값 서명"""
+    if not shingle_hashes:
+        return (_MAX_HASH,) * NUM_PERM
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in shingle_hashes) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    )
+
+
+def signature_for(posting: dict) -> Tuple[int, ...]:
+    return minhash(shingles(normalize_title(posting.get("title", ""))))
+
+
+def similarity(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+    """서명 일치 비율 = 자카드 유사도 추정치"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def pack_signature(signature: Sequence[int]) -> bytes:
+    return array("I", signature).tobytes()
+
+
+def unpack_signature(blob: bytes) -> Tuple[int, ...]:
+    sig = array("I")
+    sig.frombytes(blob)
+    return tuple(sig)
+
+
+class LshIndex:
+    """MinHash 서명의 밴드별 버킷 인덱스"""
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = defaultdict(list)
+
+    def add(self, key: str, signature: Sequence[int]):
+        for band in range(BANDS):
+            self._buckets[self._band_key(signature, band)].append(key)
+
+    def candidates(self, signature: Sequence[int]) -> Set[str]:
+        found = set()
+        for band in range(BANDS):
+            found.update(self._buckets.get(self._band_key(signature, band), ()))
+        return found
+
+    @staticmethod
+    def _band_key(signature: Sequence[int], band: int) -> Tuple[int, Tuple[int, ...]]:
+        start = band * ROWS_PER_BAND
+        return band, tuple(signature[start:start + ROWS_PER_BAND])
+
+
+def _is_date(value: str) -> bool:
+    return bool(re.fullmatch(r"\d{4}-\d{2}-\d{2}", value or ""))
+
+
+def _same_org(a: str, b: str) -> bool:
+    a, b = _NON_WORD.sub("", (a or "").lower()), _NON_WORD.sub("", (b or "").lower())
+    return bool(a and b and (a in b or b in a))
+
+
+def is_duplicate(a: dict, b: dict, score: float, threshold: Optional[float] = None) -> bool:
+    """후보 쌍 확정: 출처가 다르고, 마감일이 충돌하지 않고, 유사도가 기준 이상"""
+    threshold = Config.DEDUP_THRESHOLD if threshold is None else threshold
+    if a.get("source") == b.get("source"):
+        # 같은 출처의 비슷한 제목은 차수(1차/2차)가 다른 별개 공고인 경우가 대부분
+        return False
+    end_a, end_b = a.get("end_date", ""), b.get("end_date", "")
+    if _is_date(end_a) and _is_date(end_b) and end_a != end_b:
+        return False
+    if _same_org(a.get("organization", ""), b.get("organization", "")):
+        threshold -= 0.1
+    return score >= threshold
+
+
+def _representative_key(posting: dict) -> tuple:
+    filled = sum(1 for f in ("organization", "start_date", "end_date", "target", "summary")
+                 if posting.get(f))
+    source = posting.get("source", "")
+    priority = SOURCE_PRIORITY.index(source) if source in SOURCE_PRIORITY else len(SOURCE_PRIORITY)
+    return -filled, priority, posting["id"]
+
+
+class _Clusters:
+    """union-find + 묶음별 출처/마감일 집합
+
+    묶음 하나에는 출처별로 공고가 하나씩만 들어가고 확정 마감일도 하나뿐이어야 한다.
+    (A~B, B~C가 각각 비슷해도 A와 C가 같은 출처의 다른 차수 공고이면 묶지 않는다)
+    """
+
+    def __init__(self, records: Dict[str, dict]):
+        self.parent: Dict[str, str] = {}
+        self.sources: Dict[str, Set[str]] = {}
+        self.end_dates: Dict[str, Set[str]] = {}
+        self.records = records
+
+    def find(self, x: str) -> str:
+        if x not in self.parent:
+            self.parent[x] = x
+            record = self.records[x]
+            self.sources[x] = {record.get("source", "")}
+            end_date = record.get("end_date", "")
+            self.end_dates[x] = {end_date} if _is_date(end_date) else set()
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a: str, b: str) -> bool:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return True
+        if self.sources[ra] & self.sources[rb]:
+            return False
+        if len(self.end_dates[ra] | self.end_dates[rb]) > 1:
+            return False
+        self.parent[rb] = ra
+        self.sources[ra] |= self.sources.pop(rb)
+        self.end_dates[ra] |= self.end_dates.pop(rb)
+        return True
+
+
+def cluster_postings(db: Database, postings: List[dict]) -> List[dict]:
+    """신규 공고를 최근 공고/서로와 묶고 알림 대상(대표 공고) 리스트 반환
+
+    - 기존 공고와 묶인 신규 공고는 기존 대표가 실제로 발송된 경우(필터 통과 + 알림 처리)에만 제외한다.
+    - 그 밖의 묶음(신규끼리, 또는 기존 대표가 필터에서 탈락한 묶음)은 신규 공고 중 필드가
+      가장 많이 채워진 공고를 대표로 하고, 대표의 빈 지원대상/요약은 중복 공고 값으로 채운다.
+      기존 공고도 새 대표로 다시 연결한다.
+    - 대표 공고 dict의 "_duplicates"에 다른 출처 공고(source, url) 목록을 남긴다.
+    """
+    if not postings:
+        return []
+
+    signatures = {p["id"]: signature_for(p) for p in postings}
+    db.save_signatures({pid: pack_signature(sig) for pid, sig in signatures.items()})
+
+    index = LshIndex()
+    records: Dict[str, dict] = {}
+    existing_cluster: Dict[str, str] = {}
+    existing_sigs: Dict[str, Tuple[int, ...]] = {}
+    new_ids = set(signatures)
+    for row in db.get_recent_signatures(Config.DEDUP_WINDOW_DAYS, exclude=new_ids):
+        sig = unpack_signature(row["signature"])
+        existing_sigs[row["id"]] = sig
+        records[row["id"]] = row
+        existing_cluster[row["id"]] = row["cluster_id"] or row["id"]
+        index.add(row["id"], sig)
+    for p in postings:
+        records[p["id"]] = p
+        index.add(p["id"], signatures[p["id"]])
+
+    # LSH 후보 쌍만 유사도 계산 → 유사도 높은 쌍부터 묶음 병합
+    pairs = []
+    for p in postings:
+        sig = signatures[p["id"]]
+        for other in index.candidates(sig):
+            if other == p["id"] or (other in signatures and other < p["id"]):
+                continue
+            other_sig = signatures.get(other) or existing_sigs[other]
+            score = similarity(sig, other_sig)
+            if is_duplicate(p, records[other], score):
+                pairs.append((score, p["id"], other))
+    uf = _Clusters(records)
+    for _, a, b in sorted(pairs, reverse=True):
+        uf.union(a, b)
+
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for p in postings:
+        groups[uf.find(p["id"])].append(p["id"])
+    # 기존 공고는 union 결과 묶음에 들어가 있을 때만 의미가 있음
+    for pid in existing_cluster:
+        if pid in uf.parent:
+            groups[uf.find(pid)].append(pid)
+
+    by_id = {p["id"]: p for p in postings}
+    # 신규 공고가 합류한 기존 묶음 중 대표가 실제로 발송된 묶음
+    joined = {existing_cluster[m] for members in groups.values() for m in members if m not in by_id}
+    delivered = db.get_delivered_ids(joined) if joined else set()
+    cluster_ids: Dict[str, str] = {}
+    representatives = []
+    suppressed = 0
+    for members in groups.values():
+        new_members = [by_id[m] for m in members if m in by_id]
+        old_members = [m for m in members if m not in by_id]
+        if len(members) == 1:
+            representatives.append(new_members[0])
+            continue
+
+        sent = sorted(existing_cluster[m] for m in old_members if existing_cluster[m] in delivered)
+        if sent:
+            # 이미 알림이 나간 묶음에 합류 → 신규 공고는 모두 알림 제외
+            cluster_id = sent[0]
+            suppressed += len(new_members)
+        else:
+            # 기존 공고가 있어도 발송된 적이 없으면 (필터 탈락 등) 신규 공고 중에서 대표 선택
+            rep = min(new_members, key=_representative_key)
+            cluster_id = rep["id"]
+            duplicates = [p for p in new_members if p is not rep]
+            for field in ("target", "summary"):
+                if not rep.get(field):
+                    rep[field] = next((p[field] for p in duplicates if p.get(field)), "")
+            rep["_duplicates"] = [{"source": p["source"], "url": p.get("url", "")} for p in duplicates]
+            representatives.append(rep)
+            suppressed += len(duplicates)
+            for pid in old_members:
+                cluster_ids[pid] = cluster_id
+        for p in new_members:
+            cluster_ids[p["id"]] = cluster_id
+
+    if cluster_ids:
+        db.set_cluster_ids(cluster_ids)
+        db.update_posting_details([p for p in representatives if p.get("_duplicates")])
+    logger.info(
+        f"중복 공고 묶기: 신규 {len(postings)}건 → 알림 대상 {len(representatives)}건 "
+        f"(중복 제외 {suppressed}건, 비교 대상 기존 공고 {len(existing_sigs)}건)"
+    )
+    # 입력 순서 유지
+    order = {p["id"]: i for i, p in enumerate(postings)}
+    return sorted(representatives, key=lambda p: order[p["id"]])
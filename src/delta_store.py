@@ -0,0 +1,220 @@
+"""델타 로그 저장 방식 (DB_STORAGE=delta)
+
+매일 data/postings.db 바이너리 전체를 커밋하면 저장소 히스토리가 DB 크기만큼씩 늘어난다.
+델타 모드에서는 DB를 메모리에서 다루고, 실행이 끝나면 이번 실행에서 추가/변경된 행만
+압축 JSONL 파일(델타) 하나로 남긴다. 델타가 DELTA_SNAPSHOT_EVERY개 쌓이면 전체 행을
+스냅샷 하나로 합치고 이전 파일은 지운다.
+
+    data/delta/snapshot-20260301T020000000000.jsonl.zst
+    data/delta/delta-20260302T020000000000.jsonl.zst
+    ...
+
+- 한 줄 = {"t": 테이블, "r": {컬럼: 값}} (BLOB은 {"$b": base64})
+- 적재: 가장 최근 스냅샷 → 그 이후 델타를 시간 순서대로 INSERT OR REPLACE
+- 변경 감지: 적재 직후 행별 해시를 기억해 두고 저장 시 해시가 달라진 행만 기록
+- zstandard가 설치되어 있으면 .zst, 없으면 .gz로 쓴다 (읽기는 둘 다 지원)
+- 파일은 임시 파일에 쓴 뒤 os.replace로 교체하므로 강제 종료 시 반쯤 쓰인 파일이 남지 않는다.
+"""
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.config import Config
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# 저장 대상 테이블별 행 키 -> 해시
+RowHashes = Dict[str, Dict[tuple, str]]
+
+
+def _encode_value(value):
+    if isinstance(value, bytes):
+        return {"$b": base64.b64encode(value).decode("ascii")}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict) and "$b" in value:
+        return base64.b64decode(value["$b"])
+    return value
+
+
+def _read_lines(path: Path) -> List[str]:
+    data = path.read_bytes()
+    if path.name.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError(f"{path.name}을 읽으려면 zstandard 패키지가 필요합니다")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        data = gzip.decompress(data)
+    return data.decode("utf-8").splitlines()
+
+
+def _file_timestamp(path: Path) -> str:
+    """snapshot-/delta- 뒤의 시각 문자열 (파일 순서 기준)"""
+    return path.name.split("-", 1)[1].split(".", 1)[0]
+
+
+class DeltaStore:
+    """델타/스냅샷 파일 디렉토리"""
+
+    def __init__(self, directory: Optional[str] = None, snapshot_every: Optional[int] = None):
+        self.directory = Path(directory or Config.DELTA_DIR)
+        self.snapshot_every = snapshot_every or Config.DELTA_SNAPSHOT_EVERY
+        self._baseline: RowHashes = {}
+
+    # ---------- 파일 목록 ----------
+
+    def _files(self, kind: str) -> List[Path]:
+        files = [p for p in self.directory.glob(f"{kind}-*.jsonl.*") if p.suffix in (".zst", ".gz")]
+        return sorted(files, key=_file_timestamp)
+
+    def _chain(self) -> Tuple[Optional[Path], List[Path]]:
+        """(최신 스냅샷, 그 이후 델타 목록)"""
+        snapshots = self._files("snapshot")
+        snapshot = snapshots[-1] if snapshots else None
+        since = _file_timestamp(snapshot) if snapshot else ""
+        deltas = [p for p in self._files("delta") if _file_timestamp(p) > since]
+        return snapshot, deltas
+
+    def exists(self) -> bool:
+        return bool(self._files("snapshot") or self._files("delta"))
+
+    # ---------- 적재 ----------
+
+    def load(self, conn: sqlite3.Connection) -> int:
+        """스냅샷 + 델타를 conn에 적용하고 적용한 행 수 반환 (테이블은 미리 생성되어 있어야 함)"""
+        snapshot, deltas = self._chain()
+        applied = 0
+        columns = {t: self._columns(conn, t) for t in self.tables(conn)}
+        for path in ([snapshot] if snapshot else []) + deltas:
+            batches: Dict[Tuple[str, Tuple[str, ...]], List[tuple]] = {}
+            for line in _read_lines(path):
+                record = json.loads(line)
+                table, row = record["t"], record["r"]
+                if table not in columns:
+                    continue
+                cols = tuple(c for c in row if c in columns[table])
+                batches.setdefault((table, cols), []).append(
+                    tuple(_decode_value(row[c]) for c in cols)
+                )
+            for (table, cols), rows in batches.items():
+                placeholders = ",".join("?" * len(cols))
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} ({','.join(cols)}) VALUES ({placeholders})",
+                    rows,
+                )
+                applied += len(rows)
+        conn.commit()
+        logger.info(
+            f"델타 저장소 적재: 스냅샷 {1 if snapshot else 0}개 + 델타 {len(deltas)}개, {applied}행"
+        )
+        return applied
+
+    def mark_baseline(self, conn: sqlite3.Connection):
+        """현재 DB 상태를 기준으로 기억 (이후 save()는 여기서 달라진 행만 기록)"""
+        self._baseline = {table: dict(self._row_hashes(conn, table)) for table in self.tables(conn)}
+
+    # ---------- 저장 ----------
+
+    def save(self, conn: sqlite3.Connection) -> Optional[Path]:
+        """변경된 행을 델타로 기록 (필요하면 스냅샷으로 압축). 기록한 파일 경로 반환."""
+        snapshot, deltas = self._chain()
+        if snapshot is None or len(deltas) + 1 >= self.snapshot_every:
+            return self._write_snapshot(conn, self._files("snapshot") + self._files("delta"))
+
+        lines = []
+        for table in self.tables(conn):
+            before = self._baseline.get(table, {})
+            for key, digest, row in self._rows(conn, table):
+                if before.get(key) != digest:
+                    lines.append(self._line(table, row))
+        if not lines:
+            logger.info("델타 저장소: 변경 없음")
+            return None
+        path = self._write("delta", lines)
+        logger.info(f"델타 저장소: {path.name} ({len(lines)}행)")
+        self.mark_baseline(conn)
+        return path
+
+    def _write_snapshot(self, conn: sqlite3.Connection, obsolete: List[Path]) -> Path:
+        lines = [
+            self._line(table, row)
+            for table in self.tables(conn)
+            for _, _, row in self._rows(conn, table)
+        ]
+        path = self._write("snapshot", lines)
+        for old in obsolete:
+            old.unlink(missing_ok=True)
+        logger.info(f"델타 저장소: 스냅샷 {path.name} ({len(lines)}행), 이전 파일 {len(obsolete)}개 정리")
+        self.mark_baseline(conn)
+        return path
+
+    def _write(self, kind: str, lines: List[str]) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        if zstandard is not None:
+            suffix, payload = ".zst", zstandard.ZstdCompressor(level=10).compress(data)
+        else:
+            suffix, payload = ".gz", gzip.compress(data, mtime=0)
+        path = self.directory / f"{kind}-{stamp}.jsonl{suffix}"
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+    # ---------- 테이블/행 ----------
+
+    @staticmethod
+    def tables(conn: sqlite3.Connection) -> List[str]:
+        """저장 대상 테이블 (가상 테이블(FTS 등)과 그 내부 테이블은 원본에서 다시 만들어지므로 제외)"""
+        rows = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        ).fetchall()
+        virtual = [name for name, sql in rows if (sql or "").upper().startswith("CREATE VIRTUAL")]
+        return sorted(
+            name for name, _ in rows
+            if name not in virtual and not any(name.startswith(f"{v}_") for v in virtual)
+        )
+
+    @staticmethod
+    def _columns(conn: sqlite3.Connection, table: str) -> List[str]:
+        return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+    def _rows(self, conn: sqlite3.Connection, table: str) -> Iterator[Tuple[tuple, str, dict]]:
+        info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+        columns = [row[1] for row in info]
+        pk = [row[1] for row in sorted(info, key=lambda r: r[5]) if row[5]] or columns
+        cursor = conn.execute(f"SELECT {','.join(columns)} FROM {table}")
+        for values in cursor:
+            row = {c: _encode_value(v) for c, v in zip(columns, values)}
+            encoded = json.dumps(row, ensure_ascii=False, sort_keys=True)
+            key = tuple(row[c] if not isinstance(row[c], dict) else row[c]["$b"] for c in pk)
+            yield key, hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest(), row
+
+    def _row_hashes(self, conn: sqlite3.Connection, table: str) -> Iterator[Tuple[tuple, str]]:
+        for key, digest, _ in self._rows(conn, table):
+            yield key, digest
+
+    @staticmethod
+    def _line(table: str, row: dict) -> str:
+        return json.dumps({"t": table, "r": row}, ensure_ascii=False)
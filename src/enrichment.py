@@ -0,0 +1,90 @@
+"""상세 페이지 보강(enrichment) 단계
+
+크롤링 소스 대부분은 목록 페이지에 지원대상/요약이 없어 필터가 제목만 보고 판단하게 된다.
+이번 실행에서 새로 저장된 공고 중 target/summary가 비어 있는 것만 골라
+상세 페이지를 병렬로 받아 보강한다.
+
+- 요청은 각 수집기의 _request()를 거치므로 호스트별 속도 제한이 그대로 적용된다.
+- 파싱 결과는 URL 기준으로 detail_pages 테이블에 캐시하여 같은 페이지를 두 번 받지 않는다.
+- 실행 마감(수집 예산)이 지나면 남은 상세 페이지는 요청하지 않는다.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from src.config import Config
+from src.database import Database
+from src.deadline import DeadlineExceeded, get_deadline
+from src.collectors.base import BaseCollector
+
+logger = logging.getLogger(__name__)
+
+
+def _fetch(job: Tuple[BaseCollector, str]) -> Optional[Dict[str, str]]:
+    collector, url = job
+    try:
+        return collector.fetch_detail(url)
+    except DeadlineExceeded:
+        return None
+    except Exception as e:
+        logger.warning(f"[{collector.SOURCE_NAME}] 상세 페이지 수집 실패 {url}: {e}")
+        return None
+
+
+def enrich_postings(db: Database, postings: List[dict],
+                    collectors: List[BaseCollector],
+                    max_workers: Optional[int] = None) -> int:
+    """신규 공고의 빈 target/summary를 상세 페이지로 채우고 보강한 건수 반환
+
+    postings의 dict도 함께 갱신하므로 이후 필터 단계에서 바로 사용된다.
+    """
+    if get_deadline().collect_expired():
+        logger.warning("실행 마감 임박 - 상세 페이지 보강 건너뜀")
+        return 0
+
+    by_source = {c.SOURCE_NAME: c for c in collectors if c.ENRICH_DETAILS}
+    candidates = [
+        p for p in postings
+        if p.get("url") and p.get("source") in by_source
+        and not (p.get("target") and p.get("summary"))
+    ][:Config.ENRICH_MAX]
+    if not candidates:
+        return 0
+
+    details = db.get_detail_cache(p["url"] for p in candidates)
+    jobs = {}
+    for p in candidates:
+        if p["url"] not in details and p["url"] not in jobs:
+            jobs[p["url"]] = by_source[p["source"]]
+
+    if jobs:
+        workers = max(1, min(max_workers or Config.ENRICH_WORKERS, len(jobs)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich") as pool:
+            fetched = dict(zip(
+                jobs.keys(),
+                pool.map(_fetch, [(collector, url) for url, collector in jobs.items()]),
+            ))
+        fetched = {url: d for url, d in fetched.items() if d is not None}
+        db.save_detail_cache(fetched)
+        details.update(fetched)
+
+    enriched = []
+    for p in candidates:
+        detail = details.get(p["url"])
+        if not detail:
+            continue
+        changed = False
+        for field in ("target", "summary"):
+            if not p.get(field) and detail.get(field):
+                p[field] = detail[field]
+                changed = True
+        if changed:
+            enriched.append(p)
+
+    if enriched:
+        db.update_posting_details(enriched)
+    logger.info(
+        f"상세 페이지 보강: 대상 {len(candidates)}건, 신규 요청 {len(jobs)}건, "
+        f"보강 완료 {len(enriched)}건"
+    )
+    return len(enriched)
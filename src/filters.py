@@ -5,15 +5,21 @@
 - 일본 도쿄 법인 운영 중 (해외진출 진행)
 
 필터링 정책:
-1. 스타트업 또는 해외진출 관련 키워드 매칭
+1. 스타트업 또는 해외진출 관련 키워드 매칭 (+ FILTER_KEYWORDS 환경변수로 추가한 키워드)
 2. 지방/경기 한정 공고 배제 (서울 소재 기업만 지원 가능한 공고만 포함)
    - 단, 지방에서 시행하더라도 전국 대상이면 포함
 3. 만료(종료일 경과) 또는 과거 연도 공고 배제
 """
-import re
+import json
+import hashlib
 import logging
-from datetime import datetime, date
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+from src.config import Config
+from src.database import Database, content_hash
+from src.keyword_matcher import compile_keywords
+from src.region_rules import compile_region_rules
+from src.periods import from_epoch_day, normalize_posting_dates, today_epoch_day
 
 logger = logging.getLogger(__name__)
 
@@ -89,112 +95,177 @@ NATIONWIDE_KEYWORDS = [
     "누구나", "전체 기업", "전체기업",
 ]
 
+# 지역 제한 단계에 쓰이는 규칙 목록 (current_rules() 키)
+REGION_RULE_KEYS = ("regional_areas", "restriction_patterns", "metro_areas", "nationwide_keywords")
+
+# 판정 로직(규칙 목록 외) 버전 - 바꾸면 저장된 필터 판정(filter_verdicts)을 모두 다시 계산
+FILTER_LOGIC_VERSION = 1
+
 
-def _is_expired_or_outdated(posting: dict) -> bool:
+def _is_expired_or_outdated(posting: dict, today: Optional[int] = None) -> bool:
     """만료되었거나 과거 연도의 공고인지 확인
 
-    True를 반환하면 배제 대상
+    True를 반환하면 배제 대상.
+    저장 시 정규화된 start_day/end_day(epoch-day)를 쓰고, 없으면 여기서 정규화한다.
+    D-N 마감일(thevc 등)은 수집 시각 기준 날짜로 환산해 검증한다.
+    today(epoch-day)를 주면 그날 기준으로 판정한다 (백테스트용, 기본: 오늘).
     """
-    today = date.today()
-
+    today = today_epoch_day() if today is None else today
+    this_year = from_epoch_day(today).year
+    if "end_kind" not in posting:
+        normalize_posting_dates(posting, posting.get("collected_at"))
+    start_day, end_day = posting["start_day"], posting["end_day"]
     end_date_str = posting.get("end_date", "").strip()
-    start_date_str = posting.get("start_date", "").strip()
 
-    # D-day 형식 (thevc 등)은 검증 스킵
-    if end_date_str and not re.match(r"^\d{4}-\d{2}-\d{2}$", end_date_str):
+    # 상시접수 또는 해석할 수 없는 마감일 표기는 검증 스킵
+    if end_date_str and end_day is None:
         return False
 
     # end_date가 있고 이미 지난 경우 → 만료
-    if end_date_str:
-        try:
-            end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
-            if end_date < today:
-                logger.debug(f"만료 공고 배제: {posting.get('title', '')} (마감: {end_date_str})")
-                return True
-        except ValueError:
-            pass
+    if end_day is not None and end_day < today:
+        logger.debug(f"만료 공고 배제: {posting.get('title', '')} (마감: {end_date_str})")
+        return True
 
     # start_date가 작년 이전이고 end_date가 없거나 작년인 경우 → 오래된 공고
-    if start_date_str:
-        try:
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-            if start_date.year < today.year:
-                # end_date도 없거나 작년이면 배제
-                if not end_date_str:
-                    logger.debug(f"과거 연도 공고 배제: {posting.get('title', '')} (시작: {start_date_str})")
-                    return True
-                try:
-                    end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
-                    if end_date.year < today.year:
-                        logger.debug(f"과거 연도 공고 배제: {posting.get('title', '')} ({start_date_str}~{end_date_str})")
-                        return True
-                except ValueError:
-                    return True
-        except ValueError:
-            pass
+    if start_day is not None and from_epoch_day(start_day).year < this_year:
+        if end_day is None or from_epoch_day(end_day).year < this_year:
+            logger.debug(
+                f"과거 연도 공고 배제: {posting.get('title', '')} "
+                f"({posting.get('start_date', '')}~{end_date_str})"
+            )
+            return True
 
     return False
 
 
-def _is_region_restricted(posting: dict) -> bool:
-    """지방/경기 한정 공고인지 판별
+def current_rules() -> Dict[str, Tuple[str, ...]]:
+    """현재 필터 규칙 목록 (백테스트에서 다른 규칙과 나란히 비교할 때의 기준)"""
+    return {
+        "keywords": tuple(ALL_KEYWORDS + Config.FILTER_KEYWORDS),
+        "regional_areas": tuple(REGIONAL_AREAS),
+        "restriction_patterns": tuple(REGIONAL_RESTRICTION_PATTERNS),
+        "metro_areas": tuple(METRO_AREA),
+        "nationwide_keywords": tuple(NATIONWIDE_KEYWORDS),
+    }
 
-    True를 반환하면 배제 대상 (서울 서초구 기업이 참여 불가능)
+
+def edit_rule_list(base: Tuple[str, ...], value, name: str = "") -> Tuple[str, ...]:
+    """규칙 목록 편집 (목록: 통째로 교체, {"add": [...], "remove": [...]}: 추가/제거)
+
+    백테스트 규칙 파일과 필터 프로필 파일이 같은 형식을 쓴다.
     """
+    if isinstance(value, list):
+        edited = tuple(value)
+    elif isinstance(value, dict) and set(value) <= {"add", "remove"}:
+        removed = set(value.get("remove", []))
+        kept = [item for item in base if item not in removed]
+        edited = tuple(dict.fromkeys(kept + list(value.get("add", []))))
+    else:
+        raise ValueError(f"{name}: 목록 또는 {{\"add\": [...], \"remove\": [...]}} 형식이어야 합니다")
+    if not all(isinstance(item, str) for item in edited):
+        raise ValueError(f"{name}: 문자열 목록이어야 합니다")
+    return edited
+
+
+def match_keywords(posting: dict, keywords: Tuple[str, ...]) -> List[str]:
+    """제목/분류/지원대상/요약에 들어 있는 키워드 (키워드 목록 순서)"""
     searchable = " ".join([
         posting.get("title", ""),
+        posting.get("category", ""),
         posting.get("target", ""),
         posting.get("summary", ""),
-        posting.get("organization", ""),
     ])
+    return compile_keywords(keywords).matched(searchable)
 
-    if not searchable.strip():
-        return False
 
-    # 1) 전국 대상 키워드가 있으면 무조건 포함
-    for kw in NATIONWIDE_KEYWORDS:
-        if kw in searchable:
-            return False
+def restricted_area(posting: dict, rules: Dict[str, Tuple[str, ...]]) -> Optional[str]:
+    """지역 한정 공고이면 근거 지역명 (규칙 구성별로 컴파일한 판정기는 캐시 재사용)"""
+    engine = compile_region_rules(
+        rules["regional_areas"], rules["restriction_patterns"],
+        rules["metro_areas"], rules["nationwide_keywords"],
+    )
+    return engine.restricted_area(posting)
 
-    # 2) 서울/수도권 관련이면 포함
-    for area in METRO_AREA:
-        if area in searchable:
-            return False
 
-    # 3) 지방/경기/인천 지역명 + 제한 패턴 조합 검사
-    for area in REGIONAL_AREAS:
-        if area not in searchable:
-            continue
-
-        # 지역명이 단순 언급(시행기관 등)이 아니라 대상 제한인지 확인
-        for pattern in REGIONAL_RESTRICTION_PATTERNS:
-            full_pattern = f"{area}.*{pattern}|{pattern}.*{area}"
-            if re.search(full_pattern, searchable):
-                logger.debug(f"지역 제한 배제: [{area}] {posting.get('title', '')}")
-                return True
-
-        # 제목에 "[지역명]" 형태로 지역이 포함되고, 타겟에도 해당 지역만 언급
-        title = posting.get("title", "")
-        target = posting.get("target", "")
-        if (
-            re.search(rf"\[{area}\]|\({area}\)|{area}지역|{area}도|{area}시", title)
-            and area in target
-            and not any(m in target for m in METRO_AREA)
-            and not any(n in target for n in NATIONWIDE_KEYWORDS)
-        ):
-            logger.debug(f"지역 제한 배제 (제목+타겟): [{area}] {title}")
-            return True
+def _is_region_restricted(posting: dict) -> bool:
+    """지방/경기 한정 공고인지 판별
 
+    True를 반환하면 배제 대상 (서울 서초구 기업이 참여 불가능)
+    판정 규칙은 src.region_rules.RegionRuleEngine 참고:
+    1) 전국 대상 키워드 또는 서울/수도권이 언급되면 포함
+    2) 지방/경기/인천 지역명 + 제한 패턴 조합이 있으면 배제
+    3) 제목에 "[지역명]" 형태로 지역이 있고 지원대상에도 그 지역이 있으면 배제
+    """
+    area = restricted_area(posting, current_rules())
+    if area:
+        logger.debug(f"지역 제한 배제: [{area}] {posting.get('title', '')}")
+        return True
     return False
 
 
-def filter_relevant_postings(postings: List[dict]) -> List[dict]:
+def ruleset_versions(rules: Optional[Dict[str, Tuple[str, ...]]] = None) -> Tuple[str, str]:
+    """(키워드 단계 버전, 지역 단계 버전) - 각 단계 규칙 목록의 해시
+
+    판정 로직 자체를 바꾸면 FILTER_LOGIC_VERSION을 올려 저장된 판정을 모두 다시 계산하게 한다.
+    """
+    rules = rules or current_rules()
+    keyword_rules = [FILTER_LOGIC_VERSION, rules["keywords"]]
+    region_rules = [FILTER_LOGIC_VERSION] + [rules[key] for key in REGION_RULE_KEYS]
+    return tuple(
+        hashlib.blake2b(json.dumps(rules, ensure_ascii=False).encode(), digest_size=8).hexdigest()
+        for rules in (keyword_rules, region_rules)
+    )
+
+
+def evaluate_posting(posting: dict, versions: Optional[Tuple[str, str]] = None) -> dict:
+    """키워드/지역 단계 판정 (날짜에 따라 바뀌는 만료 단계는 제외)
+
+    반환 dict는 Database.save_filter_verdicts 형식:
+    excluded_stage는 "keyword" / "region" / None(통과), 지역 단계까지 가지 않으면 region_version은 None.
+    """
+    rules = current_rules()
+    keyword_version, region_version = versions or ruleset_versions(rules)
+    matched = match_keywords(posting, rules["keywords"])
+    verdict = {
+        "posting_id": posting["id"],
+        "content_hash": posting.get("content_hash") or content_hash(posting),
+        "keyword_version": keyword_version,
+        "region_version": None,
+        "matched_keywords": matched,
+        "excluded_stage": None,
+        "excluded_reason": None,
+    }
+    if not matched:
+        verdict["excluded_stage"] = "keyword"
+        return verdict
+    verdict["region_version"] = region_version
+    area = restricted_area(posting, rules)
+    if area:
+        logger.debug(f"지역 제한 배제: [{area}] {posting.get('title', '')}")
+        verdict["excluded_stage"] = "region"
+        verdict["excluded_reason"] = area
+    return verdict
+
+
+def _is_stale(verdict: Optional[dict], digest: str, versions: Tuple[str, str]) -> bool:
+    """저장된 판정을 다시 계산해야 하는지 (내용 또는 해당 단계 규칙이 바뀜)"""
+    if verdict is None or verdict["content_hash"] != digest:
+        return True
+    if verdict["keyword_version"] != versions[0]:
+        return True
+    # 키워드 단계에서 탈락한 공고는 지역 규칙이 바뀌어도 결과가 같음
+    return verdict["excluded_stage"] != "keyword" and verdict["region_version"] != versions[1]
+
+
+def filter_relevant_postings(postings: List[dict], db: Optional[Database] = None) -> List[dict]:
     """스타트업 또는 해외진출 관련 공고만 필터링
 
     필터링 순서:
     1. 만료/과거 연도 공고 배제
     2. 키워드 매칭 (스타트업/해외진출)
     3. 지역 제한 공고 배제 (경기/지방 한정)
+
+    db를 주면 2~3단계 판정을 filter_verdicts 테이블에서 재사용하고 새로 계산한 판정을 저장한다.
     """
     # 1단계: 만료/과거 연도 공고 제거
     date_valid = []
@@ -205,30 +276,28 @@ def filter_relevant_postings(postings: List[dict]) -> List[dict]:
         else:
             date_valid.append(posting)
 
-    # 2단계: 키워드 매칭
+    # 2~3단계: 키워드 매칭 → 지역 제한 배제 (내용/규칙이 그대로인 공고는 저장된 판정 사용)
+    versions = ruleset_versions()
+    stored = db.get_filter_verdicts(p["id"] for p in date_valid) if db is not None else {}
+    computed = []
     keyword_matched = []
-    for posting in date_valid:
-        searchable = " ".join([
-            posting.get("title", ""),
-            posting.get("category", ""),
-            posting.get("target", ""),
-            posting.get("summary", ""),
-        ]).lower()
-
-        matched = [kw for kw in ALL_KEYWORDS if kw.lower() in searchable]
-
-        if matched:
-            posting["_matched_keywords"] = matched
-            keyword_matched.append(posting)
-
-    # 3단계: 지역 제한 공고 배제
     filtered = []
     region_excluded = 0
-    for posting in keyword_matched:
-        if _is_region_restricted(posting):
+    for posting in date_valid:
+        verdict = stored.get(posting["id"])
+        if _is_stale(verdict, posting.get("content_hash") or content_hash(posting), versions):
+            verdict = evaluate_posting(posting, versions)
+            computed.append(verdict)
+        if verdict["excluded_stage"] == "keyword":
+            continue
+        posting["_matched_keywords"] = verdict["matched_keywords"]
+        keyword_matched.append(posting)
+        if verdict["excluded_stage"] == "region":
             region_excluded += 1
         else:
             filtered.append(posting)
+    if db is not None and computed:
+        db.save_filter_verdicts(computed)
 
     logger.info(
         f"필터링 결과: 전체 {len(postings)}건 → "
@@ -236,5 +305,30 @@ def filter_relevant_postings(postings: List[dict]) -> List[dict]:
         f"키워드 매칭 {len(keyword_matched)}건, "
         f"지역 제한 배제 {region_excluded}건 → "
         f"최종 {len(filtered)}건"
+        + (f" (판정 재사용 {len(date_valid) - len(computed)}건)" if db is not None else "")
     )
     return filtered
+
+
+def refresh_filter_verdicts(db: Database, chunk_size: int = 1000) -> Tuple[int, List[dict]]:
+    """저장된 전체 공고 중 판정이 없거나 오래된 행만 다시 계산
+
+    반환: (다시 계산한 건수, 결과가 바뀐 공고 목록 [{"id", "title", "before", "after"}])
+    before/after는 "pass" / "keyword" / "region" (이전 판정이 없으면 before는 None)
+    """
+    versions = ruleset_versions()
+    recomputed = 0
+    flipped = []
+    for rows in db.iter_stale_verdict_postings(*versions, chunk_size=chunk_size):
+        verdicts = []
+        for row in rows:
+            verdict = evaluate_posting(row, versions)
+            verdicts.append(verdict)
+            before = row["_previous_stage"]
+            after = verdict["excluded_stage"] or "pass"
+            if before is not None and before != after:
+                flipped.append({"id": row["id"], "title": row["title"], "before": before, "after": after})
+        db.save_filter_verdicts(verdicts)
+        recomputed += len(verdicts)
+    logger.info(f"필터 판정 갱신: {recomputed}건 재계산, 결과 변경 {len(flipped)}건")
+    return recomputed, flipped
@@ -0,0 +1,82 @@
+"""소스별 서킷 브레이커
+
+사이트가 내려가 있으면 매 실행마다 타임아웃(30초 x 재시도 3회)과 백오프를 기다리게 되므로,
+SOURCE_NAME별 연속 실패 횟수와 마지막 성공/실패 시각을 DB(source_health)에 저장해 두고
+실행 전에 상태를 판정한다.
+
+- closed: 정상 수집
+- open: 연속 실패가 임계치 이상이고 쿨다운 중 → 이번 실행에서 건너뜀
+- half_open: 쿨다운이 지남 → 재시도 없이 짧은 타임아웃으로 1페이지만 탐침 수집,
+  성공하면 자동으로 closed 복귀
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.config import Config
+from src.database import Database
+from src.collectors.base import BaseCollector
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """소스별 상태 판정 + 실행 결과 기록. skipped에 이번 실행에서 건너뛴 소스와 사유를 모은다."""
+
+    def __init__(self, db: Database, threshold: Optional[int] = None,
+                 cooldown_hours: Optional[float] = None):
+        self.db = db
+        self.threshold = threshold or Config.CIRCUIT_FAILURE_THRESHOLD
+        self.cooldown = timedelta(
+            hours=Config.CIRCUIT_COOLDOWN_HOURS if cooldown_hours is None else cooldown_hours
+        )
+        self.skipped: Dict[str, str] = {}
+
+    def check(self, source: str, now: Optional[datetime] = None) -> Tuple[str, str]:
+        """(상태, 사유) 반환"""
+        health = self.db.get_source_health(source)
+        if not health or health["consecutive_failures"] < self.threshold:
+            return CLOSED, ""
+
+        failures = health["consecutive_failures"]
+        error = (health.get("last_error") or "")[:100]
+        last_failure = datetime.fromisoformat(health["last_failure_at"])
+        retry_at = last_failure + self.cooldown
+        if (now or datetime.now()) < retry_at:
+            return OPEN, (
+                f"연속 {failures}회 실패 ({error}) - "
+                f"{retry_at.strftime('%Y-%m-%d %H:%M')} 이후 재시도"
+            )
+        return HALF_OPEN, f"연속 {failures}회 실패 후 쿨다운 경과 - 탐침 수집"
+
+    def admit(self, collectors: List[BaseCollector]) -> List[BaseCollector]:
+        """이번 실행에서 돌릴 수집기만 반환 (open은 제외, half_open은 탐침 모드)"""
+        admitted = []
+        for collector in collectors:
+            state, reason = self.check(collector.SOURCE_NAME)
+            if state == OPEN:
+                self.skipped[collector.SOURCE_NAME] = reason
+                logger.warning(f"[{collector.SOURCE_NAME}] 서킷 open - 수집 건너뜀: {reason}")
+                continue
+            if state == HALF_OPEN:
+                collector.probe = True
+                logger.info(f"[{collector.SOURCE_NAME}] 서킷 half-open: {reason}")
+            admitted.append(collector)
+        return admitted
+
+    def record(self, collectors: List[BaseCollector]):
+        """수집기 실행 결과를 소스 상태에 반영"""
+        for collector in collectors:
+            if not (collector.request_ok or collector.request_failed or collector.last_error):
+                # 실행 마감 등으로 요청을 한 번도 하지 않았으면 상태를 판단할 근거가 없음
+                continue
+            ok = collector.is_healthy()
+            self.db.record_source_result(collector.SOURCE_NAME, ok, collector.last_error)
+            if ok and collector.probe:
+                logger.info(f"[{collector.SOURCE_NAME}] 탐침 성공 - 서킷 closed 복귀")
+            elif not ok:
+                logger.warning(f"[{collector.SOURCE_NAME}] 수집 실패 기록: {collector.last_error}")
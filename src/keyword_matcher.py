@@ -0,0 +1,173 @@
+"""키워드 매칭 엔진 (Aho-Corasick 자동자)
+
+필터의 키워드 매칭은 공고마다 키워드 수만큼 부분 문자열 검색을 반복했다.
+KeywordMatcher는 키워드 전체를 자동자 하나로 한 번만 컴파일하고, 본문을 한 번 훑으며
+겹치는 매칭(예: "창업"과 "초기창업")까지 모두 찾는다. 비용은 키워드 수가 아니라 본문 길이에 비례한다.
+
+- 기본은 대소문자 구분 없음 (키워드와 본문 모두 str.lower() 기준, 위치는 소문자 본문 기준).
+  ignore_case=False이면 원문 그대로 비교한다.
+- pyahocorasick(ahocorasick)이 설치되어 있으면 C 구현(native)을 쓴다.
+- 없으면 순수 파이썬 자동자(automaton)를 쓴다. 전이는 실패 링크를 따라간 결과를 상태별 dict에
+  기억해 두므로 같은 (상태, 글자)는 한 번만 계산한다.
+- 순수 파이썬 자동자는 글자마다 인터프리터 비용이 들어 키워드가 적으면 C 부분 문자열 검색보다 느리므로,
+  키워드가 SCAN_MAX_PATTERNS개 이하이면 키워드별 검색(scan)을 쓴다 (benchmarks/bench_filters.py).
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # 선택 의존성
+    ahocorasick = None
+
+# native가 없을 때 이 개수 이하의 키워드는 키워드별 부분 문자열 검색이 자동자보다 빠름
+SCAN_MAX_PATTERNS = 128
+ENGINES = ("auto", "native", "automaton", "scan")
+
+
+class KeywordMatcher:
+    """키워드 목록을 컴파일한 매칭기
+
+    matched()는 기존 필터와 같은 형태(키워드 목록 순서, 목록 항목당 1번)로 결과를 돌려준다.
+    """
+
+    def __init__(self, keywords: Sequence[str], engine: str = "auto", ignore_case: bool = True):
+        if engine not in ENGINES:
+            raise ValueError(f"알 수 없는 매칭 엔진: {engine} ({', '.join(ENGINES)})")
+        self.keywords: List[str] = list(keywords)
+        self.ignore_case = ignore_case
+        # (소문자) 패턴 → 해당 패턴을 가진 키워드 목록 인덱스 (대소문자만 다른 중복 키워드 포함)
+        self._patterns: Dict[str, List[int]] = {}
+        for i, kw in enumerate(self.keywords):
+            if kw:
+                self._patterns.setdefault(self._fold(kw), []).append(i)
+        if engine == "auto":
+            if ahocorasick is not None:
+                engine = "native"
+            elif len(self._patterns) <= SCAN_MAX_PATTERNS:
+                engine = "scan"
+            else:
+                engine = "automaton"
+        if engine == "native" and ahocorasick is None:
+            raise RuntimeError("native 엔진은 pyahocorasick 패키지가 필요합니다")
+        self.engine = engine
+
+        self._native = None
+        if engine == "native":
+            automaton = ahocorasick.Automaton()
+            for pattern, indices in self._patterns.items():
+                automaton.add_word(pattern, (len(pattern), tuple(indices)))
+            if self._patterns:
+                automaton.make_automaton()
+                self._native = automaton
+        elif engine == "automaton":
+            self._build()
+
+    def _fold(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def _build(self):
+        """goto 트리 + 실패 링크 + 출력(그 상태에서 끝나는 패턴 인덱스) 구성"""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[Tuple[int, int], ...]] = [()]
+        for pattern, indices in self._patterns.items():
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append(())
+                state = nxt
+            outputs[state] = tuple((len(pattern), i) for i in indices)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0) if state else 0
+                outputs[nxt] = outputs[nxt] + outputs[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+        # (상태, 글자) → 다음 상태 (실패 링크 추적 결과를 기억)
+        self._delta: List[Dict[str, int]] = [dict(edges) for edges in goto]
+
+    def _step(self, state: int, ch: str) -> int:
+        delta = self._delta[state]
+        nxt = delta.get(ch)
+        if nxt is None:
+            s = state
+            while s and ch not in self._goto[s]:
+                s = self._fail[s]
+            nxt = self._goto[s].get(ch, 0)
+            delta[ch] = nxt
+        return nxt
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, str]]:
+        """(시작 위치, 키워드) 매칭 (겹치는 매칭 포함, native/automaton은 본문 순서대로)"""
+        text = self._fold(text)
+        if not self._patterns:
+            return
+        if self._native is not None:
+            for end, (length, indices) in self._native.iter(text):
+                for i in indices:
+                    yield end - length + 1, self.keywords[i]
+            return
+        if self.engine == "scan":
+            for pattern, indices in self._patterns.items():
+                start = text.find(pattern)
+                while start != -1:
+                    for i in indices:
+                        yield start, self.keywords[i]
+                    start = text.find(pattern, start + 1)
+            return
+        delta, outputs, step = self._delta, self._outputs, self._step
+        state = 0
+        for pos, ch in enumerate(text):
+            nxt = delta[state].get(ch)
+            state = step(state, ch) if nxt is None else nxt
+            if outputs[state]:
+                for length, i in outputs[state]:
+                    yield pos - length + 1, self.keywords[i]
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """(시작 위치, 키워드) 목록 (위치 → 키워드 순으로 정렬, 엔진과 무관하게 같은 결과)"""
+        return sorted(self.iter_matches(text))
+
+    def matched(self, text: str) -> List[str]:
+        """본문에 들어 있는 키워드 목록 (키워드 목록 순서, 항목당 1번)"""
+        found = set()
+        text = self._fold(text)
+        if not self._patterns:
+            return []
+        if self._native is not None:
+            for _, (_, indices) in self._native.iter(text):
+                found.update(indices)
+        elif self.engine == "scan":
+            for pattern, indices in self._patterns.items():
+                if pattern in text:
+                    found.update(indices)
+        else:
+            delta, outputs, step = self._delta, self._outputs, self._step
+            state = 0
+            for ch in text:
+                nxt = delta[state].get(ch)
+                state = step(state, ch) if nxt is None else nxt
+                if outputs[state]:
+                    found.update(i for _, i in outputs[state])
+        return [self.keywords[i] for i in sorted(found)]
+
+
+@lru_cache(maxsize=16)
+def compile_keywords(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """키워드 튜플별로 한 번만 컴파일한 매칭기 (같은 키워드 구성이면 재사용)"""
+    return KeywordMatcher(keywords)
@@ -10,6 +10,7 @@ import sys
 import logging
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
 # 프로젝트 루트를 sys.path에 추가
 _project_root = Path(__file__).parent.parent
@@ -17,6 +18,9 @@ sys.path.insert(0, str(_project_root))
 
 from src.config import Config
 from src.database import Database
+from src.deadline import start_run_deadline
+from src.collectors.base import BaseCollector
+from src.collectors.http_cache import get_http_cache
 from src.collectors.bizinfo import BizinfoCollector
 from src.collectors.smes import SmesCollector
 from src.collectors.kstartup import KStartupCollector
@@ -25,8 +29,13 @@ from src.collectors.tipa import TipaCollector
 from src.collectors.nipa import NipaCollector
 from src.collectors.thevc import TheVCCollector
 from src.collectors.mss import MssCollector
+from src.dedup import cluster_postings
+from src.enrichment import enrich_postings
+from src.health import CircuitBreaker
+from src.pipeline import PostingSink, stream_postings
 from src.notifier import SlackNotifier
 from src.filters import filter_relevant_postings
+from src.profiles import ProfileRouter, load_profiles, route_postings
 
 logging.basicConfig(
     level=logging.INFO,
@@ -36,12 +45,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def collect_postings(db: Database) -> list:
-    """모든 수집기를 실행하고 신규 공고 목록(dict 리스트) 반환
-
-    DB에 이미 존재하는 공고는 insert_posting()에서 걸러지므로,
-    반환되는 리스트는 이번 실행에서 처음 발견된 공고만 포함.
-    """
+def build_collectors() -> List[BaseCollector]:
+    """설정에 따라 활성화된 수집기 목록 생성"""
     collectors = []
 
     # 웹 크롤링 수집기 (API 키 불필요)
@@ -62,23 +67,68 @@ def collect_postings(db: Database) -> list:
     else:
         logger.warning("KSTARTUP_API_KEY 미설정 - K-Startup 수집 건너뜀")
 
+    return collectors
+
+
+def collect_postings(db: Database, collectors: Optional[List[BaseCollector]] = None,
+                     breaker: Optional[CircuitBreaker] = None) -> list:
+    """모든 수집기를 실행하고 신규 공고 목록(dict 리스트) 반환
+
+    DB에 이미 존재하는 공고는 PostingSink의 배치 저장에서 걸러지므로,
+    반환되는 리스트는 이번 실행에서 처음 발견된 공고만 포함.
+    수집은 병렬로 진행하고, 공고는 나오는 대로 메인 스레드에서 배치 단위로 저장한다.
+    서킷 브레이커가 건너뛴 소스와 사유는 breaker.skipped에 남는다.
+    """
+    if collectors is None:
+        collectors = build_collectors()
+
     if not collectors:
         logger.error("활성화된 수집기가 없습니다. API 키를 설정해주세요.")
         return []
 
-    new_postings = []
+    # 장애가 이어지는 소스는 건너뛰거나 탐침 모드로 실행
+    breaker = breaker or CircuitBreaker(db)
+    collectors = breaker.admit(collectors)
+
+    # 기존 공고 ID 인덱스 연결: 수집기는 기존 행의 레코드 생성을 건너뛰고,
+    # 페이지네이션은 기존 공고만 남은 페이지에서 중단한다 (SQLite 왕복 없음)
+    # TRACK_UPDATES(기본)이면 기존 행도 레코드를 만들어 내용이 바뀐 경우 갱신한다
+    # (기존 행 파싱 생략은 꺼지지만 페이지 조기 중단은 그대로)
+    id_index = db.id_index or db.load_id_index()
+    logger.info(f"기존 ID 인덱스: {len(id_index)}건 ({id_index.memory_bytes() / 1024:.0f} KiB)")
     for collector in collectors:
-        try:
-            postings = collector.collect()
-            for posting in postings:
-                if db.insert_posting(posting):
-                    new_postings.append(posting)
-        except Exception as e:
-            logger.error(f"{collector.__class__.__name__} 실행 실패: {e}")
+        collector.known_ids_lookup = id_index.known
+        collector.skip_known_rows = not Config.TRACK_UPDATES
+
+    sink = PostingSink(db)
+    new_postings = []
+    for posting in stream_postings(collectors):
+        new_postings.extend(sink.add(posting))
+    new_postings.extend(sink.flush())
+    logger.info(
+        f"수집 스트림: 수신 {sink.received}건 → 신규 저장 {sink.inserted}건, "
+        f"내용 갱신 {len(sink.updated_ids)}건"
+    )
+
+    breaker.record(collectors)
+    _report_cache_stats(collectors)
+    # DB 반영이 끝난 뒤에 캐시를 저장해야 "변경 없음" 판정이 누락을 만들지 않음
+    if Config.HTTP_CACHE_ENABLED:
+        get_http_cache().save()
 
     return new_postings
 
 
+def _report_cache_stats(collectors: List[BaseCollector]):
+    """소스별 HTTP 캐시 적중/미스 건수 로그"""
+    for collector in collectors:
+        if collector.cache_hits or collector.cache_misses:
+            logger.info(
+                f"[{collector.SOURCE_NAME}] HTTP 캐시 적중 {collector.cache_hits}건 / "
+                f"미스 {collector.cache_misses}건"
+            )
+
+
 def main():
     logger.info("=" * 50)
     logger.info("스타트업 지원사업 공고 수집 시작")
@@ -88,6 +138,14 @@ def main():
         logger.error("SLACK_BOT_TOKEN이 설정되지 않았습니다.")
         sys.exit(1)
 
+    # 실행 마감 시간 설정 (수집/보강/알림 단계가 모두 참고)
+    deadline = start_run_deadline()
+    if deadline.expires_at is not None:
+        logger.info(
+            f"실행 마감: {Config.RUN_DEADLINE_SECONDS:.0f}초 "
+            f"(알림 전송 예약 {Config.DELIVERY_RESERVE_SECONDS:.0f}초)"
+        )
+
     db = Database()
     try:
         # 0. 오늘 이미 알림을 보냈는지 확인 → 중복 발송 방지
@@ -97,16 +155,46 @@ def main():
             return
 
         # 1. 공고 수집 (DB 기준 신규 공고만 반환)
-        new_postings = collect_postings(db)
+        collectors = build_collectors()
+        breaker = CircuitBreaker(db)
+        new_postings = collect_postings(db, collectors, breaker)
         logger.info(f"신규 수집: {len(new_postings)}건")
-
-        # 2. 필터링 (만료/과거 배제 → 키워드 매칭 → 지역 제한 배제)
-        filtered = filter_relevant_postings(new_postings)
-        logger.info(f"필터링 후 발송 대상: {len(filtered)}건")
-
-        # 3. Slack 알림 발송
-        notifier = SlackNotifier()
-        success = notifier.send_daily_report(filtered)
+        for source, reason in breaker.skipped.items():
+            logger.warning(f"건너뛴 소스 - {source}: {reason}")
+
+        # 1-1. 지원대상/요약이 빈 신규 공고는 상세 페이지로 보강
+        if Config.ENRICH_ENABLED:
+            enrich_postings(db, new_postings, collectors)
+
+        # 1-2. 다른 출처에 올라온 같은 공고는 대표 1건만 알림
+        candidates = new_postings
+        if Config.DEDUP_ENABLED:
+            candidates = cluster_postings(db, new_postings)
+
+        # 2~3. 필터링 후 Slack 알림 발송
+        # 프로필 파일이 있으면 팀 프로필별로 분배해 채널마다 발송
+        if Config.FILTER_PROFILES_PATH:
+            # 저장되는 필터 판정(filter_verdicts)은 기본 규칙 기준이므로 프로필 모드에서도 기록해 둔다
+            # (판정 갱신 CLI가 규칙 변경 전후를 비교할 기준). 발송 대상은 아래 프로필 분배 결과.
+            filter_relevant_postings(candidates, db)
+            routed = route_postings(candidates, ProfileRouter(load_profiles()))
+            filtered = list({p["id"]: p for posts in routed.values() for p in posts}.values())
+            logger.info(f"프로필 분배 후 발송 대상: {len(filtered)}건 ({len(routed)}개 채널)")
+            if candidates and not filtered:
+                # 채널마다 "공고 없음" 리포트는 그대로 보내고 정상 발송으로 기록
+                logger.info(f"신규 공고 {len(candidates)}건 중 어느 프로필에도 해당하는 공고 없음")
+            success = True
+            for channel, posts in routed.items():
+                notifier = SlackNotifier(channel=channel)
+                if not notifier.send_daily_report(posts, skipped_sources=breaker.skipped):
+                    logger.warning(f"#{channel} 알림 전송 실패")
+                    success = False
+        else:
+            # 만료/과거 배제 → 키워드 매칭 → 지역 제한 배제, 판정은 DB에 저장
+            filtered = filter_relevant_postings(candidates, db)
+            logger.info(f"필터링 후 발송 대상: {len(filtered)}건")
+            notifier = SlackNotifier()
+            success = notifier.send_daily_report(filtered, skipped_sources=breaker.skipped)
 
         if success:
             # 오늘 발송 기록 (중복 발송 방지)
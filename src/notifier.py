@@ -7,32 +7,44 @@ import json
 import logging
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import requests
 
 from src.config import Config
+from src.deadline import get_deadline
 
 logger = logging.getLogger(__name__)
 
+# 스레드 댓글 전송을 멈추는 실행 마감까지의 남은 시간 (초)
+NOTIFY_MIN_REMAINING_SECONDS = 10
+
 
 class SlackNotifier:
     """Slack Bot API를 통한 스레드 기반 알림 전송"""
 
-    def __init__(self):
+    def __init__(self, channel: Optional[str] = None):
+        """channel: 전송할 채널 (기본: SLACK_CHANNEL, 필터 프로필별 채널은 src.profiles 참고)"""
         self.bot_token = Config.SLACK_BOT_TOKEN
-        self.channel = Config.SLACK_CHANNEL
+        self.channel = channel or Config.SLACK_CHANNEL
         self.api_url = "https://slack.com/api/chat.postMessage"
         self.headers = {
             "Authorization": f"Bearer {self.bot_token}",
             "Content-Type": "application/json; charset=utf-8",
         }
+        # 메인 메시지 + 스레드 댓글 N건을 같은 keep-alive 연결로 전송
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
+    def send_daily_report(self, postings: List[dict],
+                          skipped_sources: Optional[Dict[str, str]] = None) -> bool:
+        """메인 메시지 + 스레드 댓글로 일일 리포트 전송
 
-    def send_daily_report(self, postings: List[dict]) -> bool:
-        """메인 메시지 + 스레드 댓글로 일일 리포트 전송"""
+        skipped_sources: 서킷 브레이커로 이번 실행에서 건너뛴 소스 -> 사유
+        """
         if not postings:
             logger.info("신규 공고 없음 - 공고 없음 메시지 전송")
-            return self._send_no_updates()
+            return self._send_no_updates(skipped_sources)
 
         # 1. 메인 메시지 전송 → thread_ts 확보
         today = datetime.now().strftime("%Y-%m-%d")
@@ -74,18 +86,35 @@ class SlackNotifier:
                 ],
             },
         ]
+        if skipped_sources:
+            main_blocks.append(self._build_skipped_block(skipped_sources))
 
         thread_ts = self._post_message(main_blocks, f"신규 스타트업 지원사업 공고 {len(postings)}건")
         if not thread_ts:
             return False
 
-        # 2. 각 공고를 스레드 댓글로 전송
+        # 2. 각 공고를 스레드 댓글로 전송 (실행 마감이 임박하면 나머지는 생략 안내)
+        deadline = get_deadline()
+        sent = 0
         for i, posting in enumerate(postings, 1):
+            if deadline.remaining() < NOTIFY_MIN_REMAINING_SECONDS:
+                omitted = len(postings) - sent
+                logger.warning(f"실행 마감 임박 - 스레드 {omitted}건 전송 생략")
+                self._post_message(
+                    [{"type": "context", "elements": [{
+                        "type": "mrkdwn",
+                        "text": f":hourglass: 실행 시간 제한으로 나머지 {omitted}건은 생략되었습니다.",
+                    }]}],
+                    f"나머지 {omitted}건 생략",
+                    thread_ts=thread_ts,
+                )
+                break
             blocks = self._build_posting_blocks(posting, index=i, total=len(postings))
             self._post_message(blocks, posting["title"], thread_ts=thread_ts)
+            sent += 1
             time.sleep(0.3)  # rate limit 방지
 
-        logger.info(f"메인 메시지 + {len(postings)}건 스레드 전송 완료")
+        logger.info(f"메인 메시지 + {sent}건 스레드 전송 완료")
         return True
 
     def _build_posting_blocks(self, posting: dict, index: int, total: int) -> List[dict]:
@@ -106,6 +135,12 @@ class SlackNotifier:
         if posting.get("summary"):
             summary = posting["summary"][:200]
             parts.append(f":page_facing_up:  {summary}")
+        if posting.get("_duplicates"):
+            others = ", ".join(
+                f"<{d['url']}|{d['source']}>" if d.get("url") else d["source"]
+                for d in posting["_duplicates"]
+            )
+            parts.append(f":repeat:  같은 공고: {others}")
 
         text = "\n".join(parts)
 
@@ -130,7 +165,16 @@ class SlackNotifier:
 
         return blocks
 
-    def _send_no_updates(self) -> bool:
+    @staticmethod
+    def _build_skipped_block(skipped_sources: Dict[str, str]) -> dict:
+        """수집을 건너뛴 소스 안내 블록"""
+        lines = [f":construction: {source}: {reason}" for source, reason in skipped_sources.items()]
+        return {
+            "type": "context",
+            "elements": [{"type": "mrkdwn", "text": "\n".join(["*수집 건너뜀*"] + lines)[:3000]}],
+        }
+
+    def _send_no_updates(self, skipped_sources: Optional[Dict[str, str]] = None) -> bool:
         """신규 공고 없을 때 메시지"""
         today = datetime.now().strftime("%Y-%m-%d")
         blocks = [
@@ -142,6 +186,8 @@ class SlackNotifier:
                 },
             }
         ]
+        if skipped_sources:
+            blocks.append(self._build_skipped_block(skipped_sources))
         ts = self._post_message(blocks, "오늘은 신규 지원사업이 없습니다")
         return ts is not None
 
@@ -158,11 +204,10 @@ class SlackNotifier:
             payload["thread_ts"] = thread_ts
 
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 self.api_url,
-                headers=self.headers,
                 data=json.dumps(payload),
-                timeout=10,
+                timeout=min(10, max(1, get_deadline().remaining())),
             )
             data = resp.json()
             if data.get("ok"):
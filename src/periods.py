@@ -0,0 +1,77 @@
+"""신청 기간 정규화 - 시작일/마감일 문자열을 epoch-day 정수로 변환
+
+출처마다 마감일 표기가 달라(2026-03-15, D-12, 상시접수 등) 필터가 매번 문자열을 다시 파싱하고
+D-day 형식은 검증을 건너뛰었다. 저장 시점에 한 번 정수 일수(1970-01-01 기준)로 바꿔
+postings.start_day / end_day / end_kind 컬럼에 저장하면 만료 판정과 "N일 내 마감" 조회가
+인덱스 범위 조회가 된다.
+
+end_kind:
+- date: 날짜로 표기된 마감일
+- dday: D-N 표기 (수집 시각 기준 N일 뒤로 환산)
+- rolling: 상시/수시 접수 (마감일 없음, 만료되지 않음)
+- "": 마감일 없음 또는 해석 불가
+"""
+import re
+from datetime import date, datetime
+from typing import Optional, Tuple, Union
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+KIND_DATE = "date"
+KIND_DDAY = "dday"
+KIND_ROLLING = "rolling"
+
+_DATE_PATTERN = re.compile(r"(\d{4})\s*[.\-/년]?\s*(\d{1,2})\s*[.\-/월]?\s*(\d{1,2})")
+_DDAY_PATTERN = re.compile(r"D\s*-\s*(\d+|DAY)", re.IGNORECASE)
+_ROLLING_PATTERN = re.compile(r"상시|수시|예산\s*소진|소진\s*시")
+
+
+def to_epoch_day(value: date) -> int:
+    return value.toordinal() - EPOCH_ORDINAL
+
+
+def from_epoch_day(day: int) -> date:
+    return date.fromordinal(day + EPOCH_ORDINAL)
+
+
+def today_epoch_day() -> int:
+    return to_epoch_day(date.today())
+
+
+def parse_date_day(value: str) -> Optional[int]:
+    """YYYY-MM-DD / YYYY.MM.DD / YYYYMMDD 등 → epoch-day (해석 불가면 None)"""
+    match = _DATE_PATTERN.search(value or "")
+    if not match:
+        return None
+    try:
+        return to_epoch_day(date(*(int(g) for g in match.groups())))
+    except ValueError:
+        return None
+
+
+def parse_deadline(value: str, reference: Union[date, datetime, None] = None) -> Tuple[Optional[int], str]:
+    """마감일 표기 → (epoch-day, end_kind). D-N은 reference(수집 시각) 기준으로 환산."""
+    value = (value or "").strip()
+    if not value:
+        return None, ""
+    day = parse_date_day(value)
+    if day is not None:
+        return day, KIND_DATE
+    dday = _DDAY_PATTERN.search(value)
+    if dday:
+        if isinstance(reference, datetime):
+            reference = reference.date()
+        offset = 0 if dday.group(1).upper() == "DAY" else int(dday.group(1))
+        return to_epoch_day(reference or date.today()) + offset, KIND_DDAY
+    if _ROLLING_PATTERN.search(value):
+        return None, KIND_ROLLING
+    return None, ""
+
+
+def normalize_posting_dates(posting: dict, collected_at: Union[date, datetime, str, None] = None) -> dict:
+    """공고 dict에 start_day / end_day / end_kind를 채워 반환 (D-N은 collected_at 기준)"""
+    if isinstance(collected_at, str):
+        collected_at = datetime.fromisoformat(collected_at)
+    posting["start_day"] = parse_date_day(posting.get("start_date", ""))
+    posting["end_day"], posting["end_kind"] = parse_deadline(posting.get("end_date", ""), collected_at)
+    return posting
@@ -0,0 +1,184 @@
+"""수집 파이프라인 - 수집기 실행 엔진 + 공통 중복 제거/배치 저장 단계
+
+수집기는 iter_postings()로 공고를 파싱되는 대로 흘려보내고,
+stream_postings()가 여러 수집기의 출력을 하나의 스트림으로 합친다.
+PostingSink가 스트림에서 ID 중복을 걸러 배치 단위로 DB에 저장하므로
+수집기별로 전체 리스트를 만들지 않아 깊은 페이지 수집에도 메모리가 일정하다.
+"""
+import asyncio
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
+
+from src.config import Config
+from src.database import Database
+from src.deadline import DeadlineExceeded
+from src.collectors.base import BaseCollector
+from src.collectors.http import AsyncHttpClient
+
+logger = logging.getLogger(__name__)
+
+# 수집기 1개의 스트림이 끝났음을 알리는 표식
+_DONE = object()
+
+
+def _iter_collector(collector: BaseCollector) -> Iterator[dict]:
+    """수집기 1개의 스트림. 실패해도 그때까지 나온 공고는 유지하고 다른 수집기에 영향 없음."""
+    try:
+        yield from collector.iter_postings()
+    except DeadlineExceeded as e:
+        logger.warning(f"{collector.__class__.__name__} 실행 마감으로 중단: {e}")
+    except Exception as e:
+        collector.last_error = str(e) or e.__class__.__name__
+        logger.error(f"{collector.__class__.__name__} 실행 실패: {e}")
+
+
+def _drain(collector: BaseCollector, out: queue.Queue):
+    """작업 스레드에서 수집기 스트림을 끝까지 읽어 큐로 전달"""
+    try:
+        for posting in _iter_collector(collector):
+            out.put(posting)
+    finally:
+        out.put(_DONE)
+
+
+def stream_postings(collectors: List[BaseCollector],
+                    max_workers: Optional[int] = None) -> Iterator[dict]:
+    """여러 수집기의 공고를 나오는 순서대로 하나의 스트림으로 반환
+
+    각 수집기는 네트워크 I/O 대기가 대부분이므로 스레드 풀로 동시에 실행한다.
+    전체 소요 시간은 가장 느린 소스 기준이며, 빠른 소스의 공고는 느린 소스를 기다리지 않고
+    바로 소비자(DB 저장 등)에게 전달된다. max_workers가 1 이하이면 순차 실행.
+    COLLECT_ENGINE=async이면 run_collectors_async()로 이벤트 루프에서 실행한다.
+    """
+    workers = Config.COLLECT_WORKERS if max_workers is None else max_workers
+    workers = min(workers, len(collectors))
+    if Config.COLLECT_ENGINE == "async":
+        yield from _stream_async(collectors, max(1, workers))
+        return
+    if workers <= 1:
+        for collector in collectors:
+            yield from _iter_collector(collector)
+        return
+
+    out: queue.Queue = queue.Queue()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="collector") as pool:
+        for collector in collectors:
+            pool.submit(_drain, collector, out)
+        remaining = len(collectors)
+        while remaining:
+            item = out.get()
+            if item is _DONE:
+                remaining -= 1
+            else:
+                yield item
+
+
+def _stream_async(collectors: List[BaseCollector], max_workers: int) -> Iterator[dict]:
+    """비동기 엔진의 이벤트 루프를 별도 스레드에서 돌리며 공고를 나오는 대로 반환"""
+    out: queue.Queue = queue.Queue()
+
+    def run():
+        try:
+            asyncio.run(run_collectors_async(collectors, max_workers, out))
+        except Exception as e:
+            logger.error(f"비동기 수집 엔진 실패: {e}")
+        finally:
+            out.put(_DONE)
+
+    runner = threading.Thread(target=run, name="collector-async", daemon=True)
+    runner.start()
+    while True:
+        item = out.get()
+        if item is _DONE:
+            break
+        yield item
+    runner.join()
+
+
+async def _run_collector_async(collector: BaseCollector, semaphore: asyncio.Semaphore,
+                               out: Optional[queue.Queue] = None) -> List[dict]:
+    """비동기 엔진에서 수집기 1개 실행 (실패 격리)
+
+    out이 있으면 공고를 나오는 대로 큐에 넣고, 없으면 모아서 반환한다.
+    실패해도 그때까지 나온 공고는 유지한다.
+    """
+    postings = []
+    async with semaphore:
+        try:
+            async for posting in collector.iter_postings_async():
+                if out is not None:
+                    out.put(posting)
+                else:
+                    postings.append(posting)
+        except DeadlineExceeded as e:
+            logger.warning(f"{collector.__class__.__name__} 실행 마감으로 중단: {e}")
+        except Exception as e:
+            collector.last_error = str(e) or e.__class__.__name__
+            logger.error(f"{collector.__class__.__name__} 실행 실패: {e}")
+    return postings
+
+
+async def run_collectors_async(collectors: List[BaseCollector], max_workers: int,
+                               out: Optional[queue.Queue] = None) -> List[List[dict]]:
+    """수집기들을 하나의 이벤트 루프에서 공유 HTTP 클라이언트로 실행
+
+    out(스레드 안전 큐)을 주면 공고를 수집기별로 모으지 않고 나오는 대로 큐로 보낸다
+    (stream_postings()의 비동기 엔진 경로).
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+    async with AsyncHttpClient() as client:
+        for collector in collectors:
+            collector.http_client = client
+        try:
+            return list(await asyncio.gather(
+                *(_run_collector_async(c, semaphore, out) for c in collectors)
+            ))
+        finally:
+            for collector in collectors:
+                collector.http_client = None
+
+
+class PostingSink:
+    """공고 스트림 공통 후처리: 이번 실행 내 ID 중복 제거 + 배치 단위 DB 저장
+
+    add()/flush()는 DB에 새로 저장된 공고 리스트를 반환하므로
+    호출 측은 배치가 저장되는 대로 다음 단계를 진행할 수 있다.
+    track_updates이면 기존 공고는 내용이 바뀐 경우에만 갱신하고 ID를 updated_ids에 남긴다.
+    """
+
+    def __init__(self, db: Database, batch_size: Optional[int] = None,
+                 track_updates: Optional[bool] = None):
+        self.db = db
+        self.batch_size = batch_size or Config.INSERT_BATCH_SIZE
+        self.track_updates = Config.TRACK_UPDATES if track_updates is None else track_updates
+        self._seen = set()
+        self._buffer: List[dict] = []
+        self.received = 0
+        self.inserted = 0
+        self.updated_ids: List[str] = []
+
+    def add(self, posting: dict) -> List[dict]:
+        self.received += 1
+        if posting["id"] in self._seen:
+            return []
+        self._seen.add(posting["id"])
+        self._buffer.append(posting)
+        if len(self._buffer) >= self.batch_size:
+            return self.flush()
+        return []
+
+    def flush(self) -> List[dict]:
+        if not self._buffer:
+            return []
+        batch, self._buffer = self._buffer, []
+        if self.track_updates:
+            new_ids, updated_ids = self.db.upsert_postings_bulk(batch)
+            new_ids = set(new_ids)
+            self.updated_ids.extend(updated_ids)
+        else:
+            new_ids = set(self.db.insert_postings_bulk(batch))
+        self.inserted += len(new_ids)
+        return [p for p in batch if p["id"] in new_ids]
@@ -0,0 +1,187 @@
+"""팀별 필터 프로필 - 공고 1건을 한 번 훑어 조건이 맞는 모든 프로필(채널)로 분배
+
+filters.py의 기본 규칙은 회사 하나(서울 서초구 스타트업 + 도쿄 법인) 기준이다.
+FILTER_PROFILES_PATH에 프로필 파일(JSON)을 지정하면 팀마다 키워드 / 허용 지역 / 알림 채널을 따로 둔다.
+
+    {"profiles": [
+        {"name": "global", "channel": "global-biz",
+         "keywords": {"add": ["딥테크"], "remove": ["국제"]}},
+        {"name": "busan-lab", "channel": "busan",
+         "keywords": ["R&D", "연구개발", "실증"], "allowed_regions": ["부산", "경남"]}
+    ]}
+
+- keywords: 목록이면 그 키워드만, {"add", "remove"}면 기본 키워드(filters.ALL_KEYWORDS + FILTER_KEYWORDS)를 편집
+- allowed_regions: 참여 가능한 지역 (기본: 서울/수도권). 이 지역이 언급되면 지역 제한으로 보지 않고,
+  나머지 지역(서울/수도권 포함) 소재 기업 한정 공고는 배제한다. ["*"]이면 지역 제한 단계를 생략.
+- channel: Slack 채널 (기본: SLACK_CHANNEL)
+
+ProfileRouter는 프로필 전체를 한 번에 컴파일한다.
+- 키워드: 모든 프로필 키워드의 합집합을 매칭기(KeywordMatcher) 하나로 한 번 훑고,
+  매칭된 키워드 → 그 키워드를 가진 프로필 색인으로 후보 프로필을 모은다.
+- 지역: 허용 지역 구성이 같은 프로필은 한 그룹으로 묶고, 그룹 전체를 RegionRuleGroups로
+  본문 1회 탐색으로 판정한다. 키워드가 맞은 프로필이 있는 그룹만 판정한다.
+프로필 수가 늘어도 본문 탐색 횟수는 그대로이고, 공고당 추가 비용은 매칭된 키워드/그룹 수에 비례한다.
+"""
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from src.config import Config
+from src.filters import (
+    ALL_KEYWORDS, METRO_AREA, NATIONWIDE_KEYWORDS, REGIONAL_AREAS, REGIONAL_RESTRICTION_PATTERNS,
+    _is_expired_or_outdated, edit_rule_list,
+)
+from src.keyword_matcher import KeywordMatcher
+from src.region_rules import RegionRuleGroups
+
+logger = logging.getLogger(__name__)
+
+# allowed_regions에 이 값이 있으면 지역 제한 단계 생략
+ANY_REGION = "*"
+_PROFILE_FIELDS = {"name", "channel", "keywords", "allowed_regions"}
+
+
+def default_profile() -> dict:
+    """filters.py 기본 규칙과 같은 프로필 (프로필 파일이 없을 때)"""
+    return {
+        "name": "default",
+        "channel": Config.SLACK_CHANNEL,
+        "keywords": tuple(ALL_KEYWORDS + Config.FILTER_KEYWORDS),
+        "allowed_regions": tuple(METRO_AREA),
+    }
+
+
+def parse_profiles(data: dict) -> List[dict]:
+    """프로필 파일 내용 → 프로필 dict 목록 (name / channel / keywords / allowed_regions)"""
+    entries = data.get("profiles") if isinstance(data, dict) else None
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("프로필 파일에는 비어 있지 않은 \"profiles\" 목록이 있어야 합니다")
+    base = default_profile()
+    profiles = []
+    names = set()
+    for entry in entries:
+        name = entry.get("name") if isinstance(entry, dict) else None
+        if not name or not isinstance(name, str):
+            raise ValueError(f"프로필 이름(name)이 없습니다: {entry}")
+        if name in names:
+            raise ValueError(f"프로필 이름 중복: {name}")
+        unknown = set(entry) - _PROFILE_FIELDS
+        if unknown:
+            raise ValueError(f"{name}: 알 수 없는 항목 {', '.join(sorted(unknown))}")
+        names.add(name)
+        profiles.append({
+            "name": name,
+            "channel": entry.get("channel") or base["channel"],
+            "keywords": edit_rule_list(base["keywords"], entry.get("keywords", {}), f"{name}.keywords"),
+            "allowed_regions": edit_rule_list(
+                base["allowed_regions"], entry.get("allowed_regions", {}), f"{name}.allowed_regions"
+            ),
+        })
+    return profiles
+
+
+def load_profiles(path: Optional[str] = None) -> List[dict]:
+    """프로필 파일(기본: FILTER_PROFILES_PATH) 읽기. 지정하지 않았으면 기본 프로필 1개."""
+    path = path or Config.FILTER_PROFILES_PATH
+    if not path:
+        return [default_profile()]
+    with open(path, encoding="utf-8") as f:
+        return parse_profiles(json.load(f))
+
+
+def restricted_areas_for(allowed_regions: Tuple[str, ...]) -> Tuple[str, ...]:
+    """허용 지역 구성에서 지역 제한으로 볼 지역명 목록
+
+    지방/경기/인천 + 서울/수도권 중 허용 지역과 이름이 겹치는 것(부산 ↔ 부산광역시)을 뺀다.
+    기본 허용 지역(서울/수도권)이면 filters.REGIONAL_AREAS와 같다.
+    """
+    areas = dict.fromkeys(REGIONAL_AREAS + METRO_AREA)
+    return tuple(
+        a for a in areas
+        if not any(r and (r in a or a in r) for r in allowed_regions)
+    )
+
+
+class ProfileRouter:
+    """프로필 전체를 한 번에 컴파일한 분배기"""
+
+    def __init__(self, profiles: List[dict]):
+        self.profiles = profiles
+        keywords = list(dict.fromkeys(kw for p in profiles for kw in p["keywords"]))
+        self._matcher = KeywordMatcher(keywords)
+        # 키워드 → 그 키워드를 가진 프로필 번호
+        self._keyword_profiles: Dict[str, List[int]] = {}
+        for i, profile in enumerate(profiles):
+            for kw in dict.fromkeys(profile["keywords"]):
+                self._keyword_profiles.setdefault(kw, []).append(i)
+
+        # 허용 지역 구성 → 지역 규칙 그룹 번호 (None: 지역 제한 단계 생략)
+        groups: Dict[Tuple[str, ...], int] = {}
+        self._profile_group: List[Optional[int]] = []
+        for profile in profiles:
+            allowed = tuple(sorted(set(profile["allowed_regions"])))
+            if ANY_REGION in allowed:
+                self._profile_group.append(None)
+                continue
+            self._profile_group.append(groups.setdefault(allowed, len(groups)))
+        self._regions = RegionRuleGroups(
+            [(restricted_areas_for(allowed), allowed + tuple(NATIONWIDE_KEYWORDS)) for allowed in groups],
+            REGIONAL_RESTRICTION_PATTERNS,
+        )
+
+    def route(self, posting: dict) -> Dict[str, List[str]]:
+        """공고가 해당하는 프로필 이름 → 그 프로필 기준 매칭 키워드 (프로필 순서)"""
+        searchable = " ".join([
+            posting.get("title", ""),
+            posting.get("category", ""),
+            posting.get("target", ""),
+            posting.get("summary", ""),
+        ])
+        matched: Dict[int, List[str]] = {}
+        for kw in self._matcher.matched(searchable):
+            for i in self._keyword_profiles[kw]:
+                matched.setdefault(i, []).append(kw)
+        if not matched:
+            return {}
+
+        groups = {self._profile_group[i] for i in matched} - {None}
+        restricted = self._regions.restricted_areas(posting, groups) if groups else {}
+        routed = {}
+        for i in sorted(matched):
+            group = self._profile_group[i]
+            if group is not None and restricted[group]:
+                continue
+            routed[self.profiles[i]["name"]] = matched[i]
+        return routed
+
+
+def route_postings(postings: List[dict], router: ProfileRouter) -> Dict[str, List[dict]]:
+    """만료/과거 공고를 뺀 뒤 프로필별로 분배해 채널 → 공고 목록 반환
+
+    같은 채널의 여러 프로필에 해당하는 공고는 그 채널에 한 번만 들어간다.
+    공고 dict의 "_profiles"에 해당 프로필 이름, "_matched_keywords"에 매칭 키워드(합집합)를 남긴다.
+    설정된 모든 채널이 (빈 목록이라도) 결과에 들어간다.
+    """
+    routed: Dict[str, List[dict]] = {p["channel"]: [] for p in router.profiles}
+    channels = {p["name"]: p["channel"] for p in router.profiles}
+    counts = dict.fromkeys(channels, 0)
+    date_excluded = 0
+    for posting in postings:
+        if _is_expired_or_outdated(posting):
+            date_excluded += 1
+            continue
+        matches = router.route(posting)
+        if not matches:
+            continue
+        posting["_profiles"] = list(matches)
+        posting["_matched_keywords"] = list(dict.fromkeys(kw for kws in matches.values() for kw in kws))
+        for channel in dict.fromkeys(channels[name] for name in matches):
+            routed[channel].append(posting)
+        for name in matches:
+            counts[name] += 1
+
+    logger.info(
+        f"프로필 분배: 전체 {len(postings)}건 → 만료/과거 배제 {date_excluded}건 → "
+        + ", ".join(f"{name}({channels[name]}) {count}건" for name, count in counts.items())
+    )
+    return routed
@@ -0,0 +1,121 @@
+"""호스트별 토큰 버킷 요청 속도 제한 모듈
+
+모든 수집기가 하나의 프로세스 전역 리미터를 공유하여,
+같은 호스트(예: apis.data.go.kr)로 가는 요청은 설정된 속도로 제한하고
+서로 다른 호스트로 가는 요청은 기다리지 않고 바로 나가도록 한다.
+
+스레드(ThreadPoolExecutor)와 asyncio 양쪽에서 안전하게 사용할 수 있도록
+토큰 예약은 짧은 Lock 구간에서만 처리하고, 대기는 호출 측에서
+time.sleep / asyncio.sleep 으로 수행한다.
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.config import Config
+
+
+class TokenBucket:
+    """초당 rate개 토큰이 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 1개를 예약하고, 사용 가능해질 때까지 기다려야 할 시간(초) 반환
+
+        토큰이 부족하면 음수로 빌려 쓰므로 동시 호출자들은 순서대로 간격을 두고 대기한다.
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """토큰을 얻을 때까지 현재 스레드에서 대기"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """토큰을 얻을 때까지 이벤트 루프를 막지 않고 대기"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def parse_host_limits(spec: str) -> Dict[str, Tuple[float, int]]:
+    """호스트별 제한 설정 문자열(host=rate[:burst],...) 파싱
+
+    예: "apis.data.go.kr=2:4,www.mss.go.kr=0.5"
+    """
+    limits = {}
+    for entry in spec.split(","):
+        if "=" not in entry:
+            continue
+        host, value = entry.split("=", 1)
+        rate, _, burst = value.partition(":")
+        limits[host.strip().lower()] = (
+            float(rate),
+            int(burst) if burst.strip() else Config.RATE_LIMIT_BURST,
+        )
+    return limits
+
+
+class HostRateLimiter:
+    """호스트명 기준으로 토큰 버킷을 관리하는 리미터"""
+
+    def __init__(self, default_rate: float, default_burst: int = 1,
+                 host_limits: Optional[Dict[str, Tuple[float, int]]] = None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = host_limits or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        """URL의 호스트에 해당하는 토큰 버킷 반환 (없으면 생성)"""
+        host = (urlsplit(url).hostname or url).lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_limits.get(
+                    host, (self.default_rate, self.default_burst)
+                )
+                bucket = self._buckets[host] = TokenBucket(rate, burst)
+            return bucket
+
+    def acquire(self, url: str):
+        self.bucket(url).acquire()
+
+    async def acquire_async(self, url: str):
+        await self.bucket(url).acquire_async()
+
+
+_limiter: Optional[HostRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """프로세스 전역 공유 리미터 반환"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = HostRateLimiter(
+                Config.RATE_LIMIT_RPS,
+                Config.RATE_LIMIT_BURST,
+                parse_host_limits(Config.RATE_LIMIT_HOSTS),
+            )
+        return _limiter
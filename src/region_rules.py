@@ -0,0 +1,202 @@
+"""지역 제한 판정 규칙 엔진
+
+filters._is_region_restricted는 지역명 x 제한 패턴 조합마다 f"{area}.*{pattern}|{pattern}.*{area}"
+정규식을 그때그때 만들어 검사했다. 조합이 약 600개라 re 모듈 내부 캐시(512개)를 넘어 계속 다시
+컴파일되고, 패턴 안의 .* 와 겹친 .* 가 긴 요약문에서 역추적을 많이 일으켰다.
+
+RegionRuleEngine은 규칙 목록을 한 번만 컴파일하고 공고마다 다음 순서로 판정한다 (결과는 기존 함수와 동일).
+
+1. 전국 대상 / 서울·수도권 키워드가 있으면 제한 아님 (키워드 alternation 정규식 1회)
+2. 지역명별 첫/마지막 위치를 찾는다 (str.find / rfind). 본문에 지역명이 없으면 제한 아님.
+3. 지역명 → 패턴: 본문이 한 줄이면 "지역명이 끝나는 가장 앞 위치" 이후에 패턴이 시작하는지,
+   패턴 → 지역명: "지역명이 시작하는 가장 뒤 위치" 이전에 끝나는 패턴이 있는지만 보면 된다.
+   (지역명 x 패턴 조합을 각각 검사할 필요 없이 합친 패턴 정규식 탐색 2번)
+   (.* 는 줄바꿈을 넘지 못하므로 줄바꿈이 있는 본문은 전체 규칙을 합친 정규식 1개로 검사)
+4. 제목에 [지역] / (지역) / 지역+지역·도·시 형태로 지역명이 있고 지원대상에도 그 지역이 있으면 제한.
+   (제목의 지역명 위치는 KeywordMatcher로 겹치는 것까지 모두 찾는다)
+
+기존 함수와 같이 대소문자를 구분한다.
+허용 지역만 다른 여러 구성은 RegionRuleGroups로 본문을 한 번만 탐색해 함께 판정한다.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.keyword_matcher import KeywordMatcher
+
+# 아무것도 매칭하지 않는 정규식 (규칙 목록이 비어 있을 때)
+_NEVER = "(?!)"
+# 제목 규칙: 지역명 뒤에 붙으면 지역 한정 제목으로 보는 표현
+_TITLE_SUFFIXES = ("지역", "도", "시")
+
+
+def _region_text(posting: dict) -> str:
+    return " ".join([
+        posting.get("title", ""),
+        posting.get("target", ""),
+        posting.get("summary", ""),
+        posting.get("organization", ""),
+    ])
+
+
+def _alternation(literals: Sequence[str]) -> str:
+    # 긴 이름을 앞에 두어도 결과(매칭 여부)는 같지만 같은 위치에서 긴 이름을 먼저 시도
+    escaped = [re.escape(s) for s in sorted(set(literals), key=len, reverse=True) if s]
+    return "|".join(escaped) or _NEVER
+
+
+class RegionRuleEngine:
+    """지역명 / 제한 패턴 / 서울권 / 전국 키워드 목록을 컴파일한 판정기"""
+
+    def __init__(self, areas: Sequence[str], restriction_patterns: Sequence[str],
+                 metro_areas: Sequence[str], nationwide_keywords: Sequence[str]):
+        self._area_names = [a for a in dict.fromkeys(areas) if a]
+        self._areas = KeywordMatcher(self._area_names, ignore_case=False)
+        self._exempt = re.compile(_alternation(list(metro_areas) + list(nationwide_keywords)))
+
+        patterns = [f"(?:{p})" for p in restriction_patterns]
+        self._pattern = re.compile("|".join(patterns) or _NEVER)
+        # 끝에 $가 있는 패턴 뒤에는 (줄바꿈 없는 본문에서) 어떤 지역명도 올 수 없음
+        self._pattern_before_area = re.compile(
+            "|".join(p for p in patterns if not p.endswith("$)")) or _NEVER
+        )
+        area_alt = _alternation(areas)
+        self._combined = re.compile(
+            f"(?:{area_alt}).*(?:{self._pattern.pattern})|(?:{self._pattern.pattern}).*(?:{area_alt})"
+        )
+
+    def restricted_area(self, posting: dict) -> Optional[str]:
+        """지역 한정 공고이면 판정 근거 지역명, 아니면 None"""
+        text = _region_text(posting)
+        if not text.strip():
+            return None
+        if self._exempt.search(text):
+            return None
+
+        found = [(text.find(a), a) for a in self._area_names]
+        found = [(start, a) for start, a in found if start != -1]
+        if not found:
+            return None
+
+        area = self._pattern_rule(text, found)
+        if area:
+            return area
+        # 1단계에서 전국/서울권 키워드가 본문 어디에도 없음을 확인했으므로
+        # 기존 규칙의 "지원대상에 서울권/전국 키워드가 없을 것" 조건은 항상 참
+        return self._title_rule(posting, self._areas.find_all(posting.get("title", "")))
+
+    def _pattern_rule(self, text: str, found: List[Tuple[int, str]],
+                      memo: Optional[Dict[Tuple[str, int], bool]] = None) -> Optional[str]:
+        """found: 본문에 있는 지역명별 (첫 위치, 지역명)
+
+        memo: 제한 패턴이 같은 판정기끼리 같은 본문의 패턴 탐색 결과를 나눠 쓰는 캐시
+        """
+        if "\n" in text:
+            match = self._combined.search(text)
+            if not match:
+                return None
+            span = self._areas.find_all(match.group(0))
+            return span[0][1] if span else found[0][1]
+
+        memo = {} if memo is None else memo
+        # 지역명 .* 패턴
+        end, area = min((start + len(a), a) for start, a in found)
+        if ("after", end) not in memo:
+            memo[("after", end)] = self._pattern.search(text, end) is not None
+        if memo[("after", end)]:
+            return area
+        # 패턴 .* 지역명
+        start, area = max((text.rfind(a), a) for _, a in found)
+        if ("before", start) not in memo:
+            memo[("before", start)] = self._pattern_before_area.search(text, 0, start) is not None
+        if memo[("before", start)]:
+            return area
+        return None
+
+    def _title_rule(self, posting: dict, title_areas: List[Tuple[int, str]]) -> Optional[str]:
+        """title_areas: 제목에서 찾은 (시작 위치, 지역명) 목록 (위치 순)"""
+        title = posting.get("title", "")
+        target = posting.get("target", "")
+        for start, area in title_areas:
+            end = start + len(area)
+            bracketed = (
+                start > 0 and end < len(title)
+                and (title[start - 1], title[end]) in (("[", "]"), ("(", ")"))
+            )
+            if (bracketed or title.startswith(_TITLE_SUFFIXES, end)) and area in target:
+                return area
+        return None
+
+    def is_restricted(self, posting: dict) -> bool:
+        return self.restricted_area(posting) is not None
+
+
+class RegionRuleGroups:
+    """제한 패턴은 같고 지역명 / 면제 키워드 목록만 다른 여러 규칙 구성을 함께 판정
+
+    팀별 필터 프로필(src.profiles)처럼 허용 지역만 다른 구성이 여럿일 때, 본문 탐색
+    (면제 키워드 / 지역명 위치 / 제목의 지역명)은 모든 구성의 합집합으로 공고당 1번만 하고
+    구성별로는 그 결과를 걸러 RegionRuleEngine과 같은 규칙을 적용한다.
+    같은 위치에서 시작하는 제한 패턴 탐색 결과도 구성끼리 나눠 쓴다.
+    """
+
+    def __init__(self, groups: Sequence[Tuple[Sequence[str], Sequence[str]]],
+                 restriction_patterns: Sequence[str]):
+        """groups: 구성별 (지역명 목록, 면제 키워드 목록 = 허용 지역 + 전국 대상 키워드)"""
+        self._engines = [
+            RegionRuleEngine(areas, restriction_patterns, exempt, ()) for areas, exempt in groups
+        ]
+        self._group_areas = [set(engine._area_names) for engine in self._engines]
+        self._group_exempt = [{t for t in exempt if t} for _, exempt in groups]
+        all_areas = list(dict.fromkeys(a for engine in self._engines for a in engine._area_names))
+        self._areas = KeywordMatcher(all_areas, ignore_case=False)
+        self._area_names = all_areas
+        self._exempt = KeywordMatcher(
+            list(dict.fromkeys(t for terms in self._group_exempt for t in terms)), ignore_case=False
+        )
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def restricted_areas(self, posting: dict,
+                         groups: Optional[Iterable[int]] = None) -> Dict[int, Optional[str]]:
+        """구성 번호 → 판정 근거 지역명(제한 아니면 None). groups를 주면 해당 구성만 판정."""
+        groups = range(len(self._engines)) if groups is None else groups
+        text = _region_text(posting)
+        if not text.strip():
+            return {g: None for g in groups}
+        exempt_found = set(self._exempt.matched(text))
+        result = {g: None for g in groups}
+        pending = [g for g in result if not exempt_found & self._group_exempt[g]]
+        if not pending:
+            return result
+
+        first = {}
+        for area in self._area_names:
+            start = text.find(area)
+            if start != -1:
+                first[area] = start
+        title_areas = None
+        memo: Dict[Tuple[str, int], bool] = {}
+        for g in pending:
+            engine = self._engines[g]
+            found = [(first[a], a) for a in engine._area_names if a in first]
+            if not found:
+                continue
+            area = engine._pattern_rule(text, found, memo)
+            if area is None:
+                if title_areas is None:
+                    title_areas = self._areas.find_all(posting.get("title", ""))
+                area = engine._title_rule(
+                    posting, [(s, a) for s, a in title_areas if a in self._group_areas[g]]
+                )
+            result[g] = area
+        return result
+
+
+@lru_cache(maxsize=8)
+def compile_region_rules(areas: Tuple[str, ...], restriction_patterns: Tuple[str, ...],
+                         metro_areas: Tuple[str, ...],
+                         nationwide_keywords: Tuple[str, ...]) -> RegionRuleEngine:
+    """규칙 구성별로 한 번만 컴파일한 판정기"""
+    return RegionRuleEngine(areas, restriction_patterns, metro_areas, nationwide_keywords)
@@ -0,0 +1,92 @@
+"""수집한 공고 검색 CLI
+
+사용법:
+    python -m src.search 해외진출 바우처
+    python -m src.search 수출바우처 --source smes24 bizinfo --since 2026-01-01 --until 2026-03-31
+    python -m src.search 창업패키지 --limit 10 --page 2
+    python -m src.search --closing-within 7 --source kstartup
+
+검색어의 모든 단어를 포함하는 공고를 관련도(제목 > 기관 > 지원대상 > 요약 가중치) 순으로 보여준다.
+검색어 없이 실행하면 조건에 맞는 공고를 최근 수집 순으로 보여준다.
+--closing-within N 이면 검색어 대신 지금까지 수집한 전체 공고 중 N일 안에 마감되는 공고를
+마감 임박 순으로 보여준다 (마감 리마인더용).
+"""
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+_project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(_project_root))
+
+from src.database import Database
+from src.periods import today_epoch_day
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="수집한 공고 검색")
+    parser.add_argument("query", nargs="*", help="검색어 (여러 단어는 모두 포함)")
+    parser.add_argument("--source", nargs="*", help="출처 필터 (예: kstartup bizinfo)")
+    parser.add_argument("--since", help="수집일 시작 (YYYY-MM-DD)")
+    parser.add_argument("--until", help="수집일 끝 (YYYY-MM-DD, 당일 포함)")
+    parser.add_argument("--limit", type=int, default=20, help="페이지당 건수")
+    parser.add_argument("--page", type=int, default=1)
+    parser.add_argument("--closing-within", type=int, metavar="N",
+                        help="N일 안에 마감되는 공고 (오늘 마감 포함)")
+    parser.add_argument("--db", help="DB 파일 경로 (기본: Config.DB_PATH)")
+    args = parser.parse_args(argv)
+
+    # DB_STORAGE=delta이면 델타 로그에서 적재, 아니면 DB 파일을 읽기 전용으로 직접 연다
+    # (스키마 생성/백필 없이 조회만 하므로 수집 실행 중에도 DB 파일을 건드리지 않음)
+    try:
+        db = Database(db_path=args.db, in_memory=False, read_only=True)
+    except sqlite3.OperationalError as e:
+        parser.error(f"DB를 열 수 없습니다 ({args.db or 'Config.DB_PATH'}): {e} "
+                     "- 저장소의 수집 이력은 data/delta에 있으므로 DB_STORAGE=delta로 실행하세요")
+    try:
+        started = time.perf_counter()
+        if args.closing_within is not None:
+            results = db.get_closing_soon(
+                args.closing_within,
+                sources=args.source,
+                limit=args.limit,
+                offset=(max(args.page, 1) - 1) * args.limit,
+            )
+        else:
+            results = db.search_postings(
+                " ".join(args.query),
+                sources=args.source,
+                since=args.since,
+                until=args.until,
+                limit=args.limit,
+                offset=(max(args.page, 1) - 1) * args.limit,
+            )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    except sqlite3.OperationalError as e:
+        parser.error(f"검색 실패 (수집을 한 번 실행해 DB 스키마를 갱신하세요): {e}")
+    finally:
+        # 읽기 전용이므로 저장 없이 연결만 닫힘
+        db.close()
+
+    if not results:
+        print(f"검색 결과 없음 ({elapsed_ms:.1f}ms)")
+        return
+
+    first = (max(args.page, 1) - 1) * args.limit + 1
+    today = today_epoch_day()
+    for i, p in enumerate(results, first):
+        collected = (p.get("collected_at") or "")[:10]
+        period = p.get("end_date") or "-"
+        if p.get("end_day") is not None and p.get("end_day") >= today:
+            period += f" (D-{p['end_day'] - today})"
+        print(f"{i:>3}. [{p.get('source', '')}] {p['title']}")
+        print(f"     {p.get('organization') or '-'} | 마감 {period} | 수집 {collected}")
+        if p.get("url"):
+            print(f"     {p['url']}")
+    print(f"\n{first}~{first + len(results) - 1}번째 결과 ({elapsed_ms:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
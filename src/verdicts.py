@@ -0,0 +1,79 @@
+"""저장된 필터 판정 갱신 CLI
+
+사용법:
+    python -m src.verdicts
+    python -m src.verdicts --show 50 --db data/postings.db
+
+src/filters.py의 키워드/지역 규칙을 바꾼 뒤 실행하면 내용이나 해당 단계 규칙이 바뀐 공고만
+다시 판정해 filter_verdicts 테이블을 갱신하고, 결과가 바뀐(포함 ↔ 배제) 공고를 보여준다.
+키워드 단계에서 탈락한 공고는 지역 규칙만 바뀐 경우 다시 계산하지 않는다.
+"""
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+_project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(_project_root))
+
+from src.database import Database
+from src.filters import refresh_filter_verdicts, ruleset_versions
+
+_STAGE_LABELS = {"pass": "포함", "keyword": "키워드 미매칭", "region": "지역 제한"}
+
+
+def _needs_refresh(db_path) -> bool:
+    """판정이 없거나 오래된 공고가 있는지 읽기 전용으로 확인
+
+    DB 파일이 없거나 예전 스키마(판정 테이블/해시 컬럼 없음)이면 마이그레이션이 필요하므로 True.
+    """
+    try:
+        db = Database(db_path=db_path, read_only=True)
+    except sqlite3.OperationalError:
+        return True
+    try:
+        stale = db.iter_stale_verdict_postings(*ruleset_versions(), chunk_size=1)
+        return next(stale, None) is not None
+    except sqlite3.OperationalError:
+        return True
+    finally:
+        db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="저장된 필터 판정 갱신")
+    parser.add_argument("--show", type=int, default=20, help="결과가 바뀐 공고를 최대 N건 출력")
+    parser.add_argument("--db", help="DB 파일 경로 (기본: Config.DB_PATH)")
+    args = parser.parse_args(argv)
+
+    # 다시 계산할 판정이 없으면 쓰기 모드로 열지 않음 (스키마 갱신/백필/메모리·델타 저장 없음)
+    if not _needs_refresh(args.db):
+        print("\n재계산 0건, 결과 변경 0건 (저장된 판정이 모두 최신)")
+        return
+
+    db = Database(db_path=args.db)
+    recomputed = 0
+    try:
+        started = time.perf_counter()
+        recomputed, flipped = refresh_filter_verdicts(db)
+        elapsed = time.perf_counter() - started
+    finally:
+        if recomputed:
+            db.close()
+        else:
+            # 중간에 실패하면 close()(메모리/델타 모드의 저장) 대신 연결만 닫음.
+            # 파일 모드에서는 열 때 한 스키마 갱신/백필이 이미 커밋되어 있다.
+            db.conn.close()
+
+    for item in flipped[:args.show]:
+        before, after = _STAGE_LABELS[item["before"]], _STAGE_LABELS[item["after"]]
+        print(f"{before} → {after}: {item['title']}")
+    if len(flipped) > args.show:
+        print(f"... 외 {len(flipped) - args.show}건")
+    print(f"\n재계산 {recomputed}건, 결과 변경 {len(flipped)}건 ({elapsed:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
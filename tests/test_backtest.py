@@ -0,0 +1,139 @@
+"""필터 규칙 백테스트 테스트"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.backtest import BACKTEST_COLUMNS, apply_overrides, run_backtest
+from src.database import Database
+from src.filters import current_rules, filter_relevant_postings
+
+
+@pytest.fixture
+def db():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    database = Database(db_path=path)
+    yield database
+    database.close()
+    os.unlink(path)
+
+
+def _posting(pid: str, title: str, target: str = "", end_date: str = "2999-12-31") -> dict:
+    return {"id": pid, "title": title, "organization": "", "category": "", "start_date": "",
+            "end_date": end_date, "target": target, "url": f"https://example.com/{pid}",
+            "summary": "", "source": "bizinfo"}
+
+
+@pytest.fixture
+def postings():
+    return [
+        _posting("p1", "2026년 초기창업패키지 참여기업 모집", "예비창업자"),
+        _posting("p2", "부산 소재 창업기업 지원", "부산 소재 기업"),
+        _posting("p3", "공공기관 청사 관리 용역"),
+        _posting("p4", "해외진출 바우처", end_date="2000-01-01"),
+        _posting("p5", "국제 협력 세미나"),
+    ]
+
+
+def test_apply_overrides_replaces_and_edits_lists():
+    base = current_rules()
+    rules = apply_overrides(base, {
+        "keywords": {"add": ["용역"], "remove": ["국제"]},
+        "metro_areas": ["서울"],
+    })
+    assert "용역" in rules["keywords"] and "국제" not in rules["keywords"]
+    assert rules["metro_areas"] == ("서울",)
+    assert rules["regional_areas"] == base["regional_areas"]
+    with pytest.raises(ValueError):
+        apply_overrides(base, {"unknown": []})
+    with pytest.raises(ValueError):
+        apply_overrides(base, {"keywords": {"replace": []}})
+
+
+def test_identical_rules_match_live_filter(db, postings):
+    db.insert_postings_bulk([dict(p) for p in postings])
+    rules = current_rules()
+    result = run_backtest(db.iter_postings(BACKTEST_COLUMNS, chunk_size=2), rules, rules, dates="today")
+
+    live = {p["id"] for p in filter_relevant_postings([dict(p) for p in postings])}
+    counts = result["counts"]["baseline"]
+    assert counts == result["counts"]["candidate"]
+    assert counts == {"date": 1, "keyword": 1, "region": 1, "pass": 2}
+    assert counts["pass"] == len(live)
+    assert result["diffs"] == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_diff_lists_postings_whose_inclusion_changed(db, postings, workers):
+    db.insert_postings_bulk([dict(p) for p in postings])
+    baseline = current_rules()
+    candidate = apply_overrides(baseline, {
+        "keywords": {"add": ["용역"], "remove": ["국제"]},
+        "nationwide_keywords": {"add": ["부산 소재"]},
+    })
+    result = run_backtest(db.iter_postings(BACKTEST_COLUMNS, chunk_size=2), baseline, candidate,
+                          dates="today", workers=workers)
+
+    changes = {d["id"]: (d["before"], d["after"]) for d in result["diffs"]}
+    assert changes == {
+        "p2": ("region", "pass"),
+        "p3": ("keyword", "pass"),
+        "p5": ("pass", "keyword"),
+    }
+    assert result["counts"]["candidate"] == {"date": 1, "keyword": 1, "region": 0, "pass": 3}
+    # 만료 판정은 --dates off이면 생략
+    result = run_backtest(db.iter_postings(BACKTEST_COLUMNS), baseline, candidate, dates="off")
+    assert result["counts"]["baseline"]["date"] == 0
+
+
+def test_main_does_not_write_database(tmp_path, postings, monkeypatch):
+    """백테스트 CLI는 메모리 모드에서도 DB 파일을 다시 쓰지 않음"""
+    from src.backtest import main
+    from src.config import Config
+
+    path = tmp_path / "postings.db"
+    database = Database(db_path=str(path))
+    database.insert_postings_bulk([dict(p) for p in postings])
+    database.close()
+    before = path.read_bytes()
+    config = tmp_path / "rules.json"
+    config.write_text('{"keywords": {"add": ["용역"]}}', encoding="utf-8")
+
+    monkeypatch.setattr(Config, "DB_IN_MEMORY", True)
+    main(["--config", str(config), "--db", str(path), "--workers", "1", "--dates", "today"])
+    assert path.read_bytes() == before
+
+
+def test_main_reads_baseline_schema_db(tmp_path, postings, capsys):
+    """정규화 컬럼(start_day/end_day/end_kind)이 없는 예전 스키마 DB도 읽기 전용으로 백테스트"""
+    import sqlite3
+    from src.backtest import main
+
+    path = tmp_path / "postings.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE postings (
+            id TEXT PRIMARY KEY, title TEXT NOT NULL, organization TEXT, category TEXT,
+            start_date TEXT, end_date TEXT, target TEXT, url TEXT, summary TEXT, source TEXT,
+            collected_at TEXT NOT NULL, notified_at TEXT, is_notified INTEGER DEFAULT 0
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO postings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, '2026-02-10T09:00:00', NULL, 0)",
+        [(p["id"], p["title"], p["organization"], p["category"], p["start_date"], p["end_date"],
+          p["target"], p["url"], p["summary"], p["source"]) for p in postings],
+    )
+    conn.commit()
+    conn.close()
+    before = path.read_bytes()
+    config = tmp_path / "rules.json"
+    config.write_text('{"keywords": {"add": ["용역"], "remove": ["국제"]}}', encoding="utf-8")
+
+    main(["--config", str(config), "--db", str(path), "--workers", "1", "--dates", "today"])
+    out = capsys.readouterr().out
+    assert "공고 5건, 포함 여부 변경 2건" in out
+    assert path.read_bytes() == before
@@ -1,9 +1,17 @@
 """Collectors 모듈 테스트"""
 import sys
+import asyncio
+import json
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.collectors.base import BaseCollector
+from types import SimpleNamespace
+
+import requests
+
+from src.collectors.base import HTML_ENGINES, BaseCollector, parse_html
+from src.collectors.http_cache import HttpCache
+from src.ratelimit import HostRateLimiter
 
 
 def test_normalize_date():
@@ -14,3 +22,299 @@ def test_normalize_date():
     assert BaseCollector._normalize_date("2026-02-10") == "2026-02-10"
     assert BaseCollector._normalize_date("") == ""
     assert BaseCollector._normalize_date("상시접수") == "상시접수"
+
+
+def _make_response(status: int, body: bytes = b"", headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class _DummyCollector(BaseCollector):
+    SOURCE_NAME = "dummy"
+
+    def iter_postings(self):
+        return iter([])
+
+
+def test_fetch_page_conditional_cache(tmp_path):
+    """검증자 재전송 + 304/동일 본문이면 None 반환 (캐시 적중)"""
+    collector = _DummyCollector()
+    collector.rate_limiter = HostRateLimiter(0)
+    collector.http_cache = HttpCache(str(tmp_path / "http_cache.json"))
+    sent_headers = []
+    responses = [
+        _make_response(200, b"<html>v1</html>", {"ETag": '"abc"'}),
+        _make_response(304),
+        _make_response(200, b"<html>v1</html>"),
+        _make_response(200, b"<html>v2</html>"),
+    ]
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        sent_headers.append(headers or {})
+        return responses.pop(0)
+
+    collector.session = SimpleNamespace(get=fake_get)
+    url = "https://example.com/list"
+
+    assert collector._fetch_page(url, params={"page": 1}) is not None
+    collector._commit_page_cache()
+    assert collector._fetch_page(url, params={"page": 1}) is None
+    assert sent_headers[1]["If-None-Match"] == '"abc"'
+    assert collector._fetch_page(url, params={"page": 1}) is None
+    assert collector._fetch_page(url, params={"page": 1}) is not None
+    collector._commit_page_cache()
+    assert (collector.cache_hits, collector.cache_misses) == (2, 2)
+
+    collector.http_cache.save()
+    reloaded = HttpCache(str(tmp_path / "http_cache.json"))
+    assert reloaded.get(HttpCache.key(url, {"page": 1}))["body_hash"]
+
+
+def test_paginate_records_cache_only_after_page_rows_are_consumed(tmp_path):
+    """페이지 행 처리 중 실패하면 그 페이지는 캐시에 남지 않아 다음 실행에서 다시 받음"""
+    collector = _DummyCollector()
+    collector.rate_limiter = HostRateLimiter(0)
+    collector.http_cache = HttpCache(str(tmp_path / "http_cache.json"))
+    collector.known_ids_lookup = lambda ids: set()
+    collector.session = SimpleNamespace(
+        get=lambda url, params=None, headers=None, timeout=None: _make_response(200, b"<html>v1</html>")
+    )
+    url = "https://example.com/list"
+
+    def fetch(page):
+        if collector._fetch_page(url, params={"page": page}) is None:
+            return None
+        return [{"id": f"{page}-a"}, {"id": f"{page}-b"}]
+
+    stream = collector._paginate(fetch, max_pages=1)
+    next(stream)
+    stream.close()  # 소비자(DB 저장)가 페이지 중간에 실패
+    assert collector.http_cache.get(HttpCache.key(url, {"page": 1})) is None
+
+    assert len(list(collector._paginate(fetch, max_pages=1))) == 2
+    assert collector.http_cache.get(HttpCache.key(url, {"page": 1}))["body_hash"]
+    assert list(collector._paginate(fetch, max_pages=1)) == []
+
+
+def test_paginate_stops_on_known_page():
+    """이미 DB에 있는 ID만 있는 페이지에서 탐색 중단"""
+    collector = _DummyCollector()
+    known = {"b1", "b2", "c1"}
+    collector.known_ids_lookup = lambda ids: set(ids) & known
+    pages = {
+        1: [{"id": "a1"}, {"id": "a2"}],
+        2: [{"id": "a2"}, {"id": "b1"}, {"id": "b2"}],
+        3: [{"id": "c1"}],
+    }
+    fetched = []
+
+    def fetch(page):
+        fetched.append(page)
+        return pages.get(page)
+
+    postings = list(collector._paginate(fetch, max_pages=5))
+    assert fetched == [1, 2]
+    assert [p["id"] for p in postings] == ["a1", "a2", "b1", "b2"]
+
+
+def test_paginate_stops_when_known_rows_are_skipped():
+    """skip_known_rows로 기존 행을 모두 걸러 빈 페이지가 되어도 탐색 중단"""
+    collector = _DummyCollector()
+    known = {"b1", "b2", "c1"}
+    collector.known_ids_lookup = lambda ids: set(ids) & known
+    pages = {1: ["a1", "b1"], 2: ["b2", "c1"], 3: ["c2"]}
+    fetched = []
+
+    def fetch(page):
+        fetched.append(page)
+        ids = pages.get(page)
+        if ids is None:
+            return None
+        return [{"id": pid} for pid in ids if not collector._is_known(pid)]
+
+    postings = list(collector._paginate(fetch, max_pages=5))
+    assert fetched == [1, 2]
+    assert [p["id"] for p in postings] == ["a1"]
+
+
+def test_bizinfo_row_checks_known_id_once():
+    """기업마당 목록 행 하나당 기존 ID 조회는 한 번"""
+    from src.collectors.bizinfo import BizinfoCollector
+
+    html = (
+        "<table><tbody><tr><td>1</td><td>창업진흥원</td>"
+        "<td><a href='/web/lay1/bbs/S1T122C128/AS/74/view.do?pblancId=1'>2026년 창업 지원</a></td>"
+        "<td>2026.02.10 ~ 2026.03.15</td></tr></tbody></table>"
+    )
+    row = parse_html(html).select_one("tr")
+    collector = BizinfoCollector()
+    lookups = []
+    collector.known_ids_lookup = lambda ids: lookups.append(tuple(ids)) or set()
+    posting = collector._parse_row(row)
+    assert posting["end_date"] == "2026-03-15"
+    assert lookups == [(posting["id"],)]
+
+    collector.known_ids_lookup = lambda ids: lookups.append(tuple(ids)) or set(ids)
+    assert collector._parse_row(row) is None
+    assert len(lookups) == 2 and collector.known_skipped == 1
+
+
+def test_paginate_single_page_without_lookup():
+    """DB 조회 함수가 없으면 1페이지만 수집"""
+    collector = _DummyCollector()
+    fetched = []
+    list(collector._paginate(lambda page: fetched.append(page) or [{"id": str(page)}]))
+    assert fetched == [1]
+
+
+def test_fan_out_fetches_all_pages_from_total():
+    """전체 건수로 페이지 수를 계산해 나머지 페이지를 모두 수집 (실패 페이지는 건너뜀)"""
+    collector = _DummyCollector()
+    collector.known_ids_lookup = lambda ids: set()
+    fetched = []
+
+    def fetch(page):
+        fetched.append(page)
+        if page == 3:
+            raise requests.ConnectionError("boom")
+        # 페이지 경계에서 밀려 내려온 항목(중복)도 한 번만 반환
+        return [{"id": f"{page}-a"}, {"id": f"{page}-b"}, {"id": "dup"}], 11
+
+    postings = list(collector._fan_out(fetch, per_page=3, max_pages=10))
+    assert sorted(fetched) == [1, 2, 3, 4]
+    ids = [p["id"] for p in postings]
+    assert len(ids) == len(set(ids))
+    assert set(ids) == {"1-a", "1-b", "dup", "2-a", "2-b", "4-a", "4-b"}
+
+
+def test_fan_out_async_matches_fan_out():
+    """비동기 페이지 수집도 같은 페이지를 요청하고 실패 페이지만 건너뜀"""
+    collector = _DummyCollector()
+    collector.known_ids_lookup = lambda ids: set()
+    fetched = []
+
+    async def fetch(page):
+        fetched.append(page)
+        await asyncio.sleep(0.01 * (5 - page))
+        if page == 3:
+            raise requests.ConnectionError("boom")
+        return [{"id": f"{page}-a"}, {"id": f"{page}-b"}, {"id": "dup"}], 11
+
+    async def run():
+        return [p["id"] async for p in collector._fan_out_async(fetch, per_page=3, max_pages=10)]
+
+    ids = asyncio.run(run())
+    assert sorted(fetched) == [1, 2, 3, 4]
+    assert ids[:3] == ["1-a", "1-b", "dup"]
+    assert sorted(ids) == sorted({"1-a", "1-b", "dup", "2-a", "2-b", "4-a", "4-b"})
+
+
+def test_kstartup_async_uses_cassette(tmp_path, monkeypatch):
+    """비동기 API 수집도 카세트로 녹화/재생하고 동기 경로와 같은 공고를 만듦"""
+    from src.collectors.kstartup import KStartupCollector
+    from src.config import Config
+
+    def page_body(page: int) -> bytes:
+        rows = [{"biz_pbanc_nm": f"{page}페이지 공고 {i}", "pbanc_sn": f"{page}{i}",
+                 "rcrt_prgs_yn": "Y", "detl_pg_url": f"https://example.com/{page}/{i}"}
+                for i in range(2)]
+        return json.dumps({"totalCount": 4, "data": rows}).encode("utf-8")
+
+    class _FakeClient:
+        def __init__(self):
+            self.pages = []
+
+        async def get(self, url, params=None, headers=None, timeout=None):
+            self.pages.append(params["page"])
+            return _make_response(200, page_body(params["page"]),
+                                  {"Content-Type": "application/json"})
+
+    monkeypatch.setattr(Config, "COLLECT_COUNT", 2)
+    monkeypatch.setattr(Config, "HTTP_CASSETTE_DIR", str(tmp_path))
+
+    async def collect(collector):
+        return [p async for p in collector.iter_postings_async()]
+
+    monkeypatch.setattr(Config, "HTTP_CASSETTE_MODE", "record")
+    collector = KStartupCollector()
+    collector.known_ids_lookup = lambda ids: set()
+    collector.rate_limiter = HostRateLimiter(0)
+    collector.http_client = _FakeClient()
+    recorded = asyncio.run(collect(collector))
+    assert sorted(collector.http_client.pages) == [1, 2]
+    assert len(list((tmp_path / "kstartup").glob("*.json"))) == 2
+
+    monkeypatch.setattr(Config, "HTTP_CASSETTE_MODE", "replay")
+    collector = KStartupCollector()
+    collector.known_ids_lookup = lambda ids: set()
+    collector.http_client = None  # 재생 중에는 클라이언트 없이 카세트에서만 응답
+    collector.session.session = None
+    assert asyncio.run(collect(collector)) == recorded
+    assert list(collector.iter_postings()) == recorded
+    assert len(recorded) == 4
+
+
+def test_parse_html_engines_agree():
+    """엔진/범위 제한과 무관하게 목록 행 추출 결과가 동일"""
+    html = (
+        "<html><body><ul><li><a href='/menu'>메뉴</a></li></ul>"
+        "<table><tbody>"
+        "<tr><td>1</td><td><a href='/view?id=1'>공고 하나</a></td></tr>"
+        "<tr><td>2</td><td><a href='/view?id=2'>공고 둘</a></td></tr>"
+        "</tbody></table></body></html>"
+    )
+    expected = ["/view?id=1", "/view?id=2"]
+    for engine in HTML_ENGINES:
+        for scope in (None, ["table"], ["table", "a"]):
+            soup = parse_html(html, scope=scope, engine=engine)
+            rows = soup.select("table tbody tr")
+            assert [r.find("a")["href"] for r in rows] == expected, (engine, scope)
+
+
+def test_cassette_record_and_replay(tmp_path, monkeypatch):
+    """녹화한 응답을 네트워크 없이 재생 (serviceKey는 카세트에 남기지 않음)"""
+    from src.collectors.cassette import CassetteSession, cassette_key
+    from src.collectors.tips import TipsCollector
+
+    html = (
+        '<html><body><a href="/bbs/board.php?bo_table=notice&wr_id=7">'
+        "2026년 TIPS 창업팀 모집 공고</a></body></html>"
+    ).encode("utf-8")
+    live = SimpleNamespace(
+        headers={},
+        get=lambda url, params=None, headers=None, timeout=None: _make_response(
+            200, html, {"Content-Type": "text/html; charset=utf-8"}
+        ),
+    )
+    recorder = CassetteSession(live, "record", str(tmp_path), "tips")
+    recorder.get("https://example.com/api", params={"page": 1, "serviceKey": "SECRET"})
+    recorded = list((tmp_path / "tips").glob("*.json"))
+    assert len(recorded) == 1
+    assert "SECRET" not in recorded[0].read_text(encoding="utf-8")
+    assert cassette_key("https://example.com/api", {"page": 1, "serviceKey": "other"}) == \
+        cassette_key("https://example.com/api", {"page": 1})
+
+    from src.config import Config
+    monkeypatch.setattr(Config, "HTTP_CASSETTE_MODE", "record")
+    monkeypatch.setattr(Config, "HTTP_CASSETTE_DIR", str(tmp_path))
+    collector = TipsCollector()
+    collector.session.session = live
+    collector.rate_limiter = HostRateLimiter(0)
+    assert collector.http_cache is None  # 녹화/재생 중에는 조건부 캐시 사용 안 함
+    expected = list(collector.iter_postings())
+    assert len(expected) == 2  # notice, news 게시판
+
+    monkeypatch.setattr(Config, "HTTP_CASSETTE_MODE", "replay")
+    collector = TipsCollector()
+    collector.session.session = None  # 재생 중 네트워크 접근 시 실패
+    assert list(collector.iter_postings()) == expected
+
+    missing = CassetteSession(None, "replay", str(tmp_path), "tips")
+    try:
+        missing.get("https://example.com/unknown")
+        assert False, "카세트가 없으면 ConnectionError"
+    except requests.ConnectionError:
+        pass
@@ -0,0 +1,34 @@
+"""Config 모듈 테스트"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_project_root = Path(__file__).parent.parent
+
+
+def _load_config(env: dict, expr: str) -> str:
+    """환경변수를 설정한 별도 프로세스에서 src.config를 불러와 expr 값을 출력"""
+    result = subprocess.run(
+        [sys.executable, "-c", f"from src.config import Config; print({expr})"],
+        cwd=_project_root, env={**os.environ, **env}, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def test_empty_values_fall_back_to_defaults():
+    """RATE_LIMIT_RPS= 처럼 값이 빈 항목은 기본값 적용"""
+    env = {"RATE_LIMIT_RPS": "", "REQUEST_DELAY": "0.5", "COLLECT_WORKERS": "", "TRACK_UPDATES": ""}
+    assert _load_config(env, "Config.RATE_LIMIT_RPS, Config.COLLECT_WORKERS") == "2.0 4"
+
+
+def test_env_example_values_load():
+    """.env.example을 그대로 .env로 써도 설정을 불러올 수 있음"""
+    env = {}
+    for line in (_project_root / ".env.example").read_text(encoding="utf-8").splitlines():
+        if line.strip() and not line.startswith("#") and "=" in line:
+            key, value = line.split("=", 1)
+            env[key.strip()] = value.strip()
+    assert _load_config(env, "Config.RATE_LIMIT_BURST") == "2"
@@ -1,6 +1,7 @@
 """Database 모듈 테스트"""
 import os
 import tempfile
+from datetime import date, datetime
 
 import pytest
 
@@ -10,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database import Database
+from src.periods import KIND_DDAY, KIND_ROLLING, to_epoch_day
 
 
 @pytest.fixture
@@ -94,3 +96,216 @@ def test_daily_send_prevents_duplicate(db):
     db.record_daily_send("2026-02-16", 3)
     assert db.has_sent_today("2026-02-16") is True
     assert db.has_sent_today("2026-02-17") is False
+
+
+def test_find_existing_ids(db, sample_posting):
+    db.insert_posting(sample_posting)
+    ids = ["test_001"] + [f"missing_{i}" for i in range(1200)]
+    assert db.find_existing_ids(ids) == {"test_001"}
+    assert db.find_existing_ids([]) == set()
+
+
+@pytest.mark.parametrize("returning", [True, False])
+def test_insert_postings_bulk(db, sample_posting, monkeypatch, returning):
+    """RETURNING 경로와 구버전 SQLite용 대체 경로가 같은 결과"""
+    import src.database as database_module
+    monkeypatch.setattr(database_module, "HAS_RETURNING", returning)
+    monkeypatch.setattr(database_module, "BULK_INSERT_CHUNK", 2)
+    db.insert_posting(sample_posting)
+    batch = [
+        dict(sample_posting, id="test_003"), sample_posting,
+        dict(sample_posting, id="test_002"), dict(sample_posting, id="test_002"),
+    ]
+    assert db.insert_postings_bulk(batch) == ["test_003", "test_002"]
+    assert db.insert_postings_bulk([]) == []
+    assert db.get_stats()["total"] == 3
+
+
+def test_in_memory_db_persists_atomically_on_close(tmp_path, sample_posting):
+    """메모리 모드는 close() 전까지 디스크 파일을 건드리지 않음"""
+    import sqlite3
+
+    path = str(tmp_path / "postings.db")
+    disk = Database(db_path=path)
+    disk.insert_posting(sample_posting)
+    disk.close()
+    assert not Path(path + "-wal").exists()
+
+    mem = Database(db_path=path, in_memory=True)
+    assert mem.get_stats()["total"] == 1
+    mem.insert_posting(dict(sample_posting, id="test_002"))
+    # 강제 종료 상황: 아직 기록 전이므로 디스크는 실행 전 상태
+    assert Database(db_path=path, in_memory=True).get_stats()["total"] == 1
+    mem.close()
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0] == 2
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    conn.close()
+    assert [p.name for p in tmp_path.iterdir()] == ["postings.db"]
+
+
+def test_read_only_db_does_not_touch_file(tmp_path, sample_posting, monkeypatch):
+    """읽기 전용 모드는 저널 모드/스키마/백필 없이 조회만 하고 DB 파일을 바꾸지 않음"""
+    import sqlite3
+    from src.config import Config
+
+    monkeypatch.setattr(Config, "SQLITE_JOURNAL_MODE", "WAL")
+    path = tmp_path / "postings.db"
+    db = Database(db_path=str(path))
+    db.insert_posting(sample_posting)
+    db.close()
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=DELETE")
+    conn.close()
+    before = path.read_bytes()
+
+    db = Database(db_path=str(path), in_memory=False, read_only=True)
+    assert db.has_fts
+    assert [p["id"] for p in db.search_postings("초기창업패키지")] == ["test_001"]
+    with pytest.raises(sqlite3.OperationalError):
+        db.mark_as_notified(["test_001"])
+    db.close()
+    assert path.read_bytes() == before
+    assert [p.name for p in tmp_path.iterdir()] == ["postings.db"]
+
+    with pytest.raises(sqlite3.OperationalError):
+        Database(db_path=str(tmp_path / "missing.db"), in_memory=False, read_only=True)
+    assert not (tmp_path / "missing.db").exists()
+
+
+def test_delta_storage_roundtrip(tmp_path, sample_posting, monkeypatch):
+    """델타 모드: 변경된 행만 델타로 기록하고, 스냅샷 + 델타로 다시 적재"""
+    from src.config import Config
+    from src.delta_store import DeltaStore
+
+    monkeypatch.setattr(Config, "DELTA_SNAPSHOT_EVERY", 3)
+    path, delta_dir = str(tmp_path / "postings.db"), str(tmp_path / "delta")
+
+    # 기존 DB 파일에서 시작하면 첫 저장이 스냅샷
+    legacy = Database(db_path=path)
+    legacy.insert_posting(sample_posting)
+    legacy.close()
+
+    def open_db():
+        return Database(db_path=path, storage="delta", delta_dir=delta_dir)
+
+    db = open_db()
+    db.record_daily_send("2026-02-10", 1)
+    db.close()
+    files = sorted(p.name.split("-")[0] for p in (tmp_path / "delta").iterdir())
+    assert files == ["snapshot"]
+
+    db = open_db()
+    assert db.get_stats()["total"] == 1
+    db.insert_posting(dict(sample_posting, id="test_002"))
+    db.mark_as_notified(["test_001"])
+    db.close()
+    snapshot, deltas = DeltaStore(delta_dir)._chain()
+    assert snapshot is not None and len(deltas) == 1
+
+    db = open_db()
+    assert db.get_stats() == {"total": 2, "notified": 1, "pending": 1, "by_source": {"bizinfo": 2}}
+    assert db.has_sent_today("2026-02-10")
+    db.close()  # 변경 없음 → 파일 추가 없음
+    assert len(list((tmp_path / "delta").iterdir())) == 2
+
+    # 델타가 DELTA_SNAPSHOT_EVERY개가 되는 시점에 스냅샷으로 압축
+    for i in range(2):
+        db = open_db()
+        db.insert_posting(dict(sample_posting, id=f"extra_{i}"))
+        db.close()
+    names = [p.name for p in (tmp_path / "delta").iterdir()]
+    assert len(names) == 1 and names[0].startswith("snapshot-")
+    db = open_db()
+    assert db.get_stats()["total"] == 4
+    # 가상 테이블(FTS)은 저장하지 않고 적재 시 트리거로 다시 색인
+    assert len(db.search_postings("초기창업패키지")) == 4
+    db.close()
+
+
+def test_search_postings(db, sample_posting):
+    """FTS 검색 + 짧은 검색어 LIKE + 출처/수집일 필터 + 트리거 동기화"""
+    db.insert_postings_bulk([
+        sample_posting,
+        dict(sample_posting, id="v1", title="2026년 해외진출 수출바우처 참여기업 모집",
+             organization="중소벤처기업진흥공단", target="수출 중소기업", source="smes24"),
+        dict(sample_posting, id="v2", title="글로벌 액셀러레이팅 프로그램",
+             summary="해외진출 희망 스타트업 대상", source="kstartup"),
+    ])
+    assert db.has_fts
+    # 제목 일치가 요약 일치보다 먼저
+    assert [p["id"] for p in db.search_postings("해외진출")] == ["v1", "v2"]
+    assert [p["id"] for p in db.search_postings("해외진출 수출")] == ["v1"]
+    assert [p["id"] for p in db.search_postings("해외진출", sources=["kstartup"])] == ["v2"]
+    assert db.search_postings("해외진출", until="2000-01-01") == []
+    assert len(db.search_postings("", since="2000-01-01", limit=2)) == 2
+
+    db.update_posting_details([dict(sample_posting, target="해외진출 예정 기업")])
+    assert {p["id"] for p in db.search_postings("해외진출")} == {"v1", "v2", "test_001"}
+
+
+def test_deadline_days_and_closing_soon(db, sample_posting):
+    """마감일 정규화(날짜/D-N/상시) + 임박/만료 범위 조회"""
+    db.insert_postings_bulk([
+        sample_posting,
+        dict(sample_posting, id="d1", end_date="D-3", source="thevc"),
+        dict(sample_posting, id="d2", end_date="상시접수"),
+        dict(sample_posting, id="d3", end_date="2026.03.20"),
+    ])
+    rows = {p["id"]: p for p in db.get_unnotified_postings()}
+    today = to_epoch_day(date.today())
+    assert rows["test_001"]["end_day"] == to_epoch_day(date(2026, 3, 15))
+    assert rows["test_001"]["start_day"] == to_epoch_day(date(2026, 2, 10))
+    assert (rows["d1"]["end_day"], rows["d1"]["end_kind"]) == (today + 3, KIND_DDAY)
+    assert (rows["d2"]["end_day"], rows["d2"]["end_kind"]) == (None, KIND_ROLLING)
+
+    march_10 = to_epoch_day(date(2026, 3, 10))
+    assert [p["id"] for p in db.get_closing_soon(10, today=march_10)] == ["test_001", "d3"]
+    assert [p["id"] for p in db.get_closing_soon(3)] == ["d1"]
+    plan = db.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM postings WHERE end_day BETWEEN 1 AND 2"
+    ).fetchall()
+    assert "idx_postings_end_day" in " ".join(row[-1] for row in plan)
+
+
+def test_deadline_days_backfilled_for_old_rows(tmp_path, sample_posting):
+    """컬럼 추가 전에 저장된 행은 열 때 collected_at 기준으로 채움"""
+    path = str(tmp_path / "old.db")
+    db = Database(db_path=path)
+    db.insert_postings_bulk([dict(sample_posting, end_date="D-5")])
+    db.conn.execute("UPDATE postings SET start_day = NULL, end_day = NULL, end_kind = NULL, "
+                    "collected_at = '2026-01-01T09:00:00'")
+    db.conn.commit()
+    db.close()
+
+    db = Database(db_path=path)
+    row = db.get_unnotified_postings()[0]
+    assert row["end_day"] == to_epoch_day(date(2026, 1, 6))
+    assert row["end_kind"] == KIND_DDAY
+    db.close()
+
+
+def test_upsert_rewrites_only_changed_rows(db, sample_posting):
+    """내용 해시가 바뀐 행만 갱신 + 이력 기록, 빈 필드는 기존 값 유지, D-N 표기 변화는 무시"""
+    dday = dict(sample_posting, id="d1", end_date="D-3", source="thevc")
+    assert db.upsert_postings_bulk([sample_posting, dday]) == (["test_001", "d1"], [])
+
+    # 같은 내용 재수집 / 목록에 요약이 빠진 재수집 → 쓰기 없음
+    unchanged = dict(sample_posting, summary="")
+    assert db.upsert_postings_bulk([unchanged, dict(dday)]) == ([], [])
+
+    # 마감 연장
+    since = datetime.now().isoformat()
+    extended = dict(sample_posting, end_date="2026-03-31")
+    assert db.upsert_postings_bulk([extended]) == ([], ["test_001"])
+    row = db.get_updated_since(since)[0]
+    assert (row["id"], row["end_date"], row["summary"]) == ("test_001", "2026-03-31", "초기 창업기업 지원")
+    assert row["end_day"] == to_epoch_day(date(2026, 3, 31))
+    history = db.get_posting_changes("test_001")
+    assert [h["previous"] for h in history] == [{"end_date": "2026-03-15"}]
+    assert db.get_updated_since("2999-01-01") == []
+
+    # 상세 보강 후에도 해시가 맞춰져 있어 재수집이 변경으로 잡히지 않음
+    db.update_posting_details([dict(extended, target="해외진출 예정 기업")])
+    assert db.upsert_postings_bulk([dict(extended, target="")]) == ([], [])
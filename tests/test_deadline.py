@@ -0,0 +1,52 @@
+"""Deadline 모듈 테스트"""
+import math
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src import deadline as deadline_module
+from src.collectors.base import BaseCollector
+from src.deadline import DeadlineExceeded, RunDeadline, start_run_deadline
+
+
+class _Collector(BaseCollector):
+    SOURCE_NAME = "dummy"
+
+    def iter_postings(self):
+        return iter([])
+
+
+@pytest.fixture
+def restore_deadline():
+    original = deadline_module._deadline
+    yield
+    deadline_module._deadline = original
+
+
+def test_unlimited_by_default():
+    deadline = RunDeadline()
+    assert deadline.remaining() == math.inf
+    assert deadline.request_timeout(30) == 30
+    assert deadline.can_retry(4)
+
+
+def test_request_timeout_shrinks_with_budget():
+    """수집 예산 = 전체 - 알림 예약분, 타임아웃은 남은 수집 예산 이내"""
+    deadline = RunDeadline(seconds=70, reserve=60)
+    assert 9 < deadline.request_timeout(30) <= 10
+    assert deadline.can_retry(1)
+    assert not deadline.can_retry(8)
+    assert deadline.remaining() > 60
+
+
+def test_request_raises_without_budget(restore_deadline):
+    """수집 예산이 없으면 요청을 보내지 않고 실패로 기록하지 않음"""
+    start_run_deadline(seconds=30, reserve=30)
+    collector = _Collector()
+    collector.session = SimpleNamespace(get=lambda *a, **kw: pytest.fail("요청하면 안 됨"))
+    with pytest.raises(DeadlineExceeded):
+        collector._request("https://example.com")
+    assert collector.request_failed == 0
@@ -0,0 +1,90 @@
+"""소스 간 중복 공고 묶기 테스트"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.database import Database
+from src.dedup import cluster_postings, normalize_title, signature_for, similarity
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(db_path=str(tmp_path / "postings.db"))
+    yield database
+    database.close()
+
+
+def _posting(pid, source, title, **extra):
+    return dict({"id": pid, "title": title, "source": source, "url": f"https://{source}/{pid}"}, **extra)
+
+
+def _deliver(db, pid, excluded_stage=None):
+    """공고를 필터 판정과 함께 알림 처리된 상태로 기록"""
+    db.save_filter_verdicts([{
+        "posting_id": pid, "content_hash": "", "keyword_version": "", "region_version": "",
+        "matched_keywords": [], "excluded_stage": excluded_stage, "excluded_reason": None,
+    }])
+    db.mark_as_notified([pid])
+
+
+def test_normalize_and_similarity():
+    assert normalize_title("[공고] 2026년 예비창업패키지 (재공고)") == "2026년예비창업패키지"
+    a = signature_for({"title": "2026년 예비창업패키지 예비창업자 모집 공고"})
+    b = signature_for({"title": "[창업진흥원] 2026년 예비창업패키지 예비창업자 모집"})
+    c = signature_for({"title": "2026년 수출바우처 참여기업 모집"})
+    assert similarity(a, b) > 0.8
+    assert similarity(a, c) < 0.3
+
+
+def test_cluster_cross_source_duplicates(db):
+    postings = [
+        _posting("k1", "kstartup", "2026년 예비창업패키지 예비창업자 모집 공고",
+                 end_date="2026-03-20", target="예비창업자"),
+        _posting("b1", "bizinfo", "[창업진흥원] 2026년 예비창업패키지 예비창업자 모집",
+                 end_date="2026-03-20", summary="사업화 자금 지원"),
+        _posting("t1", "thevc", "2026년 예비창업패키지 예비창업자 모집", end_date="D-10"),
+        # 같은 출처의 비슷한 제목은 별개 공고
+        _posting("k2", "kstartup", "2026년 예비창업패키지 예비창업자 2차 모집 공고",
+                 end_date="2026-05-20"),
+        _posting("s1", "smes24", "2026년 수출바우처 참여기업 모집"),
+    ]
+    db.insert_postings_bulk(postings)
+
+    reps = cluster_postings(db, postings)
+    assert [p["id"] for p in reps] == ["k1", "k2", "s1"]
+    assert {d["source"] for d in reps[0]["_duplicates"]} == {"bizinfo", "thevc"}
+    assert reps[0]["summary"] == "사업화 자금 지원"
+
+    clusters = {row["id"]: row["cluster_id"] for row in db.conn.execute("SELECT id, cluster_id FROM postings")}
+    assert clusters["b1"] == clusters["t1"] == "k1"
+    assert clusters["s1"] is None
+
+    # 다음 실행: 이미 알림이 나간 묶음과 같은 공고가 다른 출처에서 새로 올라오면 알림 제외
+    _deliver(db, "k1")
+    later = [_posting("m1", "mss", "2026년 예비창업패키지 예비창업자 모집 안내", end_date="2026-03-20")]
+    db.insert_postings_bulk(later)
+    assert cluster_postings(db, later) == []
+    assert db.conn.execute("SELECT cluster_id FROM postings WHERE id = 'm1'").fetchone()[0] == "k1"
+
+
+def test_undelivered_existing_posting_does_not_suppress_duplicate(db):
+    """필터에서 탈락해 발송되지 않은 기존 공고와 묶여도 신규 공고가 대표로 알림 대상"""
+    old = _posting("b1", "bizinfo", "[창업진흥원] 2026년 예비창업패키지 예비창업자 모집")
+    db.insert_postings_bulk([old])
+    cluster_postings(db, [old])
+    _deliver(db, "b1", excluded_stage="keyword")
+
+    new = [_posting("k1", "kstartup", "2026년 예비창업패키지 예비창업자 모집 공고",
+                    target="예비창업자", summary="사업화 자금 지원")]
+    db.insert_postings_bulk(new)
+    assert [p["id"] for p in cluster_postings(db, new)] == ["k1"]
+    clusters = dict(db.conn.execute("SELECT id, cluster_id FROM postings").fetchall())
+    assert clusters == {"b1": "k1", "k1": "k1"}
+
+    # 새 대표가 발송된 뒤 같은 공고가 또 올라오면 알림 제외
+    _deliver(db, "k1")
+    later = [_posting("m1", "mss", "2026년 예비창업패키지 예비창업자 모집 안내")]
+    db.insert_postings_bulk(later)
+    assert cluster_postings(db, later) == []
@@ -0,0 +1,76 @@
+"""Enrichment 모듈 테스트"""
+import os
+import tempfile
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from bs4 import BeautifulSoup
+
+from src.collectors.base import BaseCollector
+from src.database import Database
+from src.enrichment import enrich_postings
+
+DETAIL_HTML = """
+<html><body>
+<table><tr><th>지원 대상</th><td>서울 소재 창업 7년 이내 기업</td></tr></table>
+<div class="view_cont"><p>해외진출   바우처 지원사업 안내</p></div>
+</body></html>
+"""
+
+
+class _DetailCollector(BaseCollector):
+    SOURCE_NAME = "detail"
+    ENRICH_DETAILS = True
+
+    def __init__(self):
+        super().__init__()
+        self.fetched = []
+
+    def iter_postings(self):
+        return iter([])
+
+    def fetch_detail(self, url):
+        self.fetched.append(url)
+        return self._parse_detail(BeautifulSoup(DETAIL_HTML, "html.parser"))
+
+
+@pytest.fixture
+def db():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    database = Database(db_path=path)
+    yield database
+    database.close()
+    os.unlink(path)
+
+
+def test_parse_detail_generic():
+    collector = _DetailCollector()
+    detail = collector._parse_detail(BeautifulSoup(DETAIL_HTML, "html.parser"))
+    assert detail["target"] == "서울 소재 창업 7년 이내 기업"
+    assert detail["summary"] == "해외진출 바우처 지원사업 안내"
+
+
+def test_enrich_postings_fills_and_caches_by_url(db):
+    """빈 필드만 보강하고, 같은 URL 상세 페이지는 다시 받지 않음"""
+    collector = _DetailCollector()
+    postings = [
+        {"id": "a", "title": "공고 A", "url": "https://x.kr/1", "source": "detail", "target": "", "summary": ""},
+        {"id": "b", "title": "공고 B", "url": "https://x.kr/1", "source": "detail", "target": "", "summary": ""},
+        {"id": "c", "title": "공고 C", "url": "https://x.kr/2", "source": "other", "target": "", "summary": ""},
+    ]
+    for p in postings:
+        db.insert_posting(p)
+
+    assert enrich_postings(db, postings, [collector]) == 2
+    assert collector.fetched == ["https://x.kr/1"]
+    assert postings[0]["target"] == "서울 소재 창업 7년 이내 기업"
+    assert postings[2]["target"] == ""
+    stored = {row["id"]: row for row in db.get_unnotified_postings()}
+    assert stored["b"]["summary"] == "해외진출 바우처 지원사업 안내"
+
+    again = [{"id": "d", "title": "공고 D", "url": "https://x.kr/1", "source": "detail"}]
+    assert enrich_postings(db, again, [collector]) == 1
+    assert collector.fetched == ["https://x.kr/1"]
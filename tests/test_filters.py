@@ -0,0 +1,128 @@
+"""필터 판정 저장/증분 재계산 테스트"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src import filters
+from src.database import Database
+from src.filters import filter_relevant_postings, refresh_filter_verdicts
+
+
+@pytest.fixture
+def db():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    database = Database(db_path=path)
+    yield database
+    database.close()
+    os.unlink(path)
+
+
+def _posting(pid: str, title: str, target: str = "", end_date: str = "2999-12-31") -> dict:
+    return {"id": pid, "title": title, "organization": "", "category": "", "start_date": "",
+            "end_date": end_date, "target": target, "url": f"https://example.com/{pid}",
+            "summary": "", "source": "bizinfo"}
+
+
+@pytest.fixture
+def postings():
+    return [
+        _posting("p1", "2026년 초기창업패키지 참여기업 모집", "예비창업자"),
+        _posting("p2", "부산 소재 창업기업 지원", "부산 소재 기업"),
+        _posting("p3", "공공기관 청사 관리 용역"),
+        _posting("p4", "해외진출 바우처", end_date="2000-01-01"),
+    ]
+
+
+@pytest.fixture
+def evaluations(monkeypatch):
+    calls = []
+    evaluate = filters.evaluate_posting
+
+    def counting(posting, versions=None):
+        calls.append(posting["id"])
+        return evaluate(posting, versions)
+
+    monkeypatch.setattr(filters, "evaluate_posting", counting)
+    return calls
+
+
+def test_verdicts_are_stored_and_reused(db, postings, evaluations):
+    db.insert_postings_bulk(postings)
+    assert [p["id"] for p in filter_relevant_postings(postings, db)] == ["p1"]
+    # 만료 공고는 날짜 단계에서 빠지므로 판정하지 않음
+    assert evaluations == ["p1", "p2", "p3"]
+    stored = db.get_filter_verdicts(["p1", "p2", "p3"])
+    assert stored["p1"]["matched_keywords"] == postings[0]["_matched_keywords"]
+    assert "초기창업" in stored["p1"]["matched_keywords"]
+    assert (stored["p2"]["excluded_stage"], stored["p2"]["excluded_reason"]) == ("region", "부산")
+    assert stored["p3"]["excluded_stage"] == "keyword"
+
+    evaluations.clear()
+    assert [p["id"] for p in filter_relevant_postings(postings, db)] == ["p1"]
+    assert evaluations == []
+
+    # 내용이 바뀐 공고만 다시 판정
+    db.update_posting_details([dict(postings[2], summary="창업기업 입주 지원")])
+    postings[2]["summary"] = "창업기업 입주 지원"
+    assert [p["id"] for p in filter_relevant_postings(postings, db)] == ["p1", "p3"]
+    assert evaluations == ["p3"]
+
+
+def test_refresh_recomputes_only_stale_rows(db, postings, evaluations, monkeypatch):
+    db.insert_postings_bulk(postings)
+    assert refresh_filter_verdicts(db) == (4, [])
+
+    evaluations.clear()
+    assert refresh_filter_verdicts(db) == (0, [])
+
+    # 지역 규칙만 변경 → 키워드 단계에서 탈락한 공고(p3)는 다시 계산하지 않음
+    monkeypatch.setattr(filters, "NATIONWIDE_KEYWORDS", filters.NATIONWIDE_KEYWORDS + ["부산"])
+    recomputed, flipped = refresh_filter_verdicts(db)
+    assert sorted(evaluations) == ["p1", "p2", "p4"]
+    assert recomputed == 3
+    assert [(f["id"], f["before"], f["after"]) for f in flipped] == [("p2", "region", "pass")]
+
+    # 키워드 규칙 변경 → 전체 재계산
+    evaluations.clear()
+    monkeypatch.setattr(filters, "ALL_KEYWORDS", filters.ALL_KEYWORDS + ["용역"])
+    recomputed, flipped = refresh_filter_verdicts(db, chunk_size=2)
+    assert recomputed == 4
+    assert [(f["id"], f["before"], f["after"]) for f in flipped] == [("p3", "keyword", "pass")]
+
+
+def test_verdicts_cli_writes_only_when_recomputed(tmp_path, postings, monkeypatch):
+    """판정 갱신 CLI는 다시 계산한 판정이 없으면 (메모리 모드에서도) DB 파일을 다시 쓰지 않음"""
+    from src.config import Config
+    from src.verdicts import main
+
+    path = tmp_path / "postings.db"
+    database = Database(db_path=str(path))
+    database.insert_postings_bulk(postings)
+    database.close()
+    monkeypatch.setattr(Config, "DB_IN_MEMORY", True)
+
+    main(["--db", str(path)])
+    database = Database(db_path=str(path), read_only=True)
+    assert len(database.get_filter_verdicts([p["id"] for p in postings])) == 4
+    database.close()
+
+    before = path.read_bytes()
+    main(["--db", str(path)])
+    assert path.read_bytes() == before
+
+    # 파일 모드에서도 최신 판정뿐이면 쓰기 모드로 열지 않고 끝남
+    import src.verdicts
+    monkeypatch.setattr(Config, "DB_IN_MEMORY", False)
+    monkeypatch.setattr(src.verdicts, "Database", _read_only_database)
+    main(["--db", str(path)])
+    assert path.read_bytes() == before
+
+
+def _read_only_database(*args, read_only: bool = False, **kwargs):
+    assert read_only, "갱신할 판정이 없으면 쓰기 모드로 열지 않아야 함"
+    return Database(*args, read_only=read_only, **kwargs)
@@ -0,0 +1,65 @@
+"""Health(서킷 브레이커) 모듈 테스트"""
+import os
+import tempfile
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.collectors.base import BaseCollector
+from src.database import Database
+from src.health import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class _Collector(BaseCollector):
+    SOURCE_NAME = "mss"
+
+    def iter_postings(self):
+        return iter([])
+
+
+@pytest.fixture
+def db():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    database = Database(db_path=path)
+    yield database
+    database.close()
+    os.unlink(path)
+
+
+def test_circuit_opens_then_probes_then_closes(db):
+    breaker = CircuitBreaker(db, threshold=2, cooldown_hours=24)
+    assert breaker.check("mss")[0] == CLOSED
+
+    db.record_source_result("mss", ok=False, error="timeout")
+    assert breaker.check("mss")[0] == CLOSED
+    db.record_source_result("mss", ok=False, error="timeout")
+    state, reason = breaker.check("mss")
+    assert state == OPEN
+    assert "연속 2회 실패" in reason
+
+    later = datetime.now() + timedelta(hours=25)
+    assert breaker.check("mss", now=later)[0] == HALF_OPEN
+
+    db.record_source_result("mss", ok=True)
+    assert breaker.check("mss")[0] == CLOSED
+    assert db.get_source_health("mss")["last_success_at"]
+
+
+def test_admit_skips_open_and_records_results(db):
+    for _ in range(3):
+        db.record_source_result("mss", ok=False, error="503 Server Error")
+    breaker = CircuitBreaker(db, threshold=3, cooldown_hours=24)
+    assert breaker.admit([_Collector()]) == []
+    assert "503 Server Error" in breaker.skipped["mss"]
+
+    probe = _Collector()
+    breaker = CircuitBreaker(db, threshold=3, cooldown_hours=0)
+    assert breaker.admit([probe]) == [probe]
+    assert probe.probe is True
+    probe.request_ok = 1
+    breaker.record([probe])
+    assert db.get_source_health("mss")["consecutive_failures"] == 0
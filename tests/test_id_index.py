@@ -0,0 +1,32 @@
+"""IdIndex 테스트"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import Database
+from src.id_index import IdIndex
+
+
+def test_index_membership():
+    ids = [Database.generate_id(f"공고 {i}", f"https://example.com/{i}") for i in range(1000)]
+    index = IdIndex(ids[:500])
+    assert len(index) == 500
+    assert all(i in index for i in ids[:500])
+    assert not any(i in index for i in ids[500:])
+
+    index.update(ids[500:600])
+    index.add("kstartup_1")
+    assert "kstartup_1" in index
+    assert index.known(ids[550:700]) == set(ids[550:600])
+    assert index.memory_bytes() < 500 * 8 + 101 * 64
+
+
+def test_db_index_tracks_inserts(tmp_path):
+    db = Database(db_path=str(tmp_path / "postings.db"))
+    db.insert_postings_bulk([{"id": "a", "title": "기존 공고"}])
+    index = db.load_id_index()
+    assert index.known(["a", "b"]) == {"a"}
+
+    db.insert_postings_bulk([{"id": "b", "title": "신규 공고"}])
+    assert index.known(["a", "b", "c"]) == {"a", "b"}
+    db.close()
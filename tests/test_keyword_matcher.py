@@ -0,0 +1,46 @@
+"""KeywordMatcher 테스트"""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.filters import ALL_KEYWORDS
+from src.keyword_matcher import KeywordMatcher, ahocorasick
+
+ENGINES = ["automaton", "scan"] + (["native"] if ahocorasick is not None else [])
+
+
+@pytest.fixture(params=ENGINES)
+def matcher(request):
+    return KeywordMatcher(ALL_KEYWORDS, engine=request.param)
+
+
+def test_overlapping_matches_with_positions(matcher):
+    text = "2026년 초기창업패키지 해외진출 Startup"
+    found = matcher.find_all(text)
+    lowered = text.lower()
+    for start, kw in found:
+        assert lowered[start:start + len(kw)] == kw.lower()
+    keywords = {kw for _, kw in found}
+    # "창업" ⊂ "초기창업" ⊂ "창업패키지" 처럼 겹치는 키워드와 대소문자 무시 매칭
+    assert {"창업", "초기창업", "창업패키지", "해외", "해외진출", "startup"} <= keywords
+    assert "K-Startup" not in keywords
+    assert found == KeywordMatcher(ALL_KEYWORDS, engine="scan").find_all(text)
+
+
+def test_matches_legacy_substring_scan(matcher):
+    """기존 [kw for kw in ALL_KEYWORDS if kw.lower() in text]와 같은 결과 (순서 포함)"""
+    vocab = ALL_KEYWORDS + ["지원", "공고", "모집", "서울", "k-", "start", "해외 진출", "  "]
+    rng = random.Random(7)
+    for _ in range(500):
+        text = " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 30)))
+        text = "".join(ch.upper() if rng.random() < 0.2 else ch for ch in text)
+        expected = [kw for kw in ALL_KEYWORDS if kw.lower() in text.lower()]
+        assert matcher.matched(text) == expected
+
+
+def test_empty_inputs():
+    assert KeywordMatcher([]).matched("창업") == []
+    assert KeywordMatcher(["창업"]).matched("") == []
@@ -0,0 +1,113 @@
+"""Pipeline 모듈 테스트"""
+import os
+import sys
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.collectors.base import BaseCollector
+from src.config import Config
+from src.database import Database
+from src.pipeline import PostingSink, run_collectors_async, stream_postings
+
+
+class _SleepCollector(BaseCollector):
+    SOURCE_NAME = "sleep"
+
+    def __init__(self, name: str, seconds: float):
+        super().__init__()
+        self.name = name
+        self.seconds = seconds
+
+    def iter_postings(self):
+        time.sleep(self.seconds)
+        yield {"id": self.name, "title": self.name}
+
+
+class _FailingCollector(BaseCollector):
+    SOURCE_NAME = "failing"
+
+    def iter_postings(self):
+        yield {"id": "before-failure", "title": "실패 전 공고"}
+        raise RuntimeError("boom")
+
+
+class _NativeAsyncCollector(BaseCollector):
+    SOURCE_NAME = "native"
+
+    def iter_postings(self):
+        raise AssertionError("비동기 엔진에서는 iter_postings_async가 호출되어야 함")
+
+    async def iter_postings_async(self):
+        assert self.http_client is not None
+        await asyncio.sleep(0.2)
+        yield {"id": "native", "title": "native"}
+
+
+@pytest.fixture
+def db():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    database = Database(db_path=path)
+    yield database
+    database.close()
+    os.unlink(path)
+
+
+def test_stream_postings_parallel():
+    """병렬 실행 시 소요 시간은 가장 느린 소스 기준, 빠른 소스는 먼저 전달"""
+    collectors = [_SleepCollector("slow", 0.3)] + [_SleepCollector(f"c{i}", 0.1) for i in range(3)]
+    started = time.monotonic()
+    ids = [p["id"] for p in stream_postings(collectors, max_workers=4)]
+    elapsed = time.monotonic() - started
+    assert sorted(ids) == ["c0", "c1", "c2", "slow"]
+    assert ids[-1] == "slow"
+    assert elapsed < 0.6
+
+
+def test_stream_postings_isolates_failure():
+    """한 수집기의 실패가 다른 수집기 결과에 영향을 주지 않고, 실패 전 공고는 유지"""
+    for workers in (1, 2):
+        collectors = [_SleepCollector("ok", 0), _FailingCollector()]
+        ids = sorted(p["id"] for p in stream_postings(collectors, max_workers=workers))
+        assert ids == ["before-failure", "ok"]
+
+
+def test_run_collectors_async_mixes_sync_and_native():
+    """비동기 엔진: 동기 수집기는 어댑터로, 네이티브 수집기는 이벤트 루프에서 실행"""
+    collectors = [_SleepCollector("sync", 0.2), _NativeAsyncCollector(), _FailingCollector()]
+    started = time.monotonic()
+    results = asyncio.run(run_collectors_async(collectors, max_workers=3))
+    elapsed = time.monotonic() - started
+    assert [[p["id"] for p in r] for r in results] == [["sync"], ["native"], ["before-failure"]]
+    assert elapsed < 0.4
+
+
+def test_stream_postings_async_engine_streams(monkeypatch):
+    """비동기 엔진도 공고를 나오는 대로 전달 (느린 수집기를 기다리지 않음, 실패 전 공고 유지)"""
+    monkeypatch.setattr(Config, "COLLECT_ENGINE", "async")
+    collectors = [_SleepCollector("slow", 0.4), _NativeAsyncCollector(), _FailingCollector()]
+    started = time.monotonic()
+    arrivals = {}
+    for posting in stream_postings(collectors, max_workers=3):
+        arrivals[posting["id"]] = time.monotonic() - started
+    assert sorted(arrivals) == ["before-failure", "native", "slow"]
+    assert arrivals["native"] < 0.35 and arrivals["before-failure"] < 0.35
+    assert arrivals["slow"] >= 0.4
+
+
+def test_posting_sink_dedups_and_batches(db):
+    """실행 내 중복 제거 + 배치 저장, 기존 DB 공고는 신규로 반환하지 않음"""
+    db.insert_posting({"id": "old", "title": "기존 공고"})
+    sink = PostingSink(db, batch_size=2)
+    new = []
+    for pid in ["a", "a", "old", "b"]:
+        new.extend(sink.add({"id": pid, "title": f"공고 {pid}"}))
+    assert [p["id"] for p in new] == ["a"]
+    new.extend(sink.flush())
+    assert [p["id"] for p in new] == ["a", "b"]
+    assert (sink.received, sink.inserted) == (4, 2)
@@ -0,0 +1,91 @@
+"""팀별 필터 프로필 분배 테스트"""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.filters import ALL_KEYWORDS, REGIONAL_AREAS, evaluate_posting
+from src.profiles import (
+    ProfileRouter, default_profile, parse_profiles, restricted_areas_for, route_postings,
+)
+
+PROFILES = {"profiles": [
+    {"name": "hq", "channel": "series_a"},
+    {"name": "global", "channel": "global-biz", "keywords": ["해외진출", "수출", "일본"]},
+    {"name": "busan", "channel": "busan-lab", "keywords": ["R&D", "실증"],
+     "allowed_regions": ["부산"]},
+    {"name": "funding", "channel": "series_a", "keywords": {"add": ["데모데이"]},
+     "allowed_regions": ["*"]},
+]}
+
+
+def _posting(pid: str, title: str, target: str = "", end_date: str = "2999-12-31") -> dict:
+    return {"id": pid, "title": title, "organization": "", "category": "", "start_date": "",
+            "end_date": end_date, "target": target, "url": f"https://example.com/{pid}",
+            "summary": "", "source": "bizinfo"}
+
+
+def test_parse_profiles_applies_defaults_and_edits():
+    profiles = parse_profiles(PROFILES)
+    hq, global_, busan, funding = profiles
+    assert hq["keywords"] == default_profile()["keywords"]
+    assert global_["keywords"] == ("해외진출", "수출", "일본")
+    assert global_["allowed_regions"] == ("서울", "수도권")
+    assert funding["keywords"][-1] == "데모데이"
+    assert busan["channel"] == "busan-lab"
+    with pytest.raises(ValueError):
+        parse_profiles({"profiles": [{"name": "a"}, {"name": "a"}]})
+    with pytest.raises(ValueError):
+        parse_profiles({"profiles": [{"name": "a", "channels": "x"}]})
+    with pytest.raises(ValueError):
+        parse_profiles({"profiles": []})
+
+
+def test_default_allowed_regions_keep_filter_areas():
+    assert restricted_areas_for(("서울", "수도권")) == tuple(REGIONAL_AREAS)
+    busan = restricted_areas_for(("부산",))
+    assert "부산광역시" not in busan and "서울" in busan and "경남" in busan
+
+
+def test_default_profile_matches_filter_stages():
+    """기본 프로필 1개로 분배한 결과가 filters의 키워드/지역 단계 판정과 같음"""
+    router = ProfileRouter([default_profile()])
+    rng = random.Random(11)
+    words = ALL_KEYWORDS[::3] + REGIONAL_AREAS[::4] + [
+        "소재 기업", "전국", "서울", "한정", "[", "]", "지원", "모집", " ", " ",
+    ]
+    for i in range(1000):
+        posting = _posting(
+            f"p{i}",
+            "".join(rng.choice(words) for _ in range(rng.randint(0, 6))),
+            "".join(rng.choice(words) for _ in range(rng.randint(0, 6))),
+        )
+        verdict = evaluate_posting(posting)
+        routed = router.route(posting)
+        if verdict["excluded_stage"] is None:
+            assert routed == {"default": verdict["matched_keywords"]}, posting
+        else:
+            assert routed == {}, posting
+
+
+def test_route_postings_sends_each_posting_once_per_channel():
+    router = ProfileRouter(parse_profiles(PROFILES))
+    postings = [
+        _posting("p1", "2026년 초기창업패키지 해외진출 지원", "예비창업자"),
+        _posting("p2", "부산 소재 기업 R&D 실증 지원", "부산 소재 중소기업"),
+        _posting("p3", "경기 소재 스타트업 데모데이", "경기 소재 창업기업"),
+        _posting("p4", "일본 수출 상담회", end_date="2000-01-01"),
+        _posting("p5", "공공기관 청사 관리 용역"),
+    ]
+    routed = route_postings(postings, router)
+
+    assert {ch: [p["id"] for p in posts] for ch, posts in routed.items()} == {
+        "series_a": ["p1", "p2", "p3"],
+        "global-biz": ["p1"],
+        "busan-lab": ["p2"],
+    }
+    assert postings[0]["_profiles"] == ["hq", "global", "funding"]
+    assert postings[1]["_profiles"] == ["busan", "funding"]
+    assert postings[2]["_profiles"] == ["funding"]
@@ -0,0 +1,39 @@
+"""RateLimit 모듈 테스트"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ratelimit import HostRateLimiter, TokenBucket, parse_host_limits
+
+
+def test_token_bucket_burst_then_wait():
+    """버스트만큼은 즉시 통과, 이후 요청은 1/rate 간격으로 대기"""
+    bucket = TokenBucket(rate=2.0, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert 0.4 < bucket.reserve() <= 0.5
+    assert 0.9 < bucket.reserve() <= 1.0
+
+
+def test_token_bucket_unlimited():
+    bucket = TokenBucket(rate=0, burst=1)
+    assert all(bucket.reserve() == 0.0 for _ in range(10))
+
+
+def test_host_limiter_separates_hosts():
+    """같은 호스트는 버킷 공유, 다른 호스트는 독립"""
+    limiter = HostRateLimiter(1.0, 1, {"apis.data.go.kr": (5.0, 3)})
+    a = limiter.bucket("https://apis.data.go.kr/B552735/smes24AnncInfoService/getAnncList")
+    b = limiter.bucket("https://apis.data.go.kr/B552735/kisedKstartupService01/x")
+    c = limiter.bucket("https://www.mss.go.kr/site/smba/ex/bbs/List.do")
+    assert a is b
+    assert a is not c
+    assert (a.rate, a.burst) == (5.0, 3)
+    assert (c.rate, c.burst) == (1.0, 1)
+
+
+def test_parse_host_limits():
+    limits = parse_host_limits("apis.data.go.kr=2:4, www.mss.go.kr=0.5,invalid")
+    assert limits["apis.data.go.kr"] == (2.0, 4)
+    assert limits["www.mss.go.kr"][0] == 0.5
+    assert "invalid" not in limits
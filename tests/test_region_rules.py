@@ -0,0 +1,130 @@
+"""RegionRuleEngine 테스트 - 기존 _is_region_restricted 구현과 판정 비교"""
+import random
+import re
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.filters import (
+    METRO_AREA,
+    NATIONWIDE_KEYWORDS,
+    REGIONAL_AREAS,
+    REGIONAL_RESTRICTION_PATTERNS,
+    _is_region_restricted,
+)
+from src.region_rules import RegionRuleEngine, RegionRuleGroups
+
+
+def legacy_is_region_restricted(posting: dict) -> bool:
+    """규칙 엔진 도입 전 src/filters.py의 _is_region_restricted (판정 기준)"""
+    searchable = " ".join([
+        posting.get("title", ""),
+        posting.get("target", ""),
+        posting.get("summary", ""),
+        posting.get("organization", ""),
+    ])
+
+    if not searchable.strip():
+        return False
+
+    for kw in NATIONWIDE_KEYWORDS:
+        if kw in searchable:
+            return False
+
+    for area in METRO_AREA:
+        if area in searchable:
+            return False
+
+    for area in REGIONAL_AREAS:
+        if area not in searchable:
+            continue
+
+        for pattern in REGIONAL_RESTRICTION_PATTERNS:
+            full_pattern = f"{area}.*{pattern}|{pattern}.*{area}"
+            if re.search(full_pattern, searchable):
+                return True
+
+        title = posting.get("title", "")
+        target = posting.get("target", "")
+        if (
+            re.search(rf"\[{area}\]|\({area}\)|{area}지역|{area}도|{area}시", title)
+            and area in target
+            and not any(m in target for m in METRO_AREA)
+            and not any(n in target for n in NATIONWIDE_KEYWORDS)
+        ):
+            return True
+
+    return False
+
+
+# 규칙을 이루는 조각들을 섞어 경계 사례(겹치는 지역명, 줄바꿈, 괄호, 문장 끝)를 만든다
+_FRAGMENTS = REGIONAL_AREAS + [
+    "소재", "기업", "업체", "중소", "스타트업", "창업", "에", "에만", "만", "내", "도내", "시내", "권내",
+    "등록", "본사", "사업장", "한정", "제한", "대상", "위치한", "지역", "관내", "도", "시", "군", "구",
+    "입주", "지원", "모집", "공고", "[", "]", "(", ")", " ", " ", " ", "\n", "  ", "전국", "서울",
+    "광역시", "강원특별자치도", "2026년", "사업", "안내", "참여",
+]
+
+
+def _random_text(rng: random.Random, max_parts: int) -> str:
+    return "".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(0, max_parts)))
+
+
+def test_matches_legacy_function_on_random_postings():
+    rng = random.Random(2026)
+    restricted = 0
+    for _ in range(2000):
+        posting = {
+            "title": _random_text(rng, 8),
+            "target": _random_text(rng, 6),
+            "summary": _random_text(rng, 12),
+            "organization": _random_text(rng, 3),
+        }
+        # 전국/서울 키워드가 너무 자주 섞이면 대부분 바로 통과하므로 절반은 제거
+        if rng.random() < 0.5:
+            for kw in NATIONWIDE_KEYWORDS + METRO_AREA:
+                posting = {k: v.replace(kw, "") for k, v in posting.items()}
+        expected = legacy_is_region_restricted(posting)
+        assert _is_region_restricted(posting) == expected, posting
+        restricted += expected
+    # 양쪽 판정이 모두 충분히 나오는 표본인지
+    assert 200 < restricted < 1800
+
+
+def test_matches_legacy_function_on_examples():
+    examples = [
+        {"title": "2026년 부산 소재 기업 수출 지원", "target": "부산 소재 중소기업"},
+        {"title": "[경기] 창업기업 모집", "target": "경기도 기업"},
+        {"title": "(인천광역시) 스타트업 지원", "target": "인천광역시"},
+        {"title": "대구시 창업 지원", "target": "예비창업자", "organization": "대구광역시"},
+        {"title": "해외진출 지원", "target": "전국 중소기업", "summary": "부산 소재 기업 한정"},
+        {"title": "창업 지원", "target": "기업 대상", "summary": "주관: 충북"},
+        {"title": "창업 지원", "summary": "기업 대상\n충북"},
+        {"title": "글로벌 진출", "target": "제주\n소재 기업"},
+        {"title": "", "target": "", "summary": "", "organization": ""},
+    ]
+    for posting in examples:
+        assert _is_region_restricted(posting) == legacy_is_region_restricted(posting), posting
+
+
+def test_rule_groups_match_separate_engines():
+    """허용 지역만 다른 구성을 함께 판정해도 구성별 RegionRuleEngine과 결과가 같음"""
+    areas = REGIONAL_AREAS + METRO_AREA
+    groups = []
+    for allowed in (METRO_AREA, ["부산", "경남"], ["경기", "인천"], []):
+        restricted = [a for a in areas if not any(r in a or a in r for r in allowed)]
+        groups.append((restricted, allowed + NATIONWIDE_KEYWORDS))
+    shared = RegionRuleGroups(groups, REGIONAL_RESTRICTION_PATTERNS)
+    engines = [RegionRuleEngine(a, REGIONAL_RESTRICTION_PATTERNS, e, ()) for a, e in groups]
+
+    rng = random.Random(7)
+    for _ in range(1000):
+        posting = {
+            "title": _random_text(rng, 8),
+            "target": _random_text(rng, 6),
+            "summary": _random_text(rng, 12),
+            "organization": _random_text(rng, 3),
+        }
+        expected = {g: engine.restricted_area(posting) for g, engine in enumerate(engines)}
+        assert shared.restricted_areas(posting) == expected, posting
+        assert shared.restricted_areas(posting, [1, 3]) == {1: expected[1], 3: expected[3]}